@@ -0,0 +1,618 @@
+import numpy as np
+import pandas as pd
+
+
+# ----------------------------------
+# RESULTS TABLE (RACE + SPRINT, LONG FORMAT)
+# ----------------------------------
+# Every session result of a season in one frame, built once per snapshot:
+# indexed by (Round, Session, Driver) and sorted that way, sprints before
+# the race of the same weekend. Round is the calendar round: tracks are
+# categorised in calendar order, joined on the track name, and
+# store.build_season rejects results that skip a round. The *ID columns
+# are the integer codes of the dimension tables. Race + sprint aggregates
+# below are a single groupby or bincount over it.
+SESSIONS = pd.CategoricalDtype(["Sprint", "Race"], ordered=True)
+RESULT_COLUMNS = ["Track", "No", "Team", "Position", "Status", "Starting Grid", "Laps", "Points", "Set Fastest Lap"]
+
+
+def build_results(race, sprint):
+    # an empty sprint frame read back from the Arrow cache has lost its
+    # categories, so both sessions take the race frame's before the concat
+    categorical = {column: race[column].dtype for column in ("Track", "Driver", "Team")}
+
+    frames = []
+    for session, frame in (("Sprint", sprint), ("Race", race)):
+        part = frame[[column for column in RESULT_COLUMNS if column in frame] + ["Driver"]]
+        frames.append(part.astype(categorical).assign(Session=session))
+
+    results = pd.concat(frames, ignore_index=True)
+    results["Set Fastest Lap"] = results["Set Fastest Lap"].fillna(False).astype(bool)
+    results["Session"] = results["Session"].astype(SESSIONS)
+    results["Round"] = (results["Track"].cat.codes + 1).astype("int16")
+    results["Track ID"] = results["Track"].cat.codes.astype("int16")
+    results["Driver ID"] = results["Driver"].cat.codes.astype("int16")
+    results["Team ID"] = results["Team"].cat.codes.astype("int16")
+
+    order = np.lexsort((results["Driver ID"], results["Session"].cat.codes, results["Round"]))
+    return results.take(order).set_index(["Round", "Session", "Driver"])
+
+
+def _bincount(codes, size, weights):
+    return np.bincount(codes, weights=weights, minlength=size)[:size]
+
+
+# ----------------------------------
+# COUNTS TABLE (ONE PASS OVER RESULTS)
+# ----------------------------------
+COUNT_COLUMNS = ["Wins", "Podiums", "Top 10s", "Fastest Laps", "DNFs"]
+POINT_COLUMNS = ["Race Points", "Sprint Points", "Total Points"]
+
+
+def _key(results, key):
+    # Categorical of a key, whether it sits in the index or the columns
+    values = results.index.get_level_values(key) if key in results.index.names else results[key]
+    return values.array
+
+
+def build_counts(results, keys=("Driver", "Team", "Track")):
+    isRace = (results.index.get_level_values("Session") == "Race")
+    position = results["Position"].fillna(99)
+    points = results["Points"].astype("float64")
+
+    flags = pd.DataFrame({
+        "Wins": position.eq(1) & isRace,
+        "Podiums": position.le(3) & isRace,
+        "Top 10s": position.le(10) & isRace,
+        "Fastest Laps": results["Set Fastest Lap"] & isRace,
+        "DNFs": results["Status"].eq("DNF") & isRace,
+        "Race Points": points.where(isRace, 0),
+        "Sprint Points": points.where(~isRace, 0),
+    }).astype({column: "int64" for column in COUNT_COLUMNS}).reset_index(drop=True)
+
+    tables = {}
+    for key in keys:
+        table = flags.groupby(_key(results, key), observed=False).sum().rename_axis(key)
+        table["Total Points"] = table["Race Points"] + table["Sprint Points"]
+        tables[key] = table[COUNT_COLUMNS + POINT_COLUMNS]
+
+    return tables
+
+
+# ----------------------------------
+# POINTS MATRIX (ENTITY x ROUND)
+# ----------------------------------
+def build_points_matrix(results, key):
+    # (entity, round, session) points in one bincount over the results table
+    entity = _key(results, key)
+    tracks = results["Track"].cat.categories
+    nKeys, nRounds = len(entity.categories), len(tracks)
+
+    cell = (np.asarray(entity.codes, dtype="int64") * nRounds + results["Track ID"].to_numpy()) * 2
+    cell += results.index.get_level_values("Session").codes
+    points = _bincount(cell, nKeys * nRounds * 2, results["Points"].to_numpy(dtype="float64"))
+    points = points.reshape(nKeys, nRounds, 2)
+
+    index = pd.CategoricalIndex(entity.categories, categories=entity.categories, name=key)
+    columns = pd.CategoricalIndex(tracks, categories=tracks, name="Track")
+    racePts = pd.DataFrame(points[:, :, 1], index=index, columns=columns)
+    sprintPts = pd.DataFrame(points[:, :, 0], index=index, columns=columns)
+    total = racePts + sprintPts
+
+    return {
+        "Race": racePts,
+        "Sprint": sprintPts,
+        "Total": total,
+        "Cumulative": total.cumsum(axis=1),
+    }
+
+
+def build_points_tables(results, keys=("Driver", "Team")):
+    return {key: build_points_matrix(results, key) for key in keys}
+
+
+# ----------------------------------
+# POSITION MATRICES (DRIVER x ROUND)
+# ----------------------------------
+# Race results scattered into driver x round frames once per snapshot:
+#   Position  position as reported (NaN for NC / DSQ / DNS rows)
+#   Finish    classified finishes only: NaN for DNF / DSQ / NC / DNS
+#   Grid      starting slot, NaN for pit-lane starts and impossible slots
+#   Gained    Grid - Finish, NaN unless both are known
+#   Started   the driver took part in the round
+# Missed rounds are NaN / False everywhere.
+CLASSIFIED = ["FIN", "LAP"]
+
+
+def build_position_tables(results):
+    race = results[results.index.get_level_values("Session") == "Race"]
+    driver = _key(results, "Driver")
+    tracks = results["Track"].cat.categories
+    rows = np.asarray(_key(race, "Driver").codes, dtype="int64")
+    cols = race["Track ID"].to_numpy(dtype="int64")
+    shape = (len(driver.categories), len(tracks))
+
+    position = race["Position"].astype("float64").to_numpy(na_value=np.nan)
+    grid = race["Starting Grid"].to_numpy(dtype="float64")
+    classified = race["Status"].isin(CLASSIFIED).to_numpy()
+
+    def matrix(values, fill=np.nan):
+        out = np.full(shape, fill)
+        out[rows, cols] = values
+        return out
+
+    # a slot past the size of the round's field is a typo in the source data
+    field = np.bincount(cols, minlength=shape[1])[cols]
+    finish = matrix(np.where(classified, position, np.nan))
+    grid = matrix(np.where((grid > 0) & (grid <= field), grid, np.nan))
+
+    index = pd.CategoricalIndex(driver.categories, categories=driver.categories, name="Driver")
+    columns = pd.CategoricalIndex(tracks, categories=tracks, name="Track")
+
+    def frame(values):
+        return pd.DataFrame(values, index=index, columns=columns)
+
+    return {
+        "Position": frame(matrix(position)),
+        "Finish": frame(finish),
+        "Grid": frame(grid),
+        "Gained": frame(grid - finish),
+        "Started": frame(matrix(True, fill=False).astype(bool)),
+    }
+
+
+def standings_from_matrix(matrix):
+    standings = pd.DataFrame({
+        "Race Points": matrix["Race"].sum(axis=1),
+        "Sprint Points": matrix["Sprint"].sum(axis=1),
+    })
+    standings["Total Points"] = standings["Race Points"] + standings["Sprint Points"]
+    return standings.sort_values("Total Points", ascending=False)
+
+
+def driver_standings(matrix):
+    standings = standings_from_matrix(matrix)
+    standings.insert(0, "Rank", range(1, len(standings) + 1))
+    return standings.reset_index()
+
+
+def team_standings(matrix):
+    return standings_from_matrix(matrix).reset_index()
+
+
+# ----------------------------------
+# ROLLING FORM (PREFIX SUMS OVER ROUNDS)
+# ----------------------------------
+# Entity x round running totals, built once per snapshot. The sum over any
+# window of rounds is the difference of two columns, so a form table costs
+# the same for every window size and end round:
+#   Points     race + sprint points (the points matrix's Cumulative)
+#   Rounds     rounds with a race entry
+#   Starts     race entries (two a round for a team)
+#   Finishes   classified finishes, and Finish Sum their positions
+#   DNFs       race entries with status DNF
+FORM_WINDOW = 5
+
+
+def build_form_tables(results, pointsTables, keys=("Driver", "Team")):
+    race = results[results.index.get_level_values("Session") == "Race"]
+    cols = race["Track ID"].to_numpy(dtype="int64")
+    nRounds = len(results["Track"].cat.categories)
+
+    classified = race["Status"].isin(CLASSIFIED).to_numpy()
+    position = race["Position"].astype("float64").to_numpy(na_value=np.nan)
+    perEntry = {
+        "Starts": None,
+        "Finishes": classified.astype("float64"),
+        "Finish Sum": np.where(classified, position, 0.0),
+        "DNFs": race["Status"].eq("DNF").to_numpy(dtype="float64"),
+    }
+
+    tables = {}
+    for key in keys:
+        cumulative = pointsTables[key]["Cumulative"]
+        cell = np.asarray(_key(race, key).codes, dtype="int64") * nRounds + cols
+        size = len(cumulative.index) * nRounds
+
+        def prefix(values):
+            return pd.DataFrame(
+                values.reshape(len(cumulative.index), nRounds).cumsum(axis=1),
+                index=cumulative.index, columns=cumulative.columns,
+            )
+
+        sums = {name: _bincount(cell, size, weights) for name, weights in perEntry.items()}
+        tables[key] = {
+            "Points": cumulative,
+            "Rounds": prefix((sums["Starts"] > 0).astype("int64")),
+            **{name: prefix(values) for name, values in sums.items()},
+        }
+    return tables
+
+
+def rolling_form(formTables, window=FORM_WINDOW, end=None):
+    # form over the `window` rounds up to round `end` (default: the last
+    # one), from two columns of every prefix table; entities without a race
+    # entry in the window are left out, best average points first
+    nRounds = formTables["Points"].shape[1]
+    if nRounds == 0:
+        # no round raced yet
+        form = pd.DataFrame(columns=["Rounds", "Avg Points", "Avg Finish", "DNF Rate"], index=formTables["Points"].index[:0], dtype="float64")
+        form.attrs.update(window=0, first="", last="")
+        return form
+    end = nRounds if end is None else min(max(int(end), 1), nRounds)
+    start = max(end - int(window), 0)
+
+    def total(name):
+        values = formTables[name].to_numpy()
+        return values[:, end - 1] - (values[:, start - 1] if start else 0)
+
+    rounds, starts, finishes = total("Rounds"), total("Starts"), total("Finishes")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        form = pd.DataFrame({
+            "Rounds": rounds,
+            "Avg Points": total("Points") / rounds,
+            "Avg Finish": np.where(finishes > 0, total("Finish Sum") / finishes, np.nan),
+            "DNF Rate": total("DNFs") / starts,
+        }, index=formTables["Points"].index)
+
+    form = form[rounds > 0].sort_values("Avg Points", ascending=False, kind="stable")
+    tracks = formTables["Points"].columns
+    form.attrs.update(window=end - start, first=str(tracks[start]), last=str(tracks[end - 1]))
+    return form
+
+
+def form_label(avgFinish, dnfRate):
+    # bar annotation of the form charts: "avg P4.8 · 20% DNF"
+    finish = f"avg P{avgFinish:.1f}" if avgFinish == avgFinish else "no finish"
+    return f"{finish} · {dnfRate:.0%} DNF"
+
+
+# ----------------------------------
+# CHART LISTS
+# ----------------------------------
+# Every analysis that produces a chart, and those drawn per highlight option.
+# Kept here rather than in charts.py so pages, the API and vega mode can
+# list charts without importing matplotlib.
+DRIVER_CHARTS = [
+    "Race Winner Counts",
+    "Driver Podium Counts",
+    "Top 10 Finish Counts",
+    "Fastest Lap Counts",
+    "DNFs by Drivers",
+    "Points Progression",
+    "Current Form",
+    "Finish Positions (Top 10)",
+    "Finish Position Heatmap",
+    "Positions Gained",
+    "Gap to Winner",
+    "Margin of Victory",
+]
+
+TEAM_CHARTS = [
+    "Team Podium Counts",
+    "DNFs by Team",
+    "DNFs per Track",
+    "Points Progression",
+    "Current Form",
+    "Fastest Lap per Track",
+    "Fastest Lap Pace",
+]
+
+HIGHLIGHT_CHARTS = {"Points Progression", "Finish Positions (Top 10)"}
+
+# charts drawn for any subset of drivers / teams (the highlight argument is
+# then a tuple of names, empty for all of them)
+SELECTION_CHARTS = {"Positions Gained"}
+
+# charts over the last N rounds, N set by the sidebar's form window
+FORM_CHARTS = {"Current Form"}
+
+
+# ----------------------------------
+# CHART DATA (ONE FUNCTION PER ANALYSIS)
+# ----------------------------------
+# Plain frames / series behind every chart, so they can be computed, tested
+# or exported without Streamlit or matplotlib.
+# analysis -> (count table, column, ascending)
+COUNT_CHARTS = {
+    "Race Winner Counts": ("Driver", "Wins", True),
+    "Driver Podium Counts": ("Driver", "Podiums", True),
+    "Top 10 Finish Counts": ("Driver", "Top 10s", True),
+    "Fastest Lap Counts": ("Driver", "Fastest Laps", True),
+    "DNFs by Drivers": ("Driver", "DNFs", False),
+    "Team Podium Counts": ("Team", "Podiums", False),
+    "DNFs by Team": ("Team", "DNFs", False),
+    "DNFs per Track": ("Track", "DNFs", False),
+}
+
+
+def count_chart(countTables, analysis_type):
+    key, column, ascending = COUNT_CHARTS[analysis_type]
+    counts = countTables[key][column]
+    return counts[counts > 0].sort_values(ascending=ascending)
+
+
+def points_progression(matrix, top=10):
+    # cumulative points of the `top` entities by final total, one column per round
+    cumulative = matrix["Cumulative"]
+    if cumulative.empty:
+        # no round raced yet
+        return cumulative.iloc[:0, :0]
+    totals = cumulative.iloc[:, -1].sort_values(ascending=False)
+    return cumulative.loc[totals.head(top).index]
+
+
+def _by_points(positionTables, driverCounts):
+    # drivers who started a race, most total points first
+    started = positionTables["Started"].any(axis=1)
+    order = driverCounts["Total Points"].reindex(started.index[started]).sort_values(ascending=False, kind="stable")
+    return order.index
+
+
+def finish_positions(positionTables, driverCounts, top=10):
+    # finish position per round for the `top` drivers by total points;
+    # NC / DSQ rows and missed rounds count as 20th
+    driverOrder = driverCounts.sort_values("Total Points", ascending=False).head(top).index
+    positions = positionTables["Position"].loc[driverOrder].fillna(20)
+    return positions.set_axis(positions.columns.astype(str), axis=1)
+
+
+def finish_grid(positionTables, driverCounts):
+    # classified finish of every driver in every round, most points on top;
+    # DNF / DSQ / NC / DNS and missed rounds are NaN
+    finish = positionTables["Finish"].loc[_by_points(positionTables, driverCounts)]
+    return finish.set_axis(finish.columns.astype(str), axis=1)
+
+
+def positions_gained(positionTables, driverCounts):
+    # driver x positions gained: how often each driver made up (positive) or
+    # lost (negative) that many places from grid to flag, one bincount
+    gained = positionTables["Gained"].loc[_by_points(positionTables, driverCounts)]
+    values = gained.to_numpy()
+    known = ~np.isnan(values)
+    if not known.any():
+        return pd.DataFrame(index=gained.index)
+
+    low, high = int(values[known].min()), int(values[known].max())
+    width = high - low + 1
+    rows = np.nonzero(known)[0]
+    counts = _bincount(rows * width + (values[known].astype("int64") - low), len(gained) * width, None)
+    return pd.DataFrame(
+        counts.astype("int64").reshape(len(gained), width),
+        index=gained.index,
+        columns=pd.Index(range(low, high + 1), name="Positions Gained"),
+    )
+
+
+# ----------------------------------
+# TIME-BASED ANALYSES (GAPS & LAP TIMES)
+# ----------------------------------
+# Built on the 'Gap (s)' / 'Fastest Lap (s)' columns store.py parses once per
+# load; each is a handful of groupbys over the whole results table.
+SPREAD_COLUMNS = ["Min", "Q1", "Median", "Q3", "Max"]
+
+
+def lap_clock(seconds):
+    # float seconds -> "m:ss.sss" labels
+    minutes, rest = divmod(seconds, 60)
+    return minutes.astype("int64").astype(str) + ":" + rest.map("{:06.3f}".format).astype(str)
+
+
+def _spread(values, keys):
+    # five-number summary of `values` per key
+    if values.empty:
+        return pd.DataFrame(columns=SPREAD_COLUMNS, dtype="float64")
+    spread = values.groupby(keys, observed=True).quantile([0, 0.25, 0.5, 0.75, 1]).unstack()
+    spread.columns = SPREAD_COLUMNS
+    return spread
+
+
+def gap_to_winner(race, driverCounts, top=10):
+    # spread of the gap to the winner over lead-lap finishes (winning = 0 s)
+    # for the `top` drivers by total points, closest median first
+    driverOrder = driverCounts.sort_values("Total Points", ascending=False).head(top).index
+    rows = race[race["Driver"].isin(driverOrder) & race["Gap (s)"].notna()]
+
+    spread = _spread(rows["Gap (s)"], rows["Driver"])
+    spread["Finishes"] = rows.groupby("Driver", observed=True).size()
+    return spread.sort_values("Median")
+
+
+def margin_of_victory(race):
+    # winner and gap to P2 per round, in round order; rounds where P2 was
+    # lapped or not classified have no margin and are left out
+    position = race["Position"]
+    winners = race[position.eq(1).fillna(False)]
+    runnersUp = race[position.eq(2).fillna(False)]
+
+    margins = pd.DataFrame({
+        "Winner": winners.groupby("Track", observed=True)["Driver"].first(),
+        "Margin (s)": runnersUp.groupby("Track", observed=True)["Gap (s)"].min(),
+    })
+    return margins.dropna(subset=["Margin (s)"])
+
+
+def fastest_lap_per_track(race):
+    # quickest race lap of every round and who set it, in round order
+    laps = race[race["Fastest Lap (s)"].notna()]
+    best = laps.loc[laps.groupby("Track", observed=True)["Fastest Lap (s)"].idxmin()]
+    return best.set_index("Track")[["Driver", "Team", "Fastest Lap (s)"]]
+
+
+def team_lap_pace(race):
+    # each team's quickest lap per round as % slower than the round's quickest,
+    # median over rounds; quickest team last (drawn on top)
+    laps = race[race["Fastest Lap (s)"].notna()]
+    teamBest = laps.groupby(["Team", "Track"], observed=True)["Fastest Lap (s)"].min()
+    roundBest = laps.groupby("Track", observed=True)["Fastest Lap (s)"].min()
+
+    deficit = (teamBest / roundBest.reindex(teamBest.index.get_level_values("Track")).to_numpy() - 1) * 100
+    return deficit.groupby("Team", observed=True).median().sort_values(ascending=False)
+
+
+# ----------------------------------
+# HEAD TO HEAD (ALL DRIVER PAIRS)
+# ----------------------------------
+# Results become driver x round matrices (finish order, classified position,
+# grid slot, team); every pair is compared at once by broadcasting, a block
+# of drivers at a time so all-time driver lists stay within memory.
+H2H_BLOCK_CELLS = 16_000_000
+
+
+def _round_matrices(race, rounds):
+    driverCodes, drivers = pd.factorize(race["Driver"].astype(str), sort=True)
+    roundCodes, _ = pd.factorize(rounds)
+    teamCodes, _ = pd.factorize(race["Team"].astype(str))
+    shape = (len(drivers), roundCodes.max() + 1 if len(roundCodes) else 0)
+
+    position = race["Position"].astype("float64").to_numpy(na_value=np.nan)
+    classified = race["Status"].isin(CLASSIFIED).to_numpy()
+    laps = race["Laps"].to_numpy(dtype="float64")
+    grid = race["Starting Grid"].to_numpy(dtype="float64")
+    # slots past the round's field size are typos, as in build_position_tables
+    field = np.bincount(roundCodes, minlength=shape[1])[roundCodes]
+
+    def matrix(values, fill=np.nan):
+        out = np.full(shape, fill)
+        out[driverCodes, roundCodes] = values
+        return out
+
+    return drivers, {
+        # rows without a position (DSQ / DNS) rank behind everyone, by laps
+        "order": matrix(np.where(np.isnan(position), 1000 - laps, position)),
+        "position": matrix(np.where(classified, position, np.nan)),
+        "grid": matrix(np.where((grid > 0) & (grid <= field), grid, np.nan)),
+        "team": matrix(teamCodes, fill=-1).astype("int64"),
+    }
+
+
+def _mean_delta(values):
+    # mean of (row driver - column driver) over rounds both have a value,
+    # as matrix products: sum(a_i - a_j) = (a*v)_i . v_j - v_i . (a*v)_j
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    valid = valid.astype("float64")
+    count = valid @ valid.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (filled @ valid.T - valid @ filled.T) / count
+
+
+def head_to_head(race, rounds=None):
+    # driver x driver frames: shared starts, finishes ahead (row ahead of
+    # column), mean classified-position and grid deltas (negative = row
+    # driver ahead) and the same counts for rounds as teammates. `rounds`
+    # keys the races (default: Track); pass e.g. season + track across seasons.
+    drivers, m = _round_matrices(race, race["Track"] if rounds is None else rounds)
+    order, team = m["order"], m["team"]
+    size, nRounds = order.shape
+
+    started = ~np.isnan(order)
+    races = started.astype("float64") @ started.T.astype("float64")
+    ahead = np.zeros((size, size), dtype="int64")
+    teammateRaces = np.zeros((size, size), dtype="int64")
+    teammateAhead = np.zeros((size, size), dtype="int64")
+
+    # blocks of drivers with neighbouring careers, each compared only on the
+    # rounds they raced against the drivers of those rounds: across seasons
+    # most pairs never met, so the cube stays small
+    career = np.where(started, np.arange(nRounds), 0).sum(axis=1) / np.maximum(started.sum(axis=1), 1)
+    byCareer = np.argsort(career, kind="stable")
+    block = max(1, H2H_BLOCK_CELLS // max(1, size * nRounds))
+    for start in range(0, size, block):
+        rows = byCareer[start:start + block]
+        cols = np.flatnonzero(started[rows].any(axis=0))
+        others = np.flatnonzero(started[:, cols].any(axis=1))
+        mine, theirs = order[np.ix_(rows, cols)], order[np.ix_(others, cols)]
+        myTeam, theirTeam = team[np.ix_(rows, cols)], team[np.ix_(others, cols)]
+
+        # (block, 1, rounds) against (1, drivers, rounds)
+        isAhead = mine[:, None, :] < theirs[None, :, :]
+        sameTeam = (myTeam[:, None, :] == theirTeam[None, :, :]) & (myTeam[:, None, :] >= 0)
+        cells = np.ix_(rows, others)
+        ahead[cells] = isAhead.sum(axis=2)
+        teammateRaces[cells] = sameTeam.sum(axis=2)
+        teammateAhead[cells] = (isAhead & sameTeam).sum(axis=2)
+
+    np.fill_diagonal(teammateRaces, 0)
+
+    def frame(values):
+        return pd.DataFrame(values, index=drivers, columns=drivers)
+
+    return {
+        "Races": frame(races.astype("int64")),
+        "Ahead": frame(ahead),
+        "Position Delta": frame(_mean_delta(m["position"])),
+        "Grid Delta": frame(_mean_delta(m["grid"])),
+        "Teammate Races": frame(teammateRaces),
+        "Teammate Ahead": frame(teammateAhead),
+    }
+
+
+def head_to_head_table(h2h, driver):
+    # one driver against everyone they shared a race with
+    races = h2h["Races"].loc[driver].drop(driver)
+    opponents = races[races > 0].index
+    table = pd.DataFrame({
+        "Opponent": opponents,
+        "Races": races[opponents].to_numpy(),
+        "Ahead": h2h["Ahead"].loc[driver, opponents].to_numpy(),
+        "Behind": h2h["Ahead"].loc[opponents, driver].to_numpy(),
+        "Avg Position Δ": h2h["Position Delta"].loc[driver, opponents].to_numpy(),
+        "Avg Grid Δ": h2h["Grid Delta"].loc[driver, opponents].to_numpy(),
+        "Teammate Races": h2h["Teammate Races"].loc[driver, opponents].to_numpy(),
+    })
+    return table.sort_values(["Races", "Ahead"], ascending=False, ignore_index=True)
+
+
+def teammate_battles(h2h):
+    # every pair that shared a team, counted over their races as teammates
+    together = h2h["Teammate Races"].to_numpy()
+    i, j = np.nonzero(np.triu(together > 0, k=1))
+    drivers = h2h["Races"].index
+    ahead = h2h["Teammate Ahead"].to_numpy()
+
+    table = pd.DataFrame({
+        "Driver": drivers[i],
+        "Teammate": drivers[j],
+        "Races Together": together[i, j],
+        "Driver Ahead": ahead[i, j],
+        "Teammate Ahead": ahead[j, i],
+        "Avg Position Δ": h2h["Position Delta"].to_numpy()[i, j],
+        "Avg Grid Δ": h2h["Grid Delta"].to_numpy()[i, j],
+    })
+    # the driver who came out on top goes first
+    swap = table["Teammate Ahead"] > table["Driver Ahead"]
+    for a, b in (("Driver", "Teammate"), ("Driver Ahead", "Teammate Ahead")):
+        table.loc[swap, [a, b]] = table.loc[swap, [b, a]].to_numpy()
+    table.loc[swap, ["Avg Position Δ", "Avg Grid Δ"]] *= -1
+    return table.sort_values("Races Together", ascending=False, ignore_index=True)
+
+
+def driver_chart_data(analysis_type, raceResults, countTables, pointsTables, positionTables, formTables, window=FORM_WINDOW):
+    if analysis_type == "Points Progression":
+        return points_progression(pointsTables["Driver"])
+    if analysis_type == "Current Form":
+        return rolling_form(formTables["Driver"], window)
+    if analysis_type == "Finish Positions (Top 10)":
+        return finish_positions(positionTables, countTables["Driver"])
+    if analysis_type == "Finish Position Heatmap":
+        return finish_grid(positionTables, countTables["Driver"])
+    if analysis_type == "Positions Gained":
+        return positions_gained(positionTables, countTables["Driver"])
+    if analysis_type == "Gap to Winner":
+        return gap_to_winner(raceResults, countTables["Driver"])
+    if analysis_type == "Margin of Victory":
+        return margin_of_victory(raceResults)
+    return count_chart(countTables, analysis_type)
+
+
+def team_chart_data(analysis_type, raceResults, countTables, pointsTables, formTables, window=FORM_WINDOW):
+    if analysis_type == "Points Progression":
+        return points_progression(pointsTables["Team"])
+    if analysis_type == "Current Form":
+        return rolling_form(formTables["Team"], window)
+    if analysis_type == "Fastest Lap per Track":
+        return fastest_lap_per_track(raceResults)
+    if analysis_type == "Fastest Lap Pace":
+        return team_lap_pace(raceResults)
+    return count_chart(countTables, analysis_type)
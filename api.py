@@ -0,0 +1,221 @@
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+from typing import NamedTuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from analytics import (
+    DRIVER_CHARTS, TEAM_CHARTS, driver_chart_data, driver_standings, team_chart_data, team_standings,
+)
+from seasons import SeasonRegistry
+
+
+# ----------------------------------
+# READ-ONLY JSON API
+# ----------------------------------
+# The Drivers / Teams results of the dashboard as JSON, for tools that used
+# to scrape the page:
+#
+#   python api.py --port 8600
+#
+#   GET /api/seasons
+#   GET /api/<season|latest>/drivers                  analyses + URLs
+#   GET /api/<season|latest>/drivers/driver-standings
+#   GET /api/<season|latest>/teams/points-progression
+#
+# Every response of a season is serialized once per data version (live
+# rounds included) and carries an ETag of that version; requests with a
+# matching If-None-Match get 304 Not Modified without a body.
+API_PORT = int(os.environ.get("F1_API_PORT", 8600))
+
+ANALYSES = {
+    "drivers": ["Driver Standings"] + DRIVER_CHARTS,
+    "teams": ["Team Standings"] + TEAM_CHARTS,
+}
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-")
+
+
+def _records(data):
+    # Series / DataFrame -> JSON list of row objects, index included
+    frame = data.to_frame() if data.ndim == 1 else data
+    if frame.index.name is not None:
+        frame = frame.reset_index()
+    return frame.to_json(orient="records", double_precision=6)
+
+
+def _analysis_data(category, analysis, snapshot):
+    race, counts, points = snapshot.season.race, snapshot.counts, snapshot.points
+    if analysis == "Driver Standings":
+        return driver_standings(points["Driver"])
+    if analysis == "Team Standings":
+        return team_standings(points["Team"])
+    if category == "drivers":
+        return driver_chart_data(analysis, race, counts, points, snapshot.positions, snapshot.form)
+    return team_chart_data(analysis, race, counts, points, snapshot.form)
+
+
+def _document(**fields):
+    return json.dumps(fields, separators=(",", ":")).encode()
+
+
+class Response(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def build_responses(season, snapshot):
+    # path -> Response for one season version
+    version = snapshot.season.version
+    responses = {}
+    for category, analyses in ANALYSES.items():
+        index = []
+        for analysis in analyses:
+            slug = _slug(analysis)
+            path = f"/api/{season}/{category}/{slug}"
+            data = _analysis_data(category, analysis, snapshot)
+            head = _document(season=season, analysis=analysis, version=version)
+            body = head[:-1] + b',"data":' + _records(data).encode() + b"}"
+            responses[path] = Response(body, f'"{version}-{slug}"')
+            index.append({"analysis": analysis, "url": path})
+
+        body = _document(season=season, version=version, analyses=index)
+        responses[f"/api/{season}/{category}"] = Response(body, f'"{version}-{category}"')
+    return responses
+
+
+# ----------------------------------
+# PRECOMPUTED RESPONSES PER VERSION
+# ----------------------------------
+class ApiCache:
+
+    def __init__(self, registry):
+        self.registry = registry
+        self._seasons = {}
+        self._lock = threading.Lock()
+
+    def season(self, year):
+        # responses of the season's current version, rebuilt once per version
+        live = self.registry.live(year)
+        version = live.version
+        cached = self._seasons.get(year)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with self._lock:
+            cached = self._seasons.get(year)
+            if cached is None or cached[0] != live.version:
+                snapshot = live.snapshot()
+                cached = (snapshot.season.version, build_responses(year, snapshot))
+                self._seasons[year] = cached
+            return cached[1]
+
+    def seasons(self):
+        latest = self.registry.latest()
+        body = _document(seasons=self.registry.years(), latest=latest)
+        return Response(body, f'"{self.registry.live(latest).version}-seasons"')
+
+    def lookup(self, path):
+        parts = path.rstrip("/").split("/")
+        if parts == ["", "api", "seasons"]:
+            return self.seasons()
+        if len(parts) < 4 or parts[:2] != ["", "api"]:
+            return None
+
+        season = parts[2]
+        if season == "latest":
+            year = self.registry.latest()
+        elif season.isdigit() and int(season) in self.registry.years():
+            year = int(season)
+        else:
+            return None
+        parts[2] = str(year)
+        return self.season(year).get("/".join(parts))
+
+
+def _etag_matches(header, etag):
+    if header is None:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    # keep-alive, so clients polling many endpoints reuse one connection
+    protocol_version = "HTTP/1.1"
+    # headers and body are two writes: without TCP_NODELAY the body waits
+    # for the client's delayed ACK (~40 ms per response)
+    disable_nagle_algorithm = True
+    cache = None
+
+    def do_GET(self):
+        response = self.cache.lookup(urlsplit(self.path).path)
+        if response is None:
+            self._send(404, _document(error="not found"))
+            return
+        if _etag_matches(self.headers.get("If-None-Match"), response.etag):
+            self._send(304, None, response.etag)
+            return
+        self._send(200, response.body, response.etag)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            # clients may keep responses but revalidate them: live rounds change the data
+            self.send_header("Cache-Control", "no-cache")
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        else:
+            self.send_header("Content-Length", "0")
+        self.end_headers()
+        if body is not None and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ApiServer(ThreadingHTTPServer):
+    request_queue_size = 256
+    daemon_threads = True
+
+
+def serve_api(registry, port=API_PORT, host=""):
+    handler = type("ApiHandler", (_ApiHandler,), {"cache": ApiCache(registry)})
+    return _ApiServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the dashboard's driver / team results as JSON.")
+    parser.add_argument("--root", default=".", help="repository root holding the season CSVs")
+    parser.add_argument("--host", default="")
+    parser.add_argument("--port", type=int, default=API_PORT)
+    args = parser.parse_args(argv)
+
+    registry = SeasonRegistry(args.root)
+    registry.watch(registry.latest())
+    server = serve_api(registry, args.port, args.host)
+    # build the latest season's responses before taking requests
+    server.RequestHandlerClass.cache.season(registry.latest())
+    print(f"serving http://{args.host or 'localhost'}:{server.server_address[1]}/api/seasons", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,43 @@
+import os
+
 import streamlit as st
-import pandas as pd
-from driver import render_driver_analysis
-from team import render_team_analysis
+from seasons import SeasonRegistry
+from store import freeze
+from analytics import FORM_CHARTS, FORM_WINDOW, standings_from_matrix
+from render_cache import RenderCache
+from assets import asset_url
+from timing import ENABLED as TIMING_ENABLED, METRICS, finish_rerun, serve_metrics, set_view, span, start_rerun
 
 st.set_page_config(
-    page_title="Formula 1 – 2025 Dashboard",
+    page_title="Formula 1 Dashboard",
     layout="wide"
 )
 
+# ----------------------------------
+# TIMING (F1_TIMING=1 OR ?debug=1)
+# ----------------------------------
+debug = bool(st.query_params.get("debug"))
+start_rerun(TIMING_ENABLED or debug)
+
+# Optional Prometheus endpoint (F1_METRICS_PORT), started once per process
+@st.cache_resource
+def start_metrics_server():
+    return serve_metrics()
+
+start_metrics_server()
+
+# ----------------------------------
+# CHART MODE (F1_CHART_MODE OR ?charts=vega)
+# ----------------------------------
+# "matplotlib" serves cached PNGs rendered on the server; "vega" sends chart
+# data + a Vega-Lite spec and the browser draws it; "snapshot" shows the
+# files pre-rendered by bundle.py and renders live what is not bundled.
+# Exports stay matplotlib.
+CHART_MODES = ("matplotlib", "vega", "snapshot")
+chartMode = st.query_params.get("charts", os.environ.get("F1_CHART_MODE", "matplotlib"))
+if chartMode not in CHART_MODES:
+    chartMode = "matplotlib"
+
 # ----------------------------------
 # THEME
 # ----------------------------------
@@ -18,35 +48,106 @@ html, body { background-color: #0E1117; color: white; }
 </style>
 """, unsafe_allow_html=True)
 
+# ----------------------------------
+# SEASONS (LOADED LAZILY)
+# ----------------------------------
+# The registry only discovers season directories; a season's data is read
+# the first time it is selected. The latest season is watched so rounds
+# appended to its CSVs show up without a restart.
+@st.cache_resource
+def get_registry():
+    registry = SeasonRegistry()
+    registry.watch(registry.latest())
+    return registry
+
+registry = get_registry()
+seasons = registry.years()
+
+with st.sidebar:
+
+    st.markdown("## 📊 Analysis Control")
+
+    if len(seasons) > 1:
+        season = st.selectbox("Season", seasons[::-1], index=0)
+    else:
+        season = seasons[0]
+
 st.markdown(
-    "<h2 style='text-align:center;'>🏎️ Formula 1 – 2025 Season Dashboard</h2>",
+    f"<h2 style='text-align:center;'>🏎️ Formula 1 – {season} Season Dashboard</h2>",
     unsafe_allow_html=True
 )
 st.markdown("---")
 
 # ----------------------------------
-# LOAD DATA (ONCE)
+# LOAD DATA (LIVE SNAPSHOT PER SEASON)
 # ----------------------------------
-@st.cache_data
-def load_data():
-    calendar = pd.read_csv("Formula1_Calendar.csv")
-    drivers = pd.read_csv("Formula1_Drivers.csv")
-    race = pd.read_csv("Formula1_RaceResults.csv")
-    sprint = pd.read_csv("Formula1_SprintResults.csv")
-    return calendar, drivers, race, sprint
-
-calendar, drivers, raceResults, sprintResults = load_data()
+# Cross-season tables, rebuilt only when any season's data changes. Held
+# once per process and frozen like the snapshots, instead of a pickled copy
+# per rerun.
+@st.cache_resource(max_entries=4)
+def load_history(versions):
+    registry = get_registry()
+    return freeze((registry.career_wins(), registry.points_per_season()))
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_head_to_head(versions):
+    return freeze(get_registry().head_to_head())
+
+# Rendered chart PNGs, shared by every session in this process. Charts that
+# read a table which just received a new round are dropped straight away.
+@st.cache_resource
+def get_chart_cache():
+    chartCache = RenderCache()
+    get_registry().on_change(chartCache.invalidate_tables)
+    return chartCache
+
+# Typed frames come from store.py, which keeps a memory-mapped Arrow copy
+# keyed by the CSV content hash so cold starts skip CSV parsing. Counts and
+# points matrices live next to them in the season's snapshot and are
+# updated by deltas when a new round is ingested.
+with span("load_data"):
+    snapshot = registry.live(season).snapshot()
+calendar, drivers, raceResults, sprintResults, version = snapshot.season
+countTables = snapshot.counts
+pointsTables = snapshot.points
+positionTables = snapshot.positions
+formTables = snapshot.form
+dimensions = snapshot.dimensions
+tableVersions = snapshot.table_versions
+chartCache = get_chart_cache()
+
+# Rerun this session once the watcher has published a new round. Every
+# tick is a round trip per open session, so sessions only poll the shared
+# live season every few seconds.
+LIVE_ROUND_INTERVAL = float(os.environ.get("F1_LIVE_ROUND_INTERVAL", 5.0))
+
+@st.fragment(run_every=LIVE_ROUND_INTERVAL)
+def follow_live_rounds():
+    if registry.live(season).version != version:
+        st.rerun()
+
+follow_live_rounds()
 
 # ----------------------------------
 # SIDEBAR – ANALYSIS CONTROL
 # ----------------------------------
+# Current Form averages over the last N rounds; any N is two columns of the
+# snapshot's prefix tables (analytics.rolling_form)
+formWindow = FORM_WINDOW
+
+def form_window_slider():
+    nRounds = pointsTables["Driver"]["Total"].shape[1]
+    return st.slider("Form Window (Rounds)", 1, max(nRounds, 2), max(min(FORM_WINDOW, nRounds), 1))
+
 with st.sidebar:
 
-    st.markdown("## 📊 Analysis Control")
+    categories = ["Overview", "Drivers", "Teams", "Engine"]
+    if len(seasons) > 1:
+        categories.append("History")
 
     category = st.radio(
         "Select Category",
-        ["Overview", "Drivers", "Teams","Engine"],
+        categories,
         index=0
     )
 
@@ -55,38 +156,33 @@ with st.sidebar:
     # -------------------------------
     # DRIVER CONTROLS (INSIDE SIDEBAR)
     # -------------------------------
+    # Highlight / fade controls sit above the chart (chart_panel.py): they
+    # rerun only the chart fragment, not this script
     if category == "Drivers":
 
             driver_analysis = st.selectbox(
                 "Driver Analysis",
                 [
                     "Driver Standings",
+                    "Title Odds",
+                    "Head-to-Head",
                     "Race Winner Counts",
                     "Driver Podium Counts",
                     "Top 10 Finish Counts",
                     "Fastest Lap Counts",
                     "DNFs by Drivers",
                     "Points Progression",
-                    "Finish Positions (Top 10)"
+                    "Current Form",
+                    "Finish Positions (Top 10)",
+                    "Finish Position Heatmap",
+                    "Positions Gained",
+                    "Gap to Winner",
+                    "Margin of Victory"
                 ]
             )
 
-            if driver_analysis in [
-                "Points Progression",
-                "Finish Positions (Top 10)"
-            ]:
-                highlight_driver = st.selectbox(
-                    "Highlight Driver",
-                    sorted(raceResults["Driver"].unique())
-                )
-
-                opacity = st.slider(
-                    "Fade Other Drivers",
-                    0.1, 1.0, 0.3, 0.1
-                )
-            else:
-                highlight_driver = None
-                opacity = 1.0
+            if driver_analysis in FORM_CHARTS:
+                formWindow = form_window_slider()
 
     # -------------------------------
     # TEAM CONTROLS (INSIDE SIDEBAR)
@@ -97,151 +193,217 @@ with st.sidebar:
                 "Team Analysis",
                 [
                     "Team Standings",
+                    "Title Odds",
                     "Team Podium Counts",
                     "DNFs by Team",
                     "DNFs per Track",
-                    "Points Progression"
+                    "Points Progression",
+                    "Current Form",
+                    "Fastest Lap per Track",
+                    "Fastest Lap Pace"
                 ]
             )
 
-            if team_analysis == "Points Progression":
-
-                highlight_team = st.selectbox(
-                    "Highlight Team",
-                    sorted(raceResults["Team"].unique())
-                )
+            if team_analysis in FORM_CHARTS:
+                formWindow = form_window_slider()
 
-                opacity = st.slider(
-                    "Fade Other Teams",
-                    0.1, 1.0, 0.3, 0.1
-                )
+    # -------------------------------
+    # HISTORY CONTROLS (INSIDE SIDEBAR)
+    # -------------------------------
+    elif category == "History":
 
-            else:
-                highlight_team = None
-                opacity = 1.0
+            history_analysis = st.selectbox(
+                "History Analysis",
+                [
+                    "Career Wins",
+                    "Points per Season",
+                    "Head-to-Head (All Seasons)"
+                ]
+            )
 
 
 
 # ----------------------------------
 # ROUTING (THIS WAS THE MISSING PART)
 # ----------------------------------
-if category == "Overview":
+# Logical names of the bundled images (assets.py / static/assets/manifest.json)
+CHAMPION_IMAGES = {
+    2025: {
+        "driver": "champion-driver-2025",
+        "team": "champion-team-2025",
+    }
+}
 
-    st.subheader("🏆 2025 Season Overview")
+# season whose engine supplier line-up the Engine page shows
+ENGINE_SEASON = 2025
 
-    st.markdown("---")
 
-    col1, col2 = st.columns(2)
+def show_asset(name, **kwargs):
+    # images are served by the app itself; until `python assets.py build`
+    # has run the page just goes without them
+    url = asset_url(name)
+    if url:
+        st.image(url, **kwargs)
 
-    # -------------------------------
-    # DRIVER CHAMPION
-    # -------------------------------
-    with col1:
-        st.markdown("### 🥇 World Driver Champion")
-        st.image(
-            "https://mb.com.ph/manilabulletin/uploads/images/2025/12/08/64073.webp",
-            use_container_width=True
-        )
-        st.markdown("**Lando Norris**")
-        st.caption("McLaren • 2025 World Champion")
 
-    # -------------------------------
-    # CONSTRUCTOR CHAMPION
-    # -------------------------------
-    with col2:
-        st.markdown("### 🏗️ Constructor Champion")
-        st.image(
-            "https://images.gmanews.tv/webpics/2025/10/2025-10-05T144110Z_760779854_UP1ELA514SLYL_RTRMADP_3_MOTOR-F1-SINGAPORE_2025_10_05_22_53_41.jpeg",
-            use_container_width=True
-        )
-        st.markdown("**McLaren F1 Team**")
-        st.caption("2025 Constructors' Champion")
+set_view(category)
+
+if category == "Overview":
+
+    st.subheader(f"🏆 {season} Season Overview")
+
+    st.markdown("---")
+
+    # Champions come from the season's standings; photos exist for 2025 only
+    championImages = CHAMPION_IMAGES.get(season, {})
+    # nothing to crown before the first round
+    if raceResults.empty:
+        st.info(f"No rounds of the {season} season have been raced yet.")
+    else:
+        with span("aggregate"):
+            champion = standings_from_matrix(pointsTables['Driver']).index[0]
+            championTeam = raceResults.loc[raceResults['Driver'] == champion, 'Team'].iloc[-1]
+            constructor = standings_from_matrix(pointsTables['Team']).index[0]
+
+        col1, col2 = st.columns(2)
+
+        # -------------------------------
+        # DRIVER CHAMPION
+        # -------------------------------
+        with col1:
+            st.markdown("### 🥇 World Driver Champion")
+            if 'driver' in championImages:
+                show_asset(championImages['driver'], use_container_width=True)
+            st.markdown(f"**{champion}**")
+            st.caption(f"{championTeam} • {season} World Champion")
+
+        # -------------------------------
+        # CONSTRUCTOR CHAMPION
+        # -------------------------------
+        with col2:
+            st.markdown("### 🏗️ Constructor Champion")
+            if 'team' in championImages:
+                show_asset(championImages['team'], use_container_width=True)
+            st.markdown(f"**{constructor}**")
+            st.caption(f"{season} Constructors' Champion")
 
     st.markdown("---")
 
     st.info(
-        "This dashboard provides an in-depth analysis of the 2025 Formula 1 season, "
+        f"This dashboard provides an in-depth analysis of the {season} Formula 1 season, "
         "covering driver performance, team dominance, race trends, and championship progression."
     )
 
 elif category == "Drivers":
+    # page modules are imported on first use: sessions that stay on
+    # Overview / Engine never load them, or the matplotlib charts behind them
+    from driver import render_driver_analysis
+
+    set_view(f"Drivers/{driver_analysis}" + (f" [{chartMode}]" if chartMode != "matplotlib" else ""))
     render_driver_analysis(
         raceResults=raceResults,
         sprintResults=sprintResults,
         calendar=calendar,
+        countTables=countTables,
+        pointsTables=pointsTables,
+        positionTables=positionTables,
+        formTables=formTables,
+        dimensions=dimensions,
+        chartCache=chartCache,
+        season=season,
+        tableVersions=tableVersions,
         analysis_type=driver_analysis,
-        highlight_driver=highlight_driver,
-        opacity=opacity
+        chartMode=chartMode,
+        formWindow=formWindow
     )
 
 elif category == "Teams":
+    from team import render_team_analysis
+
+    set_view(f"Teams/{team_analysis}" + (f" [{chartMode}]" if chartMode != "matplotlib" else ""))
     render_team_analysis(
     raceResults=raceResults,
     sprintResults=sprintResults,
+    calendar=calendar,
+    countTables=countTables,
+    pointsTables=pointsTables,
+    formTables=formTables,
+    dimensions=dimensions,
+    chartCache=chartCache,
+    season=season,
+    tableVersions=tableVersions,
     analysis_type=team_analysis,
-    highlight_team=highlight_team,
-    opacity=opacity
+    chartMode=chartMode,
+    formWindow=formWindow
     )
 
 
-elif category == "Engine":
-
-    st.subheader("⚙️ Formula 1 – 2025 Engine Suppliers")
-    st.markdown("---")
+elif category == "History":
+    from history import render_history_analysis
 
-    col1, col2, col3, col4 = st.columns(4)
-
-    # -------------------------------
-    # FERRARI
-    # -------------------------------
-    with col1:
-        st.image(
-            "https://upload.wikimedia.org/wikipedia/de/c/c0/Scuderia_Ferrari_Logo.svg",
-            width=230 
-        )
-        st.markdown("### Ferrari")
-        st.caption("Ferrari • Haas • Kick Sauber")
-
-    # -------------------------------
-    # MERCEDES
-    # -------------------------------
-    with col2:
-        st.image(
-            "https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Mercedes-Logo.svg/512px-Mercedes-Logo.svg.png",
-            use_container_width=True
-        )
-        st.markdown("### Mercedes")
-        st.caption("Mercedes • McLaren • Aston Martin • Williams")
+    set_view(f"History/{history_analysis}")
+    with span("aggregate"):
+        historyVersions = tuple(registry.versions().items())
+        careerWins, seasonPoints = load_history(historyVersions)
+        headToHead = load_head_to_head(historyVersions) if history_analysis == "Head-to-Head (All Seasons)" else None
+    render_history_analysis(
+        careerWins=careerWins,
+        seasonPoints=seasonPoints,
+        headToHead=headToHead,
+        analysis_type=history_analysis
+    )
 
-    # -------------------------------
-    # HONDA RBPT
-    # -------------------------------
-    with col3:
-        st.image(
-            "https://pngimg.com/uploads/car_logo/car_logo_PNG1643.png",
-            use_container_width=True
-        )
-        st.markdown("<br><br>", unsafe_allow_html=True)
-        st.markdown("### Honda RBPT")
-        st.caption("Red Bull Racing • RB")
 
-    # -------------------------------
-    # RENAULT
-    # -------------------------------
-    with col4:
-        st.image(
-            "https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Renault_2009_logo.svg/500px-Renault_2009_logo.svg.png",
-            use_container_width=True
-        )
-        st.markdown("### Renault")
-        st.caption("Alpine")
+elif category == "Engine":
 
+    st.subheader(f"⚙️ Formula 1 – {season} Engine Suppliers")
     st.markdown("---")
 
-    st.info(
-        "Engine suppliers play a crucial role in Formula 1 performance. "
-        "The 2025 season features four manufacturers powering the entire grid."
-    )
+    # the supplier line-up is recorded for one season only
+    if season != ENGINE_SEASON:
+        st.info(f"Engine suppliers are only recorded for the {ENGINE_SEASON} season.")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+
+        # -------------------------------
+        # FERRARI
+        # -------------------------------
+        with col1:
+            show_asset("engine-ferrari", width=230)
+            st.markdown("### Ferrari")
+            st.caption("Ferrari • Haas • Kick Sauber")
+
+        # -------------------------------
+        # MERCEDES
+        # -------------------------------
+        with col2:
+            show_asset("engine-mercedes", use_container_width=True)
+            st.markdown("### Mercedes")
+            st.caption("Mercedes • McLaren • Aston Martin • Williams")
+
+        # -------------------------------
+        # HONDA RBPT
+        # -------------------------------
+        with col3:
+            show_asset("engine-honda", use_container_width=True)
+            st.markdown("<br><br>", unsafe_allow_html=True)
+            st.markdown("### Honda RBPT")
+            st.caption("Red Bull Racing • RB")
+
+        # -------------------------------
+        # RENAULT
+        # -------------------------------
+        with col4:
+            show_asset("engine-renault", use_container_width=True)
+            st.markdown("### Renault")
+            st.caption("Alpine")
+
+        st.markdown("---")
+
+        st.info(
+            "Engine suppliers play a crucial role in Formula 1 performance. "
+            f"The {season} season features four manufacturers powering the entire grid."
+        )
 
 
 # ----------------------------------
@@ -249,7 +411,33 @@ elif category == "Engine":
 # ----------------------------------
 st.markdown("---")
 st.markdown(
-    "<p style='text-align:center;font-size:12px;'>Formula 1 – 2025 Data Analysis Dashboard</p>",
+    f"<p style='text-align:center;font-size:12px;'>Formula 1 – {season} Data Analysis Dashboard</p>",
     unsafe_allow_html=True
 )
 
+
+# ----------------------------------
+# DEBUG – TIMINGS & RENDER CACHE (?debug=1)
+# ----------------------------------
+timings = finish_rerun()
+
+if debug:
+    view, breakdown = timings
+    viewStats = METRICS.summary(view)
+
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown(f"#### ⏱️ Timings – {view}")
+        st.dataframe(
+            {
+                "Phase": [phase for phase, _ in breakdown],
+                "This rerun (ms)": [round(seconds * 1000, 1) for _, seconds in breakdown],
+                "p50": [round(viewStats[(view, phase)]["p50"] * 1000, 1) for phase, _ in breakdown],
+                "p95": [round(viewStats[(view, phase)]["p95"] * 1000, 1) for phase, _ in breakdown],
+                "p99": [round(viewStats[(view, phase)]["p99"] * 1000, 1) for phase, _ in breakdown],
+            },
+            use_container_width=True
+        )
+
+        st.markdown("#### 🧰 Render Cache")
+        st.json(chartCache.stats())
@@ -0,0 +1,240 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import urllib.request
+from functools import lru_cache
+
+
+# ----------------------------------
+# IMAGE ASSETS
+# ----------------------------------
+# Overview / Engine images are fetched once at build time, resized to twice
+# their displayed width (HiDPI screens), content-hashed and written to
+# static/assets/ next to a manifest of logical name -> file. Streamlit serves
+# them from /app/static/ (.streamlit/config.toml), so pages never hot-link
+# third-party sites:
+#
+#   python assets.py build                 # fetch from the source URLs
+#   python assets.py build --from originals/  # air-gapped: <name>.<ext> files
+#   python assets.py check                 # every asset built, no external URLs
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = os.path.join(ROOT, "static", "assets")
+MANIFEST = os.path.join(ASSET_DIR, "manifest.json")
+ASSET_URL = "/app/static/assets/"
+
+# name -> (source URL, width in px). Photos become JPEGs, logos keep their
+# transparency as PNGs. SVG sources go through Wikimedia's PNG renderer.
+SOURCES = {
+    "champion-driver-2025": (
+        "https://mb.com.ph/manilabulletin/uploads/images/2025/12/08/64073.webp",
+        1200,
+    ),
+    "champion-team-2025": (
+        "https://images.gmanews.tv/webpics/2025/10/2025-10-05T144110Z_760779854_UP1ELA514SLYL_RTRMADP_3_MOTOR-F1-SINGAPORE_2025_10_05_22_53_41.jpeg",
+        1200,
+    ),
+    "engine-ferrari": (
+        "https://upload.wikimedia.org/wikipedia/de/thumb/c/c0/Scuderia_Ferrari_Logo.svg/460px-Scuderia_Ferrari_Logo.svg.png",
+        460,
+    ),
+    "engine-mercedes": (
+        "https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Mercedes-Logo.svg/512px-Mercedes-Logo.svg.png",
+        480,
+    ),
+    "engine-honda": (
+        "https://pngimg.com/uploads/car_logo/car_logo_PNG1643.png",
+        480,
+    ),
+    "engine-renault": (
+        "https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Renault_2009_logo.svg/500px-Renault_2009_logo.svg.png",
+        480,
+    ),
+}
+
+# file names change with the content, so browsers may keep them for a year
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@lru_cache(maxsize=1)
+def _manifest(path, mtime):
+    with open(path) as f:
+        return json.load(f)
+
+
+def asset_url(name):
+    # URL of a built asset, or None when it has not been built: pages then
+    # show the text without the image instead of reaching out to the web
+    try:
+        manifest = _manifest(MANIFEST, os.path.getmtime(MANIFEST))
+    except OSError:
+        return None
+    entry = manifest.get(name)
+    if entry is None or not os.path.isfile(os.path.join(ASSET_DIR, entry["file"])):
+        return None
+    return ASSET_URL + entry["file"]
+
+
+class ImmutableAssets:
+    # ASGI middleware for serve.py: adds CACHE_CONTROL to responses under
+    # `prefix` (Streamlit's static route only sends ETag / Last-Modified)
+
+    def __init__(self, app, prefix=ASSET_URL):
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message["headers"] = [
+                    (name, value) for name, value in message.get("headers", [])
+                    if name.lower() != b"cache-control"
+                ] + [(b"cache-control", CACHE_CONTROL.encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
+
+
+# ----------------------------------
+# BUILD
+# ----------------------------------
+def _fetch(url):
+    request = urllib.request.Request(url, headers={"User-Agent": "f1-dashboard-assets/1.0"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def _read_original(originals, name):
+    for file in sorted(os.listdir(originals)):
+        if os.path.splitext(file)[0] == name:
+            with open(os.path.join(originals, file), "rb") as f:
+                return f.read()
+    raise FileNotFoundError(f"no original for {name!r} in {originals}")
+
+
+def _resize(data, width):
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    if image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), resample=Image.LANCZOS)
+
+    buf = io.BytesIO()
+    if image.mode in ("RGBA", "LA", "P"):
+        image.save(buf, format="PNG", optimize=True)
+        ext = "png"
+    else:
+        image.convert("RGB").save(buf, format="JPEG", quality=85, optimize=True, progressive=True)
+        ext = "jpg"
+    return buf.getvalue(), ext, image.size
+
+
+def build(originals=None):
+    os.makedirs(ASSET_DIR, exist_ok=True)
+
+    manifest = {}
+    for name, (url, width) in SOURCES.items():
+        data = _read_original(originals, name) if originals else _fetch(url)
+        data, ext, (w, h) = _resize(data, width)
+        file = f"{name}.{hashlib.sha256(data).hexdigest()[:12]}.{ext}"
+
+        path = os.path.join(ASSET_DIR, file)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(data)
+        manifest[name] = {"file": file, "width": w, "height": h, "bytes": len(data), "source": url}
+        print(f"{name:<22} {w}x{h} {len(data) / 1024:>7.1f}KB  {file}")
+
+    tmp = f"{MANIFEST}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, MANIFEST)
+
+    # drop files of earlier builds
+    current = {entry["file"] for entry in manifest.values()} | {os.path.basename(MANIFEST)}
+    for file in os.listdir(ASSET_DIR):
+        if file not in current:
+            os.remove(os.path.join(ASSET_DIR, file))
+    return manifest
+
+
+# ----------------------------------
+# CHECK (NO EXTERNAL REQUESTS)
+# ----------------------------------
+# Renders every page with Streamlit's AppTest and fails on any absolute URL
+# a browser would load: image sources, plus src/href/url() in markdown/HTML.
+# App-relative URLs (/app/static/, /media/) are served by the app itself.
+EXTERNAL = re.compile(r"""(?:src=|href=|url\()\s*["']?(https?:)?//""", re.IGNORECASE)
+ABSOLUTE = re.compile(r"^(https?:)?//", re.IGNORECASE)
+
+
+def _page_urls(at):
+    urls = []
+    for element in at.get("image"):
+        urls.extend(img.url for img in element.proto.imgs)
+    for element in at.markdown:
+        if EXTERNAL.search(element.value):
+            urls.append(element.value)
+    return urls
+
+
+def check():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60).run()
+    pages = at.sidebar.radio[0].options
+
+    failures, missing = [], [name for name in SOURCES if asset_url(name) is None]
+
+    def visit(label):
+        if at.exception:
+            failures.append((label, at.exception[0].message))
+            return
+        for url in _page_urls(at):
+            if ABSOLUTE.match(url) or EXTERNAL.search(url):
+                failures.append((label, url))
+
+    for page in pages:
+        at.sidebar.radio[0].set_value(page).run()
+        visit(page)
+        # every analysis of the page, e.g. each driver chart
+        for i, selectbox in enumerate(at.sidebar.selectbox):
+            if not selectbox.label.endswith("Analysis"):
+                continue
+            for option in selectbox.options:
+                at.sidebar.selectbox[i].set_value(option).run()
+                visit(f"{page}/{option}")
+
+    for page, url in failures:
+        print(f"FAIL {page}: {url}")
+    # pages skip images that were not built, so they would pass unnoticed
+    if missing:
+        print(f"FAIL not built (run `python assets.py build`): {', '.join(missing)}")
+    print(f"{len(pages)} pages checked, {len(failures)} external or failing, {len(missing)} assets not built")
+    return 1 if failures or missing else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or check the bundled image assets.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_parser = sub.add_parser("build", help="fetch, resize and hash every asset")
+    build_parser.add_argument("--from", dest="originals", help="directory of <name>.<ext> originals instead of fetching")
+    sub.add_parser("check", help="fail if any page references an external URL or an asset is not built")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build(args.originals)
+        return 0
+    return check()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import argparse
+import http.client
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rerun_latency import _free_port
+from revision import current_commit
+
+
+# ----------------------------------
+# JSON API LOAD GENERATOR
+# ----------------------------------
+# Starts `python api.py` on a free port and hammers it from N client threads,
+# each on its own keep-alive connection, cycling through every endpoint:
+#
+#   full         plain GETs, every response carries the JSON body
+#   conditional  GETs with If-None-Match, every response is a 304
+#
+#   python benchmarks/api_load.py --clients 1 8 32 --duration 5
+#
+# Client and server share the machine, so on few cores the numbers include
+# the generator's own CPU.
+MODES = ("full", "conditional")
+
+
+def _get(conn, path, etag=None):
+    conn.request("GET", path, headers={"If-None-Match": etag} if etag else {})
+    response = conn.getresponse()
+    body = response.read()
+    return response.status, response.getheader("ETag"), body
+
+
+def _endpoints(port):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    try:
+        _, _, body = _get(conn, "/api/seasons")
+        latest = json.loads(body)["latest"]
+        paths = []
+        for category in ("drivers", "teams"):
+            _, _, body = _get(conn, f"/api/{latest}/{category}")
+            paths.extend(entry["url"] for entry in json.loads(body)["analyses"])
+        etags = {path: _get(conn, path)[1] for path in paths}
+    finally:
+        conn.close()
+    return etags
+
+
+def _client(port, etags, conditional, stop, latencies, errors, offset):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    paths = list(etags)
+    expected = 304 if conditional else 200
+    i = offset
+    try:
+        while not stop.is_set():
+            path = paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            status, _, _ = _get(conn, path, etags[path] if conditional else None)
+            latencies.append(time.perf_counter() - start)
+            if status != expected:
+                errors.append(status)
+    finally:
+        conn.close()
+
+
+def _percentile(samples, q):
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def load(port, etags, clients, mode, duration):
+    stop = threading.Event()
+    per_client = [[] for _ in range(clients)]
+    errors = []
+    threads = [
+        threading.Thread(target=_client, args=(port, etags, mode == "conditional", stop, per_client[i], errors, i))
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    samples = sorted(s for client in per_client for s in client)
+    return {
+        "clients": clients,
+        "mode": mode,
+        "requests": len(samples),
+        "errors": len(errors),
+        "seconds": elapsed,
+        "rps": len(samples) / elapsed,
+        "p50_ms": _percentile(samples, 0.50) * 1000,
+        "p95_ms": _percentile(samples, 0.95) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+    }
+
+
+def run_server(root, port):
+    return subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "api.py"), "--root", root, "--port", str(port), "--host", "127.0.0.1"],
+        cwd=root, env={**os.environ, "F1_WATCH_INTERVAL": "0"},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_until_up(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            _get(conn, "/api/seasons")
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"api.py did not start on port {port}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput and latency of the JSON API under concurrent clients.")
+    parser.add_argument("--root", default=ROOT, help="repository root holding the season CSVs")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per clients x mode run")
+    parser.add_argument("--output", help="default: benchmarks/results/api-load-<commit>.json")
+    args = parser.parse_args(argv)
+
+    port = _free_port()
+    server = run_server(os.path.abspath(args.root), port)
+    results = []
+    try:
+        _wait_until_up(port)
+        etags = _endpoints(port)
+        for clients in args.clients:
+            for mode in MODES:
+                r = load(port, etags, clients, mode, args.duration)
+                results.append(r)
+                print(
+                    f"{clients:>4} clients  {mode:<12}{r['rps']:>9.0f} req/s"
+                    f"  p50 {r['p50_ms']:>6.2f}ms  p95 {r['p95_ms']:>6.2f}ms  p99 {r['p99_ms']:>6.2f}ms"
+                    f"  errors {r['errors']}"
+                )
+    finally:
+        server.terminate()
+        server.wait()
+
+    commit = current_commit()
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"api-load-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "cpus": os.cpu_count(),
+            "endpoints": len(etags),
+            "duration_s": args.duration,
+            "results": results,
+        }, f, indent=1)
+    print(f"wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
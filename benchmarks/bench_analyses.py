@@ -0,0 +1,147 @@
+import os
+import shutil
+
+import pytest
+
+from analytics import (
+    DRIVER_CHARTS, SELECTION_CHARTS, TEAM_CHARTS,
+    build_counts, build_form_tables, build_points_tables, build_position_tables, build_results, driver_chart_data,
+    driver_standings, head_to_head, rolling_form, team_chart_data, team_standings,
+)
+from charts import plot_driver_chart, plot_team_chart
+from dimensions import build_dimensions
+from figures import release_figure
+from render_cache import figure_to_display_png
+from seasons import SeasonRegistry
+from store import CACHE_DIR, build_season
+from synthetic import SCALES
+
+
+# ----------------------------------
+# SEASON TABLES
+# ----------------------------------
+# Every table a page builds from the season before any analysis runs.
+# Benchmarks are grouped per scale and phase (compute / draw / png), so
+# `--benchmark-compare` lines up the same analysis across commits.
+BUILD_STEPS = {
+    "build_season": lambda s: build_season(**s["frames"]),
+    "build_results": lambda s: build_results(s["season"].race, s["season"].sprint),
+    "build_counts": lambda s: build_counts(s["table"]),
+    "build_points_tables": lambda s: build_points_tables(s["table"]),
+    "build_position_tables": lambda s: build_position_tables(s["table"]),
+    "build_form_tables": lambda s: build_form_tables(s["table"], s["points"]),
+    # a window is two prefix columns: one round and the whole season cost the same
+    "rolling_form (1 round)": lambda s: rolling_form(s["form"]["Driver"], 1),
+    "rolling_form (whole season)": lambda s: rolling_form(s["form"]["Driver"], s["season"].race["Track"].nunique()),
+    "build_dimensions": lambda s: build_dimensions(s["season"], s["table"]),
+}
+
+
+@pytest.mark.parametrize("step", BUILD_STEPS)
+def test_season(benchmark, scale, season, step):
+    benchmark.group = f"{scale}x Season compute"
+    benchmark(BUILD_STEPS[step], season)
+
+
+# ----------------------------------
+# DRIVER / TEAM ANALYSES
+# ----------------------------------
+# compute = the analytics function behind an analysis (standings table or
+# chart data); draw = plot_*_chart() on that data; png = encoding the drawn
+# figure, which then goes back to the pool like RenderCache.get_or_render()
+DRIVER_COMPUTE = {
+    "Driver Standings": lambda s: driver_standings(s["points"]["Driver"]),
+    "Head-to-Head": lambda s: head_to_head(s["season"].race),
+    **{
+        analysis: lambda s, analysis=analysis: driver_chart_data(analysis, s["season"].race, s["counts"], s["points"], s["positions"], s["form"])
+        for analysis in DRIVER_CHARTS
+    },
+}
+TEAM_COMPUTE = {
+    "Team Standings": lambda s: team_standings(s["points"]["Team"]),
+    **{
+        analysis: lambda s, analysis=analysis: team_chart_data(analysis, s["season"].race, s["counts"], s["points"], s["form"])
+        for analysis in TEAM_CHARTS
+    },
+}
+
+
+def _draw(season, group, analysis):
+    # a function drawing one chart of the analysis on its precomputed data
+    if group == "Drivers":
+        data, plot, highlight = DRIVER_COMPUTE[analysis](season), plot_driver_chart, season["leader"]
+    else:
+        data, plot, highlight = TEAM_COMPUTE[analysis](season), plot_team_chart, season["leader_team"]
+    # selection charts are drawn for the whole grid
+    chosen = () if analysis in SELECTION_CHARTS else highlight
+    return lambda: plot(data, season["dimensions"], "bench", analysis, chosen, 0.3)
+
+
+@pytest.mark.parametrize("analysis", DRIVER_COMPUTE)
+def test_driver_compute(benchmark, scale, season, analysis):
+    benchmark.group = f"{scale}x Drivers compute"
+    benchmark(DRIVER_COMPUTE[analysis], season)
+
+
+@pytest.mark.parametrize("analysis", TEAM_COMPUTE)
+def test_team_compute(benchmark, scale, season, analysis):
+    benchmark.group = f"{scale}x Teams compute"
+    benchmark(TEAM_COMPUTE[analysis], season)
+
+
+CHARTS = [("Drivers", analysis) for analysis in DRIVER_CHARTS] + [("Teams", analysis) for analysis in TEAM_CHARTS]
+
+
+@pytest.mark.parametrize("group, analysis", CHARTS)
+def test_draw(benchmark, scale, season, rounds, group, analysis):
+    benchmark.group = f"{scale}x {group} draw"
+    draw = _draw(season, group, analysis)
+    # each round draws into a fresh holder; the figure is released untimed
+    benchmark.pedantic(
+        lambda drawn: drawn.append(draw()),
+        setup=lambda: (([],), {}),
+        teardown=lambda drawn: release_figure(drawn[0]),
+        rounds=rounds,
+    )
+
+
+@pytest.mark.parametrize("group, analysis", CHARTS)
+def test_png(benchmark, scale, season, rounds, group, analysis):
+    benchmark.group = f"{scale}x {group} png"
+    draw = _draw(season, group, analysis)
+    benchmark.pedantic(
+        figure_to_display_png,
+        setup=lambda: ((draw(),), {}),
+        teardown=release_figure,
+        rounds=rounds,
+    )
+
+
+# ----------------------------------
+# CROSS-SEASON HISTORY
+# ----------------------------------
+def test_history_cold(benchmark, scale, registry, rounds):
+    # first query of a fresh registry: parses every season's CSVs and writes
+    # the Arrow partitions
+    def fresh():
+        for path in registry._paths.values():
+            shutil.rmtree(os.path.join(path, CACHE_DIR), ignore_errors=True)
+        return (SeasonRegistry(registry.root),), {}
+
+    benchmark.group = f"{scale}x History compute"
+    benchmark.extra_info["seasons"] = SCALES[scale]["seasons"]
+    benchmark.pedantic(SeasonRegistry.career_wins, setup=fresh, rounds=rounds)
+
+
+HISTORY = {
+    "Career Wins": SeasonRegistry.career_wins,
+    "Points per Season": SeasonRegistry.points_per_season,
+    "Head-to-Head (All Seasons)": SeasonRegistry.head_to_head,
+}
+
+
+@pytest.mark.parametrize("analysis", HISTORY)
+def test_history(benchmark, scale, registry, analysis):
+    benchmark.group = f"{scale}x History compute"
+    benchmark.extra_info["seasons"] = SCALES[scale]["seasons"]
+    benchmark(HISTORY[analysis], registry)
@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use("Agg")
+import pandas as pd
+from streamlit.dataframe_util import convert_anything_to_arrow_bytes
+
+from analytics import (
+    DRIVER_CHARTS, HIGHLIGHT_CHARTS, SELECTION_CHARTS, TEAM_CHARTS,
+    build_counts, build_form_tables, build_points_tables, build_position_tables, build_results, driver_chart_data,
+    driver_standings, team_chart_data, team_standings,
+)
+from charts import plot_driver_chart, plot_team_chart
+from dimensions import build_dimensions
+from figures import release_figure
+from render_cache import figure_to_display_png
+from revision import current_commit
+from store import build_season
+from synthetic import SCALES, make_season
+from vega_charts import driver_chart_spec, team_chart_spec
+
+
+# ----------------------------------
+# SERVER CPU PER CHART VIEW
+# ----------------------------------
+# matplotlib = chart data + figure + PNG encoding (a render cache miss)
+# vega       = chart data + Vega-Lite spec + what Streamlit serializes for it
+#              (spec JSON and the Arrow-encoded frame)
+#
+# Highlight charts are viewed once per highlight option, like a user paging
+# through drivers. CPU time (time.process_time) is what the server pays; the
+# browser's drawing time in vega mode is not included.
+OPACITY = 0.3
+
+
+def _matplotlib_view(data, plot, dimensions, analysis, highlight):
+    fig = plot(data, dimensions, "bench", analysis, highlight, OPACITY)
+    try:
+        return len(figure_to_display_png(fig))
+    finally:
+        release_figure(fig)
+
+
+def _vega_view(data, spec_fn, dimensions, analysis, highlight):
+    frame, spec = spec_fn(data, dimensions, "bench", analysis, highlight, OPACITY)
+    return len(json.dumps(spec)) + len(convert_anything_to_arrow_bytes(frame))
+
+
+def bench_modes(results, scale, repeat):
+    shape = SCALES[scale]
+    season = build_season(**make_season(shape["rounds"], shape["drivers"]))
+    table = build_results(season.race, season.sprint)
+    countTables = build_counts(table)
+    pointsTables = build_points_tables(table)
+    positionTables = build_position_tables(table)
+    formTables = build_form_tables(table, pointsTables)
+    dimensions = build_dimensions(season, table)
+
+    drivers = list(driver_standings(pointsTables["Driver"])["Driver"].head(10))
+    teams = list(team_standings(pointsTables["Team"])["Team"])
+
+    for group, charts, chart_data, plot, spec_fn, options in (
+        ("Drivers", DRIVER_CHARTS, lambda a: driver_chart_data(a, season.race, countTables, pointsTables, positionTables, formTables),
+         plot_driver_chart, driver_chart_spec, drivers),
+        ("Teams", TEAM_CHARTS, lambda a: team_chart_data(a, season.race, countTables, pointsTables, formTables),
+         plot_team_chart, team_chart_spec, teams),
+    ):
+        for analysis in charts:
+            highlights = options if analysis in HIGHLIGHT_CHARTS else options[:1]
+            if analysis in SELECTION_CHARTS:
+                highlights = [(), tuple(options)]
+
+            for mode, view, target in (
+                ("matplotlib", _matplotlib_view, plot),
+                ("vega", _vega_view, spec_fn),
+            ):
+                samples, payload = [], 0
+                for _ in range(repeat):
+                    for highlight in highlights:
+                        start = time.process_time()
+                        payload = view(chart_data(analysis), target, dimensions, analysis, highlight)
+                        samples.append(time.process_time() - start)
+
+                results.append({
+                    "scale": scale,
+                    "group": group,
+                    "analysis": analysis,
+                    "mode": mode,
+                    "views": len(samples),
+                    "cpu_median_s": statistics.median(samples),
+                    "cpu_total_s": sum(samples),
+                    "payload_bytes": payload,
+                })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server CPU per chart view: matplotlib PNG vs client-side Vega-Lite.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], choices=sorted(SCALES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="default: benchmarks/results/chart-modes-<commit>.json")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in args.scales:
+        bench_modes(results, scale, args.repeat)
+
+    by_view = {}
+    for r in results:
+        by_view.setdefault((r["scale"], r["group"], r["analysis"]), {})[r["mode"]] = r
+    for (scale, group, analysis), modes in by_view.items():
+        mpl, vega = modes["matplotlib"], modes["vega"]
+        print(
+            f"{scale:>5}x  {group:<8} {analysis:<28}"
+            f"{mpl['cpu_median_s'] * 1000:>9.2f}ms {mpl['payload_bytes'] / 1024:>7.1f}KB"
+            f"{vega['cpu_median_s'] * 1000:>9.2f}ms {vega['payload_bytes'] / 1024:>7.1f}KB"
+            f"  x{mpl['cpu_median_s'] / max(vega['cpu_median_s'], 1e-9):.1f}"
+        )
+
+    commit = current_commit()
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"chart-modes-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "matplotlib": matplotlib.__version__,
+            "machine": platform.platform(),
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=1)
+    print(f"wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+BENCH = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH)
+sys.path[:0] = [ROOT, BENCH]
+
+from analytics import (
+    build_counts, build_form_tables, build_points_tables, build_position_tables, build_results,
+    driver_standings, team_standings,
+)
+from dimensions import build_dimensions
+from seasons import SeasonRegistry
+from store import build_season
+from synthetic import SCALES, make_season, write_seasons
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--scales", default="1,10,100",
+        help=f"comma-separated multiples of the 2025 data to time (of {', '.join(map(str, SCALES))})",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "scale" in metafunc.fixturenames:
+        scales = [int(scale) for scale in metafunc.config.getoption("--scales").split(",")]
+        metafunc.parametrize("scale", scales, ids=[f"{scale}x" for scale in scales])
+
+
+@pytest.fixture
+def rounds(request):
+    # rounds of the pedantic (draw / png) benchmarks, which are too slow to
+    # calibrate: the same --benchmark-min-rounds the other benchmarks use
+    return request.config.getoption("--benchmark-min-rounds")
+
+
+# ----------------------------------
+# SYNTHETIC SEASONS (BUILT ONCE PER SCALE)
+# ----------------------------------
+_seasons = {}
+_registries = {}
+
+
+@pytest.fixture
+def season(scale):
+    # the synthetic season's frames plus every table an analysis reads
+    if scale not in _seasons:
+        shape = SCALES[scale]
+        frames = make_season(shape["rounds"], shape["drivers"])
+        season = build_season(**frames)
+        table = build_results(season.race, season.sprint)
+        points = build_points_tables(table)
+        _seasons[scale] = {
+            "frames": frames,
+            "season": season,
+            "table": table,
+            "counts": build_counts(table),
+            "points": points,
+            "positions": build_position_tables(table),
+            "form": build_form_tables(table, points),
+            "dimensions": build_dimensions(season, table),
+            "leader": driver_standings(points["Driver"])["Driver"].iloc[0],
+            "leader_team": team_standings(points["Team"])["Team"].iloc[0],
+        }
+    return _seasons[scale]
+
+
+@pytest.fixture(scope="session")
+def history_root():
+    with tempfile.TemporaryDirectory() as root:
+        yield root
+
+
+@pytest.fixture
+def registry(scale, history_root):
+    # a SeasonRegistry over SCALES[scale]["seasons"] synthetic seasons
+    if scale not in _registries:
+        root = os.path.join(history_root, f"{scale}x")
+        write_seasons(root, scale)
+        _registries[scale] = SeasonRegistry(root)
+    return _registries[scale]
@@ -0,0 +1,184 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import websockets
+
+from rerun_latency import Session, _free_port, _wait_until_up, run_server
+from revision import current_commit
+from synthetic import SCALES, write_seasons
+
+
+# ----------------------------------
+# CONCURRENT USERS LOAD TEST
+# ----------------------------------
+# Starts `streamlit run app.py` headless (a fresh server per level) on the
+# app's own season plus synthetic older seasons, then lets N simulated users
+# connect at once over the browser's websocket protocol. Each user clicks
+# through every category and every analysis of it, the options read from
+# the page itself. Per level: reruns per second, p50 / p95 / p99 rerun
+# latency (widget change -> script finished), the slowest views, peak server
+# RSS and any exceptions shown on a page.
+#
+#   python benchmarks/load_test.py --users 1 10 25 50
+#   python benchmarks/load_test.py --users 50 --app /path/to/other/checkout
+#
+# One user pages through everything first so caches are warm, as on a
+# server that has been up for a while (--cold skips that).
+ANALYSIS_SELECTBOX = {
+    "Drivers": "Driver Analysis",
+    "Teams": "Team Analysis",
+    "History": "History Analysis",
+}
+
+
+def _memory_kb(pid):
+    fields = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                fields[key] = int(value.split()[0])
+    return fields
+
+
+async def _sample(pid, samples, stop, interval=0.05):
+    while not stop.is_set():
+        samples.append(_memory_kb(pid)["VmRSS"])
+        await asyncio.sleep(interval)
+
+
+async def _user(url, passes, think, reruns, exceptions):
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        session = Session(ws, "")
+
+        async def click(view):
+            reruns.append((view, await session.rerun()))
+            if think:
+                await asyncio.sleep(think)
+
+        await click("(page load)")
+        for _ in range(passes):
+            for category in session.options["Select Category"]:
+                session.set("Select Category", category)
+                await click(category)
+
+                selectbox = ANALYSIS_SELECTBOX.get(category)
+                for analysis in session.options.get(selectbox, []):
+                    session.set(selectbox, analysis)
+                    await click(f"{category}/{analysis}")
+        exceptions.extend(session.exceptions)
+
+
+def _percentile(samples, q):
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+async def run_level(app, env, users, passes, think, warm):
+    port = _free_port()
+    server = run_server(app, port, env)
+    try:
+        await _wait_until_up(port)
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        if warm:
+            await _user(url, 1, 0, [], [])
+        rss_start = _memory_kb(server.pid)["VmRSS"]
+
+        reruns, exceptions, rss, stop = [], [], [], asyncio.Event()
+        sampler = asyncio.create_task(_sample(server.pid, rss, stop))
+        start = time.perf_counter()
+        await asyncio.gather(*(_user(url, passes, think, reruns, exceptions) for _ in range(users)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await sampler
+        memory = _memory_kb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    samples = sorted(seconds for _, seconds in reruns)
+    by_view = {}
+    for view, seconds in reruns:
+        by_view.setdefault(view, []).append(seconds)
+    slowest = sorted(
+        ((view, _percentile(sorted(s), 0.95)) for view, s in by_view.items()),
+        key=lambda item: item[1], reverse=True,
+    )[:5]
+
+    return {
+        "users": users,
+        "reruns": len(samples),
+        "seconds": elapsed,
+        "reruns_per_s": len(samples) / elapsed,
+        "p50_ms": _percentile(samples, 0.50) * 1000,
+        "p95_ms": _percentile(samples, 0.95) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+        "max_ms": samples[-1] * 1000,
+        "rss_start_mb": rss_start / 1024,
+        "rss_peak_mb": max(rss + [memory["VmRSS"]]) / 1024,
+        "hwm_mb": memory["VmHWM"] / 1024,
+        "exceptions": len(exceptions),
+        "exception_messages": sorted(set(exceptions))[:10],
+        "slowest_p95_ms": {view: p95 * 1000 for view, p95 in slowest},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test of the dashboard.")
+    parser.add_argument("--app", default=ROOT, help="checkout holding app.py (default: this one)")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--passes", type=int, default=1, help="times each user clicks through every view")
+    parser.add_argument("--think", type=float, default=0.0, help="seconds a user waits between clicks")
+    parser.add_argument("--scale", type=int, default=100, choices=sorted(SCALES), help="synthetic older seasons (benchmarks/synthetic.py)")
+    parser.add_argument("--turnover", type=int, default=20, help="drivers replaced per synthetic season")
+    parser.add_argument("--charts", default="matplotlib", choices=["matplotlib", "vega"])
+    parser.add_argument("--cold", action="store_true", help="skip the warm-up user")
+    parser.add_argument("--output", help="default: benchmarks/results/load-test-<commit>.json")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as data_root:
+        write_seasons(data_root, args.scale, turnover=args.turnover)
+        env = {
+            **os.environ,
+            "F1_SEASONS_DIR": os.path.join(data_root, "seasons"),
+            "F1_CHART_MODE": args.charts,
+            "F1_WATCH_INTERVAL": "0",
+        }
+        for users in args.users:
+            r = asyncio.run(run_level(os.path.abspath(args.app), env, users, args.passes, args.think, not args.cold))
+            results.append(r)
+            print(
+                f"{users:>4} users  {r['reruns_per_s']:>6.1f} reruns/s"
+                f"  p50 {r['p50_ms']:>7.0f}ms  p95 {r['p95_ms']:>7.0f}ms  p99 {r['p99_ms']:>7.0f}ms"
+                f"  peak RSS {r['rss_peak_mb']:>6.0f}MB  exceptions {r['exceptions']}"
+            )
+
+    commit = current_commit()
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"load-test-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "app": os.path.abspath(args.app),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "cpus": os.cpu_count(),
+            "options": {key: value for key, value in vars(args).items() if key not in ("app", "output")},
+            "results": results,
+        }, f, indent=1)
+    print(f"wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
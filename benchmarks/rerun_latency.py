@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from revision import current_commit
+
+
+# ----------------------------------
+# END-TO-END RERUN LATENCY
+# ----------------------------------
+# Starts `streamlit run app.py` headless and drives it over the same
+# websocket protocol the browser uses: time from sending a widget change to
+# the server's "script finished" message, i.e. everything the server does
+# for one slider step. Widgets rendered inside an st.fragment are rerun as
+# that fragment only, exactly like the browser does.
+#
+#   python benchmarks/rerun_latency.py --charts matplotlib vega
+#
+# --app points at another checkout to measure a "before" tree.
+SCENARIOS = (
+    # (category, analysis selectbox, analysis, fade slider)
+    ("Drivers", "Driver Analysis", "Points Progression", "Fade Other Drivers"),
+    ("Drivers", "Driver Analysis", "Finish Positions (Top 10)", "Fade Other Drivers"),
+    ("Teams", "Team Analysis", "Points Progression", "Fade Other Teams"),
+)
+FADES = (0.1, 0.2, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 0.3)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Session:
+
+    def __init__(self, ws, query_string):
+        self.ws = ws
+        self.query_string = query_string
+        self.widgets = {}
+        self.options = {}
+        self.states = {}
+        self.exceptions = []
+
+    async def rerun(self, fragment_id=""):
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = self.query_string
+        state.fragment_id = fragment_id
+        state.widget_states.widgets.extend(self.states.values())
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                element_type = element.WhichOneof("type")
+                widget = getattr(element, element_type)
+                if element_type == "exception":
+                    self.exceptions.append(widget.message)
+                elif getattr(widget, "label", None) and getattr(widget, "id", None):
+                    self.widgets[widget.label] = (widget.id, fwd.delta.fragment_id)
+                    if element_type in ("selectbox", "radio"):
+                        self.options[widget.label] = list(widget.options)
+            elif kind == "script_finished":
+                return time.perf_counter() - start
+
+    def set(self, label, value):
+        widget_id, _ = self.widgets[label]
+        state = self.states[label] = WidgetState(id=widget_id)
+        if isinstance(value, float):
+            state.double_array_value.data.append(value)
+        else:
+            state.string_value = value
+
+    def fragment_of(self, label):
+        return self.widgets[label][1]
+
+
+async def measure(url, query_string, repeat):
+    results = []
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        session = Session(ws, query_string)
+        await session.rerun()
+
+        for category, selectbox, analysis, slider in SCENARIOS:
+            session.set("Select Category", category)
+            await session.rerun()
+            session.set(selectbox, analysis)
+            await session.rerun()
+
+            fragment = session.fragment_of(slider)
+            # first pass renders every fade once, later passes can hit caches
+            for rep in range(repeat + 1):
+                samples = []
+                for fade in FADES:
+                    session.set(slider, fade)
+                    samples.append(await session.rerun(fragment))
+                results.append({
+                    "view": f"{category}/{analysis}",
+                    "pass": "cold" if rep == 0 else "warm",
+                    "fragment": bool(fragment),
+                    "samples": samples,
+                })
+    return results
+
+
+def run_server(app, port, env):
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", os.path.join(app, "app.py"),
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=app, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_until_up(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"streamlit did not start on port {port}")
+
+
+async def bench(app, chart_modes, repeat):
+    results = []
+    for mode in chart_modes:
+        port = _free_port()
+        server = run_server(app, port, {**os.environ, "F1_CHART_MODE": mode})
+        try:
+            await _wait_until_up(port)
+            for r in await measure(f"ws://127.0.0.1:{port}/_stcore/stream", "", repeat):
+                results.append({"charts": mode, **r})
+        finally:
+            server.terminate()
+            server.wait()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end rerun latency of a fade slider step.")
+    parser.add_argument("--app", default=ROOT, help="checkout holding app.py (default: this one)")
+    parser.add_argument("--charts", nargs="+", default=["matplotlib"], choices=["matplotlib", "vega"])
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--output", help="default: benchmarks/results/rerun-latency-<commit>.json")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(bench(os.path.abspath(args.app), args.charts, args.repeat))
+
+    summary = {}
+    for r in results:
+        summary.setdefault((r["charts"], r["view"], r["pass"], r["fragment"]), []).extend(r["samples"])
+    for (mode, view, phase, fragment), samples in summary.items():
+        print(
+            f"{mode:<11} {view:<36} {phase:<5} {'fragment' if fragment else 'full':<9}"
+            f"p50 {statistics.median(samples) * 1000:>8.1f}ms  max {max(samples) * 1000:>8.1f}ms"
+        )
+
+    commit = current_commit()
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"rerun-latency-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "app": os.path.abspath(args.app),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "results": results,
+        }, f, indent=1)
+    print(f"wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
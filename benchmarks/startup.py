@@ -0,0 +1,186 @@
+import argparse
+import ast
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import websockets
+
+from rerun_latency import Session, _free_port, _wait_until_up, run_server
+from revision import current_commit
+
+
+# ----------------------------------
+# COLD START
+# ----------------------------------
+# Two numbers a freshly scaled-out instance is judged by:
+#
+#   imports      each module app.py imports at the top, timed in order in a
+#                fresh interpreter, and whether matplotlib got loaded
+#   first paint  a fresh `streamlit run app.py` per category: process start
+#                to port open, the first page load, then switching to the
+#                category (and, for Drivers / Teams, opening a chart)
+#
+#   python benchmarks/startup.py --repeat 3
+#   python benchmarks/startup.py --app /path/to/other/checkout
+#
+# One server is started and thrown away first, so every measured start
+# finds the Arrow cache of the season CSVs already written.
+CATEGORIES = ("Overview", "Drivers", "Teams", "Engine")
+
+# category -> (analysis selectbox, first chart opened after the category)
+FIRST_CHART = {
+    "Drivers": ("Driver Analysis", "Race Winner Counts"),
+    "Teams": ("Team Analysis", "Team Podium Counts"),
+}
+
+HEAVY_MODULES = ("pandas", "pyarrow", "matplotlib")
+
+IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+timings = []
+for name in sys.argv[2:]:
+    start = time.perf_counter()
+    __import__(name)
+    timings.append((name, time.perf_counter() - start))
+print(json.dumps({
+    "modules": timings,
+    "loaded": {m: m in sys.modules for m in %r},
+}))
+""" % (HEAVY_MODULES,)
+
+
+def top_level_imports(app):
+    # modules app.py imports at module level, in order (imports inside the
+    # routing branches are lazy and left out)
+    with open(os.path.join(app, "app.py")) as f:
+        tree = ast.parse(f.read())
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+def measure_imports(app):
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE, app, *top_level_imports(app)],
+        cwd=app, capture_output=True, text=True, check=True,
+    )
+    probe = json.loads(out.stdout)
+    return {
+        "process_s": time.perf_counter() - start,
+        "imports_s": sum(seconds for _, seconds in probe["modules"]),
+        "modules": probe["modules"],
+        "loaded": probe["loaded"],
+    }
+
+
+async def first_paint(app, env, category):
+    port = _free_port()
+    spawned = time.perf_counter()
+    server = run_server(app, port, env)
+    try:
+        await _wait_until_up(port)
+        ready = time.perf_counter() - spawned
+        async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+            session = Session(ws, "")
+            page = await session.rerun()
+
+            switch = 0.0
+            if category != "Overview":
+                session.set("Select Category", category)
+                switch = await session.rerun()
+
+            chart = None
+            if category in FIRST_CHART:
+                selectbox, analysis = FIRST_CHART[category]
+                session.set(selectbox, analysis)
+                chart = await session.rerun()
+            painted = time.perf_counter() - spawned
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "category": category,
+        "ready_s": ready,
+        "page_load_s": page,
+        "category_s": switch,
+        "first_chart_s": chart,
+        "to_category_s": ready + page + switch,
+        "total_s": painted,
+        "exceptions": session.exceptions,
+    }
+
+
+def _median(runs, field):
+    values = [r[field] for r in runs if r[field] is not None]
+    return statistics.median(values) if values else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import time and time to first paint per category of a cold app.")
+    parser.add_argument("--app", default=ROOT, help="checkout holding app.py (default: this one)")
+    parser.add_argument("--repeat", type=int, default=3, help="cold starts per category")
+    parser.add_argument("--charts", default="matplotlib", choices=["matplotlib", "vega"])
+    parser.add_argument("--output", help="default: benchmarks/results/startup-<commit>.json")
+    args = parser.parse_args(argv)
+
+    app = os.path.abspath(args.app)
+    env = {**os.environ, "F1_CHART_MODE": args.charts, "F1_WATCH_INTERVAL": "0"}
+
+    imports = [measure_imports(app) for _ in range(args.repeat)]
+    print(
+        f"imports   {statistics.median(r['imports_s'] for r in imports) * 1000:>7.0f}ms"
+        f"  (process {statistics.median(r['process_s'] for r in imports) * 1000:.0f}ms)"
+        f"  loaded: {', '.join(m for m, on in imports[0]['loaded'].items() if on) or '-'}"
+    )
+
+    asyncio.run(first_paint(app, env, "Overview"))
+    paints = []
+    for category in CATEGORIES:
+        runs = [asyncio.run(first_paint(app, env, category)) for _ in range(args.repeat)]
+        paints.extend(runs)
+        chart = _median(runs, "first_chart_s")
+        print(
+            f"{category:<9} ready {_median(runs, 'ready_s') * 1000:>6.0f}ms"
+            f"  page load {_median(runs, 'page_load_s') * 1000:>6.0f}ms"
+            f"  category {_median(runs, 'category_s') * 1000:>6.0f}ms"
+            f"  first paint {_median(runs, 'to_category_s') * 1000:>6.0f}ms"
+            + (f"  + first chart {chart * 1000:>6.0f}ms" if chart is not None else "")
+            + f"  exceptions {sum(len(r['exceptions']) for r in runs)}"
+        )
+
+    commit = current_commit()
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"startup-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit,
+            "app": app,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "charts": args.charts,
+            "imports": imports,
+            "first_paint": paints,
+        }, f, indent=1)
+    print(f"wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
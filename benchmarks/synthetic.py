@@ -0,0 +1,160 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from store import FILES
+from seasons import SEASONS_DIR
+
+
+# ----------------------------------
+# SCALES
+# ----------------------------------
+# Multiples of the real 2025 data (24 rounds x 20 drivers x 1 season).
+# Rounds and drivers stay below 128 because Round / Starting Grid are int8.
+SCALES = {
+    1: {"rounds": 24, "drivers": 20, "seasons": 1},
+    10: {"rounds": 48, "drivers": 50, "seasons": 2},
+    100: {"rounds": 96, "drivers": 50, "seasons": 10},
+    1000: {"rounds": 120, "drivers": 100, "seasons": 40},
+}
+
+RACE_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+SPRINT_POINTS = [8, 7, 6, 5, 4, 3, 2, 1]
+
+DNF_RATE = 0.08
+SPRINT_EVERY = 4
+
+
+def _names(prefix, n, first=0):
+    return [f"{prefix} {i + 1:03d}" for i in range(first, first + n)]
+
+
+def _clock(seconds):
+    minutes, seconds = np.divmod(seconds, 60)
+    return [f"{int(m):02d}:{s:04.1f}" for m, s in zip(minutes, seconds)]
+
+
+# ----------------------------------
+# RESULT TABLES
+# ----------------------------------
+def _results(rng, tracks, drivers, teams, points, laps, fastest_lap=False):
+    rounds, n = len(tracks), len(drivers)
+
+    # one random finishing order per round
+    order = np.argsort(rng.random((rounds, n)), axis=1)
+    position = np.tile(np.arange(1, n + 1), rounds)
+    driver = order.ravel()
+
+    dnf = rng.random(rounds * n) < DNF_RATE
+    # retirements are classified at the back, like the real data
+    dnf &= position > n - 4
+
+    award = np.zeros(n, dtype=int)
+    award[:min(n, len(points))] = points[:n]
+    gap = np.round(rng.uniform(0.2, 90, rounds * n).cumsum() % 90, 3)
+
+    retired = np.char.mod("%.3f", gap).astype(object)
+    retired[gap > 80] = "+1 lap"
+    retired[dnf] = "DNF"
+    retired[position == 1] = _clock(rng.uniform(5000, 6000, rounds))
+
+    df = pd.DataFrame({
+        "Track": np.repeat(tracks, n),
+        "Position": position,
+        "No": driver + 1,
+        "Driver": np.asarray(drivers)[driver],
+        "Team": np.asarray(teams)[driver // 2],
+        "Starting Grid": rng.integers(1, n + 1, rounds * n),
+        "Laps": np.where(dnf, laps // 2, laps),
+        "Time/Retired": retired,
+        "Points": np.where(dnf, 0, np.tile(award, rounds)),
+    })
+
+    if fastest_lap:
+        fastest = rng.integers(0, n, rounds) + np.arange(rounds) * n
+        df["Set Fastest Lap"] = "No"
+        df.loc[fastest, "Set Fastest Lap"] = "Yes"
+        df["Fastest Lap Time"] = _clock(rng.uniform(75, 95, rounds * n))
+
+    return df
+
+
+# ----------------------------------
+# ONE SEASON (CSV-SHAPED FRAMES)
+# ----------------------------------
+def make_season(rounds=24, drivers=20, year=2025, seed=0, first_driver=0):
+    # Returns {"calendar", "drivers", "race", "sprint"} frames with the same
+    # columns as the repository CSVs, ready for store.build_season().
+    # first_driver shifts the roster: "Driver 001" + first_driver onwards.
+    rng = np.random.default_rng(seed)
+
+    tracks = _names("Track", rounds)
+    driver_names = _names("Driver", drivers, first_driver)
+    teams = _names("Team", (drivers + 1) // 2)
+
+    dates = pd.date_range(f"{year}-03-01", periods=rounds, freq="7D")
+    calendar = pd.DataFrame({
+        "Round": np.arange(1, rounds + 1),
+        "Race Date": dates.strftime("%d-%m-%Y"),
+        "GP Name": [f"{t} Grand Prix" for t in tracks],
+        "Country": tracks,
+        "City": tracks,
+        "Circuit Name": [f"{t} Circuit" for t in tracks],
+        "First GP": rng.integers(1950, year + 1, rounds),
+        "Number of Laps": rng.integers(44, 78, rounds),
+        "Circuit Length(km)": rng.uniform(3.3, 7.0, rounds).round(3),
+        "Race Distance(km)": rng.uniform(260, 310, rounds).round(3),
+        "Lap Record": _clock(rng.uniform(65, 105, rounds)),
+        "Record Owner": rng.choice(driver_names, rounds),
+        "Record Year": rng.integers(year - 20, year + 1, rounds),
+        "Turns": rng.integers(10, 27, rounds),
+        "DRS Zones": rng.integers(1, 5, rounds),
+    })
+
+    born = pd.Timestamp(f"{year - 20}-01-01") - pd.to_timedelta(rng.integers(0, 6000, drivers), unit="D")
+    driver_table = pd.DataFrame({
+        "Driver": driver_names,
+        "Abbreviation": [f"D{i:02d}"[-3:] for i in range(1, drivers + 1)],
+        "Race Number": np.arange(1, drivers + 1),
+        "Team": np.asarray(teams)[np.arange(drivers) // 2],
+        "Country": "Nowhere",
+        "Grand Prix Entered": rng.integers(0, 400, drivers),
+        "Career Points": rng.integers(0, 5000, drivers).astype(float),
+        "Highest Race Finish": "1(x1)",
+        "Podiums": rng.integers(0, 200, drivers),
+        "Highest Grid Position": "1(x1)",
+        "Pole Positions": rng.integers(0, 100, drivers),
+        "World Championships": rng.integers(0, 8, drivers),
+        "DNFs": rng.integers(0, 40, drivers),
+        "Date of Birth": born.strftime("%d-%m-%Y"),
+        "Place of Birth": "Nowhere",
+    })
+
+    race = _results(rng, tracks, driver_names, teams, RACE_POINTS, 57, fastest_lap=True)
+    sprint = _results(rng, tracks[1::SPRINT_EVERY], driver_names, teams, SPRINT_POINTS, 19)
+
+    return {"calendar": calendar, "drivers": driver_table, "race": race, "sprint": sprint}
+
+
+# ----------------------------------
+# SEASON TREES ON DISK
+# ----------------------------------
+def write_season(frames, data_dir):
+    os.makedirs(data_dir, exist_ok=True)
+    for key, name in FILES.items():
+        frames[key].to_csv(os.path.join(data_dir, name), index=False)
+
+
+def write_seasons(root, scale=1, seed=0, turnover=0):
+    # Lays out a SeasonRegistry tree: the newest season in root, the rest
+    # in root/seasons/<year>/. turnover drivers leave (and new ones join)
+    # each season going back, for all-time tables with many drivers.
+    shape = SCALES[scale]
+    last = 2025
+    for i in range(shape["seasons"]):
+        year = last - i
+        frames = make_season(shape["rounds"], shape["drivers"], year, seed + i, i * turnover)
+        data_dir = root if year == last else os.path.join(root, SEASONS_DIR, str(year))
+        write_season(frames, data_dir)
+    return root
@@ -0,0 +1,210 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+from analytics import DRIVER_CHARTS, FORM_CHARTS, FORM_WINDOW, HIGHLIGHT_CHARTS, SELECTION_CHARTS, TEAM_CHARTS
+from seasons import SeasonRegistry
+
+
+# ----------------------------------
+# PRE-RENDERED CHART BUNDLE
+# ----------------------------------
+# Every chart view the public dashboard can show is rendered once, in
+# parallel, into static/bundle/: one content-hashed PNG per distinct image
+# plus index.json (view -> file, and the data versions it was drawn from).
+# A view is season x category x analysis x highlight x fade, the fade
+# quantized to the slider's 0.1 steps:
+#
+#   python bundle.py build --workers 8
+#   F1_CHART_MODE=snapshot streamlit run serve.py
+#
+# In snapshot mode the chart panel shows the bundled file by URL, so a click
+# costs no pandas or matplotlib work and the browser can cache the image
+# for good. Views missing from the bundle (a multi-driver selection, a
+# season or round added since the build) are rendered live as usual.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_DIR = os.path.join(ROOT, "static", "bundle")
+INDEX = os.path.join(BUNDLE_DIR, "index.json")
+BUNDLE_URL = "/app/static/bundle/"
+
+# the fade slider's values (chart_panel.py); unfaded charts use 1.0. Form
+# charts are bundled at the default window only.
+OPACITIES = tuple(round(0.1 * step, 1) for step in range(1, 11))
+HIGHLIGHTS_PER_JOB = 4
+
+
+def _view(category, analysis, highlight, opacity, params=()):
+    # one string per view; selections (tuples) and highlights stay distinct,
+    # params (the form window) are appended when a chart has them
+    if isinstance(highlight, tuple):
+        highlight = list(highlight)
+    return json.dumps([category, analysis, highlight, round(opacity, 1), *params], separators=(",", ":"))
+
+
+# ----------------------------------
+# LOOKUP (SNAPSHOT MODE)
+# ----------------------------------
+@lru_cache(maxsize=1)
+def _index(mtime):
+    with open(INDEX) as f:
+        return json.load(f)
+
+
+def bundle_url(season, versions, category, analysis, highlight, opacity, params=()):
+    # URL of the pre-rendered view, or None: not bundled, or bundled from
+    # other data than the tables in `versions` ((table, version) pairs)
+    try:
+        index = _index(os.path.getmtime(INDEX))
+    except OSError:
+        return None
+    entry = index["seasons"].get(str(season))
+    if entry is None or any(entry["table_versions"].get(table) != version for table, version in versions):
+        return None
+    file = entry["views"].get(_view(category, analysis, highlight, opacity, params))
+    if file is None or not os.path.isfile(os.path.join(BUNDLE_DIR, file)):
+        return None
+    return BUNDLE_URL + file
+
+
+# ----------------------------------
+# BUILD
+# ----------------------------------
+_registry = None
+
+
+def _init_worker(root):
+    global _registry
+    _registry = SeasonRegistry(root)
+
+
+def _jobs(registry, seasons, opacities):
+    for season in seasons:
+        race = registry.get(season).race
+        for category, analyses, options in (
+            ("Drivers", DRIVER_CHARTS, sorted(race["Driver"].unique())),
+            ("Teams", TEAM_CHARTS, sorted(race["Team"].unique())),
+        ):
+            for analysis in analyses:
+                if analysis in HIGHLIGHT_CHARTS:
+                    for i in range(0, len(options), HIGHLIGHTS_PER_JOB):
+                        yield season, category, analysis, options[i:i + HIGHLIGHTS_PER_JOB], opacities
+                elif analysis in SELECTION_CHARTS:
+                    # the whole field and every single entity; larger
+                    # selections fall back to live rendering
+                    yield season, category, analysis, [()] + [(option,) for option in options], (1.0,)
+                else:
+                    yield season, category, analysis, [None], (1.0,)
+
+
+def render_views(season, category, analysis, highlights, opacities):
+    # renders one job's views into BUNDLE_DIR; returns {view: file}. Views of
+    # one job share a pooled figure, so highlight / fade steps only restyle.
+    from charts import draw_driver_chart, draw_team_chart
+    from figures import release_figure
+    from render_cache import figure_to_display_png
+
+    snapshot = _registry.live(season).snapshot()
+    race = snapshot.season.race
+
+    params = (FORM_WINDOW,) if analysis in FORM_CHARTS else ()
+    views = {}
+    for highlight in highlights:
+        for opacity in opacities:
+            if category == "Drivers":
+                fig = draw_driver_chart(race, snapshot.counts, snapshot.points, snapshot.positions, snapshot.form, snapshot.dimensions, season, analysis, highlight, opacity)
+            else:
+                fig = draw_team_chart(race, snapshot.counts, snapshot.points, snapshot.form, snapshot.dimensions, season, analysis, highlight, opacity)
+            try:
+                png = figure_to_display_png(fig)
+            finally:
+                release_figure(fig)
+
+            file = f"{hashlib.sha256(png).hexdigest()[:16]}.png"
+            path = os.path.join(BUNDLE_DIR, file)
+            if not os.path.exists(path):
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(png)
+                os.replace(tmp, path)
+            views[_view(category, analysis, highlight, opacity, params)] = file
+    return views
+
+
+def _read_index():
+    try:
+        with open(INDEX) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"seasons": {}}
+
+
+def build(root, seasons=None, workers=None, opacities=OPACITIES):
+    # (re)renders `seasons` (default: all); other seasons already in the
+    # bundle keep their entries and files
+    registry = SeasonRegistry(root)
+    seasons = seasons or registry.years()
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+
+    built = time.strftime("%Y-%m-%dT%H:%M:%S")
+    index = _read_index()
+    index["built"] = built
+    index.pop("opacities", None)
+    for season in seasons:
+        index["seasons"][str(season)] = {
+            "built": built,
+            "opacities": list(opacities),
+            "table_versions": dict(registry.live(season).snapshot().table_versions),
+            "views": {},
+        }
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(root,)) as pool:
+        futures = {
+            pool.submit(render_views, *job): job[0]
+            for job in _jobs(registry, seasons, opacities)
+        }
+        for future in as_completed(futures):
+            index["seasons"][str(futures[future])]["views"].update(future.result())
+
+    tmp = f"{INDEX}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp, INDEX)
+
+    # drop files no season of the bundle refers to any more
+    current = {file for entry in index["seasons"].values() for file in entry["views"].values()}
+    current.add(os.path.basename(INDEX))
+    for file in os.listdir(BUNDLE_DIR):
+        if file not in current:
+            os.remove(os.path.join(BUNDLE_DIR, file))
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render every chart view into a static bundle.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_parser = sub.add_parser("build", help="render every view and write static/bundle/index.json")
+    build_parser.add_argument("--root", default=".", help="repository root holding the season CSVs")
+    build_parser.add_argument("--seasons", type=int, nargs="+", help="default: every season found")
+    build_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    build_parser.add_argument("--opacities", type=float, nargs="+", default=list(OPACITIES), help="fade values bundled for highlight charts")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = build(args.root, args.seasons, args.workers, tuple(round(o, 1) for o in args.opacities))
+    views = sum(len(entry["views"]) for entry in index["seasons"].values())
+    files = {file for entry in index["seasons"].values() for file in entry["views"].values()}
+    size = sum(os.path.getsize(os.path.join(BUNDLE_DIR, file)) for file in files)
+    print(
+        f"{views} views in {len(files)} files ({size / 1024 / 1024:.1f} MB) "
+        f"for {len(index['seasons'])} season(s) in {time.perf_counter() - start:.1f}s -> {BUNDLE_DIR}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import streamlit as st
+
+from analytics import HIGHLIGHT_CHARTS, SELECTION_CHARTS
+from bundle import bundle_url
+from timing import ENABLED as TIMING_ENABLED, finish_rerun, rerun_active, set_view, span, start_rerun
+from vega_charts import driver_chart_spec, team_chart_spec
+
+
+# ----------------------------------
+# CHART FRAGMENT
+# ----------------------------------
+# Every driver / team chart is an st.fragment that owns its highlight and
+# fade controls. Changing them reruns this function only: page CSS, the
+# sidebar, data loading and the chart data (computed by the caller and kept
+# by Streamlit between fragment reruns) are all skipped, leaving the restyle
+# plus PNG encoding (or the Vega-Lite spec).
+SPECS = {
+    "Drivers": driver_chart_spec,
+    "Teams": team_chart_spec,
+}
+
+
+def _plot(category):
+    # charts.py (and matplotlib behind it) is imported by the first
+    # server-rendered chart; vega mode never loads it
+    from charts import plot_driver_chart, plot_team_chart
+    return plot_driver_chart if category == "Drivers" else plot_team_chart
+
+CONTROLS = {
+    "Drivers": ("Highlight Driver", "Fade Other Drivers"),
+    "Teams": ("Highlight Team", "Fade Other Teams"),
+}
+
+SELECTION_LABELS = {
+    "Drivers": "Drivers (none selected: all)",
+    "Teams": "Teams (none selected: all)",
+}
+
+
+@st.fragment
+def render_chart_panel(category, analysis_type, data, dimensions, chartCache, season, versions, options, chartMode, params=()):
+
+    # a fragment-only rerun never reaches app.py's start_rerun(), so it is
+    # timed here as a view of its own
+    timed = not rerun_active() and (TIMING_ENABLED or bool(st.query_params.get("debug")))
+    if timed:
+        start_rerun(True)
+        set_view(f"{category}/{analysis_type}" + (f" [{chartMode}]" if chartMode != "matplotlib" else "") + " (fragment)")
+
+    highlight, opacity = None, 1.0
+    if analysis_type in HIGHLIGHT_CHARTS:
+        highlightLabel, fadeLabel = CONTROLS[category]
+        col1, col2 = st.columns(2)
+        with col1:
+            highlight = st.selectbox(highlightLabel, options)
+        with col2:
+            opacity = st.slider(fadeLabel, 0.1, 1.0, 0.3, 0.1)
+    elif analysis_type in SELECTION_CHARTS:
+        # a tuple keeps the selection usable as a render cache key
+        highlight = tuple(st.multiselect(SELECTION_LABELS[category], options))
+
+    bundled = None
+    if chartMode == "snapshot":
+        bundled = bundle_url(season, versions, category, analysis_type, highlight, opacity, params)
+
+    if chartMode == "vega":
+        with span("draw"):
+            frame, spec = SPECS[category](data, dimensions, season, analysis_type, highlight, opacity)
+        with span("display"):
+            st.vega_lite_chart(frame, spec, use_container_width=True, theme=None)
+
+    elif bundled:
+        # pre-rendered by bundle.py: the browser fetches (and caches) the file
+        with span("display"):
+            st.image(bundled, use_container_width=True)
+
+    else:
+        # served from the shared render cache; a repeat view skips matplotlib
+        # entirely. params: settings the chart data was computed with (the
+        # form window), after season / versions so invalidation still finds them
+        key = (category, analysis_type, highlight, opacity, season, versions, params)
+
+        def draw():
+            with span("draw"):
+                return _plot(category)(data, dimensions, season, analysis_type, highlight, opacity)
+
+        with span("chart"):
+            png = chartCache.get_or_render(key, draw)
+
+        with span("display"):
+            st.image(png, use_container_width=True)
+
+    if timed:
+        _, breakdown = finish_rerun()
+        st.caption("⏱️ Chart rerun – " + " · ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in breakdown))
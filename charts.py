@@ -0,0 +1,860 @@
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.colors import Normalize
+
+from analytics import FORM_WINDOW, driver_chart_data, form_label, lap_clock, team_chart_data
+from dimensions import lookup
+from figures import acquire_figure, restyle_lines
+
+
+# ----------------------------------
+# DRIVER CHARTS
+# ----------------------------------
+def draw_driver_chart(raceResults, countTables, pointsTables, positionTables, formTables, dimensions, season, analysis_type, highlight_driver, opacity, window=FORM_WINDOW):
+    data = driver_chart_data(analysis_type, raceResults, countTables, pointsTables, positionTables, formTables, window)
+    return plot_driver_chart(data, dimensions, season, analysis_type, highlight_driver, opacity)
+
+
+def plot_driver_chart(data, dimensions, season, analysis_type, highlight_driver, opacity):
+
+    # ----------------------------------
+    # Race Winner Counts
+    # ----------------------------------
+    if analysis_type == "Race Winner Counts":
+
+        counts = data
+
+        # nothing to count before the first round (or none of these yet)
+        if counts.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Race Winner Counts", "No race wins recorded yet this season")
+
+        rows = lookup(dimensions.drivers, counts.index)
+        colors = list(rows['Color'])
+
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (12, 5))
+        fig.patch.set_facecolor("#15151e")
+        ax.set_facecolor("#15151e")
+
+        ax.barh(
+            list(rows['Label']),
+            counts.values,
+            color=colors
+        )
+
+        for i, v in enumerate(counts.values):
+            ax.text(v - 0.15, i, v, va='center', color='white', fontsize=13)
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Race Winner Counts",
+            fontsize=16,
+            color='white',
+            pad=12
+        )
+
+        ax.set_xlabel("Number of Race Wins", fontsize=13, color='white')
+        ax.set_ylabel("Drivers", fontsize=13, color='white')
+        ax.tick_params(colors='white', labelsize=12)
+        ax.set_xlim(0, counts.values.max() + 0.5)
+        ax.grid(axis='y', alpha=0.25, linestyle='--')
+        return fig
+
+
+    # ----------------------------------
+    # Driver Podium Counts
+    # ----------------------------------
+    elif analysis_type == "Driver Podium Counts":
+
+        counts = data
+
+        # nothing to count before the first round (or none of these yet)
+        if counts.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Podium Finish Counts", "No podium finishes recorded yet this season")
+
+        rows = lookup(dimensions.drivers, counts.index)
+        colors = list(rows['Color'])
+
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (12, 6))
+
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(
+            list(rows['Label']),
+            counts.values,
+            color=colors
+        )
+
+        for i, v in enumerate(counts.values):
+            ax.text(v - 0.2, i, v, va='center', color='white', fontsize=13)
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Podium Finish Counts",
+            fontsize=16,
+            color='white',
+            pad=12
+        )
+
+        ax.set_xlabel("Number of Podium Finishes", fontsize=13, color='white')
+        ax.set_ylabel("Drivers", fontsize=13, color='white')
+
+        max_val = counts.values.max()
+        ax.set_xticks(range(0, max_val + 2, 2))
+        ax.tick_params(colors='white', labelsize=12)
+        ax.grid(axis='y', alpha=0.25, linestyle='--')
+        return fig
+
+    # ----------------------------------
+    # Current Form
+    # ----------------------------------
+    elif analysis_type == "Current Form":
+        return plot_form(data, lookup(dimensions.drivers, data.index), 'Drivers', season)
+
+    # ----------------------------------
+    # Points Progression (DRIVER)
+    # ----------------------------------
+    elif analysis_type == "Points Progression":
+            if data.empty:
+                return plot_no_data('Drivers', f"Formula 1 – {season} Season – Points Progression (Top 10 Drivers)", "No rounds raced yet this season")
+
+            tracks = list(data.columns)
+            top10 = data.index
+            lines = data.values
+            rows = lookup(dimensions.drivers, top10)
+
+            # Highlight / fade only restyle the lines of an already drawn chart
+            fig, ax, reused = acquire_figure(
+                ('Drivers', analysis_type), (14, 6),
+                signature=(season, tuple(top10), tuple(rows['Color']), tuple(tracks), lines.tobytes())
+            )
+
+            if not reused:
+                fig.patch.set_facecolor("#1E1E2B")  ##1E1E2B
+                ax.set_facecolor("#15151e")   ##15151d
+                for i, (_, row) in enumerate(rows.iterrows()):
+                    ax.plot(tracks, lines[i], color=row['Color'], label=row['Label'])
+
+                ax.set_title(
+                    f"Formula 1 – {season} Season – Points Progression (Top 10 Drivers)",
+                    color='white',
+                    fontsize=16,
+                    pad=12
+                )
+
+                ax.set_xlabel("Grand Prix", color='white', fontsize=12)
+                ax.set_ylabel("Championship Points", color='white', fontsize=12)
+                ax.set_xticks(range(len(tracks)))
+                ax.set_xticklabels(tracks, rotation=55, ha='right', fontsize=10, color='white')
+
+                max_pts = int(data.iloc[:, -1].max())
+                ax.set_yticks(range(0, max_pts + 50, 50))
+                ax.tick_params(colors='white')
+                ax.grid(alpha=0.25)
+
+                legend = ax.legend(ncol=5, fontsize=10, frameon=False, loc='upper left')
+
+                for text in legend.get_texts():
+                    text.set_color('white')
+
+            restyle_lines(ax, [
+                {
+                    'linewidth': 3 if d == highlight_driver else 1.5,
+                    'alpha': 1.0 if d == highlight_driver else opacity
+                }
+                for d in top10
+            ])
+
+            return fig
+
+    # ----------------------------------
+    # Top 10 Finish Counts
+    # ----------------------------------
+    elif analysis_type == "Top 10 Finish Counts":
+
+        topTenFinishes = data
+
+        # nothing to count before the first round (or none of these yet)
+        if topTenFinishes.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Top 10 Finish Counts", "No top 10 finishes recorded yet this season")
+
+        rows = lookup(dimensions.drivers, topTenFinishes.index)
+        colors = list(rows['Color'])
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (11, 6.5))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(
+            list(rows['Label']),
+            topTenFinishes.values,
+            color=colors
+        )
+
+        for i, val in enumerate(topTenFinishes.values):
+            shift = 0.5 if val >= 10 else 0.35
+            ax.text(val - shift, i, val, color='white', fontsize=14, va='center')
+
+        ax.set_xlim(0, topTenFinishes.values.max() + 0.5)
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Top 10 Finish Counts",
+            color='white',
+            fontsize=16,
+            pad=12)
+
+        ax.set_xlabel("Top 10 Finishes", color='white')
+        ax.set_ylabel("Drivers", color='white')
+
+        ax.grid(False)
+        ax.tick_params(colors='white')
+        return fig
+
+
+    # ----------------------------------
+    # Fastest Lap Counts
+    # ----------------------------------
+    
+    elif analysis_type == "Fastest Lap Counts":
+
+        fastestLapCnt = data
+
+        # seasons recorded before fastest laps were tracked have none
+        if fastestLapCnt.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Fastest Lap Counts", "No fastest laps recorded for this season")
+
+        rows = lookup(dimensions.drivers, fastestLapCnt.index)
+        colors = list(rows['Color'])
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (11, 5))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(list(rows['Label']),
+            fastestLapCnt.values,
+            color=colors
+        )
+
+        for i, val in enumerate(fastestLapCnt.values):
+            ax.text(val - 0.15, i, val, color='white', fontsize=14, va='center')
+
+        ax.set_xlim(0, fastestLapCnt.values.max() + 0.3)
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Fastest Lap Counts",
+            color='white',
+            fontsize=16,
+            pad=12
+        )
+
+        ax.set_xlabel("Fastest Laps", color='white')
+        ax.set_ylabel("Drivers", color='white')
+        ax.tick_params(colors='white')
+        ax.grid(axis='y', alpha=0.3)
+        return fig
+
+    # ----------------------------------
+    # DNFs by Drivers
+    # ----------------------------------
+
+    elif analysis_type == "DNFs by Drivers":
+
+        DNFdriver = data
+
+        # nothing to count before the first round (or none of these yet)
+        if DNFdriver.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – DNFs by Drivers", "No DNFs recorded yet this season")
+
+        rows = lookup(dimensions.drivers, DNFdriver.index)
+        colors = list(rows['Color'])
+
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (11, 7))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(list(rows['Label']),
+            DNFdriver.values,
+            color=colors
+        )
+
+        for i, v in enumerate(DNFdriver.values):
+            ax.text(v - 0.18, i + 0.21, v, color='white',fontsize=14)
+
+        ax.set_xlim(0, DNFdriver.values.max() + 0.3)
+        ax.set_title(
+            f"Formula 1 – {season} Season – DNFs by Drivers",
+            color='white',
+            fontsize=16
+        )
+        ax.set_xlabel("DNFs", color='white')
+        ax.tick_params(colors='white')
+        ax.grid(axis='y', alpha=0.3)
+        return fig
+
+    # ----------------------------------
+    # Finish Positions (Top 10)
+    # ----------------------------------
+
+    elif analysis_type == "Finish Positions (Top 10)":
+
+        if data.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Race Finish Positions (Top 10 Drivers)", "No rounds raced yet this season")
+
+        driverOrder = data.index
+        trackOrder = list(data.columns)
+        positions = data.to_numpy(dtype=float)
+        rows = lookup(dimensions.drivers, driverOrder)
+
+        fig, ax, reused = acquire_figure(
+            ('Drivers', analysis_type), (16, 7),
+            signature=(season, tuple(driverOrder), tuple(rows['Color']), tuple(trackOrder), positions.tobytes())
+        )
+
+        if not reused:
+
+            fig.patch.set_facecolor('#15151e')
+            ax.set_facecolor('#15151e')
+
+            ax.set_xlim(-0.2, len(trackOrder) - 0.3)
+            ax.set_ylim(20.2, 0.75)
+
+            for i, (_, row) in enumerate(rows.iterrows()):
+
+                linestyle = '--' if row['Abbreviation'] in ['PIA', 'VER', 'NOR'] else '-'
+
+                ax.plot(trackOrder, positions[i], color=row['Color'], marker='o',
+                    linestyle=linestyle,
+                    label=row['Label']
+                )
+
+            ax.set_title(
+                f"Formula 1 – {season} Season – Race Finish Positions (Top 10 Drivers)",
+                fontsize=18,
+                color='white'
+            )
+            ax.set_xlabel("Tracks", fontsize=13, color='white')
+            ax.set_ylabel("Finish Position", fontsize=13, color='white')
+
+            ax.set_xticks(range(len(trackOrder)))
+            ax.set_xticklabels(trackOrder, rotation=55, fontsize=10, color='white')
+            ax.set_yticks(range(1, 21))
+            ax.tick_params(colors='white')
+
+            legend = ax.legend(loc='upper center',
+                bbox_to_anchor=(0.5, -0.31),
+                ncol=5,
+                fontsize=11,
+                frameon=False
+            )
+
+            for text in legend.get_texts():text.set_color('white')
+
+            ax.grid(alpha=0.2)
+            fig.subplots_adjust(bottom=0.30)
+
+        restyle_lines(ax, [
+            {
+                'markersize': 9 if driver == highlight_driver else 6,
+                'linewidth': 3 if driver == highlight_driver else 1.5,
+                'alpha': 1.0 if driver == highlight_driver else opacity
+            }
+            for driver in driverOrder
+        ])
+
+        return fig
+
+    # ----------------------------------
+    # Finish Position Heatmap
+    # ----------------------------------
+
+    elif analysis_type == "Finish Position Heatmap":
+
+        if data.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Race Finish Positions (All Drivers)", "No rounds raced yet this season")
+
+        # the whole grid is one image: a single artist however many drivers
+        rows = lookup(dimensions.drivers, data.index)
+        trackOrder = list(data.columns)
+        positions = data.to_numpy(dtype=float)
+
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (16, 9))
+        fig.patch.set_facecolor('#15151e')
+        # masked cells let the axes show through: no classified finish
+        ax.set_facecolor('#3a3a48')
+
+        lastPlace = int(np.nanmax(positions, initial=20))
+        image = ax.imshow(
+            np.ma.masked_invalid(positions),
+            cmap=colormaps['viridis_r'],
+            vmin=1,
+            vmax=lastPlace,
+            aspect='auto',
+            interpolation='nearest'
+        )
+
+        colorbar = fig.colorbar(image, ax=ax, pad=0.01)
+        colorbar.set_label("Finish Position", color='white')
+        colorbar.set_ticks([1] + list(range(5, lastPlace + 1, 5)))
+        colorbar.ax.yaxis.set_tick_params(colors='white')
+        colorbar.ax.invert_yaxis()
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Race Finish Positions (All Drivers)",
+            fontsize=18,
+            color='white'
+        )
+        ax.set_xlabel("Tracks (grey: DNF / DSQ / NC / DNS or did not race)", fontsize=13, color='white')
+
+        ax.set_xticks(range(len(trackOrder)))
+        ax.set_xticklabels(trackOrder, rotation=55, ha='right', fontsize=10, color='white')
+        ax.set_yticks(range(len(rows)))
+        ax.set_yticklabels(list(rows['Label']), fontsize=min(10, 400 / max(len(rows), 1)), color='white')
+        ax.tick_params(colors='white')
+        fig.subplots_adjust(bottom=0.2)
+        return fig
+
+    # ----------------------------------
+    # Positions Gained
+    # ----------------------------------
+
+    elif analysis_type == "Positions Gained":
+
+        # the selected drivers' rows are summed first, so the chart is one
+        # bar per positions-gained value whatever the selection
+        selection = list(highlight_driver or [])
+        picked = data[data.index.isin(selection)] if selection else data
+        counts = picked.sum()
+        gained = counts.index.to_numpy()
+        races = int(counts.sum())
+
+        if len(selection) == 1:
+            colors = list(lookup(dimensions.drivers, selection)['Color']) * len(counts)
+            who = selection[0]
+        else:
+            colors = ['#2ecc71' if g > 0 else '#e74c3c' if g < 0 else '#95a5a6' for g in gained]
+            who = f"{len(selection)} Drivers" if selection else "All Drivers"
+
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (14, 6))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.bar(gained, counts.to_numpy(), color=colors, width=0.85)
+
+        average = (gained * counts.to_numpy()).sum() / races if races else 0.0
+        if races:
+            ax.axvline(average, color='white', linestyle='--', linewidth=1)
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Positions Gained, Grid to Flag ({who}, {races} Classified Starts, Average {average:+.2f})",
+            color='white',
+            fontsize=16,
+            pad=12
+        )
+        ax.set_xlabel("Positions Gained (negative = lost)", color='white')
+        ax.set_ylabel("Races", color='white')
+        ax.tick_params(colors='white')
+        ax.grid(axis='y', alpha=0.25)
+        return fig
+
+    # ----------------------------------
+    # Gap to Winner
+    # ----------------------------------
+
+    elif analysis_type == "Gap to Winner":
+
+        if data.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Gap to Winner (Top 10 Drivers, Lead-Lap Finishes)", "No lead-lap finishes recorded yet this season")
+
+        # closest median on top
+        spread = data.iloc[::-1]
+        rows = lookup(dimensions.drivers, spread.index)
+
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (12, 6))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        stats = [
+            {
+                'label': row['Label'],
+                'whislo': s['Min'], 'q1': s['Q1'], 'med': s['Median'], 'q3': s['Q3'], 'whishi': s['Max'],
+                'fliers': [],
+            }
+            for (_, s), (_, row) in zip(spread.iterrows(), rows.iterrows())
+        ]
+
+        boxes = ax.bxp(
+            stats,
+            orientation='horizontal',
+            patch_artist=True,
+            widths=0.6,
+            medianprops={'color': 'white', 'linewidth': 2},
+            whiskerprops={'color': 'white'},
+            capprops={'color': 'white'},
+        )
+
+        for box, color in zip(boxes['boxes'], rows['Color']):
+            box.set(facecolor=color, edgecolor='white', alpha=0.85)
+
+        for i, median in enumerate(spread['Median']):
+            ax.text(median, i + 1.38, f"{median:.1f}s", color='white', fontsize=10, ha='center')
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Gap to Winner (Top 10 Drivers, Lead-Lap Finishes)",
+            color='white',
+            fontsize=16,
+            pad=12
+        )
+        ax.set_xlabel("Gap to Winner (s)", color='white')
+        ax.set_ylabel("Drivers", color='white')
+        ax.set_xlim(left=-1)
+        ax.tick_params(colors='white')
+        ax.grid(axis='x', alpha=0.25, linestyle='--')
+        return fig
+
+    # ----------------------------------
+    # Margin of Victory
+    # ----------------------------------
+
+    elif analysis_type == "Margin of Victory":
+
+        if data.empty:
+            return plot_no_data('Drivers', f"Formula 1 – {season} Season – Margin of Victory (Winner to P2)", "No race with a lead-lap runner-up yet this season")
+
+        trackOrder = [str(track) for track in data.index]
+        margins = data['Margin (s)'].to_numpy()
+        rows = lookup(dimensions.drivers, data['Winner'].astype(str))
+        average = margins.mean()
+
+        fig, ax, _ = acquire_figure(('Drivers', analysis_type), (14, 6))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.bar(trackOrder, margins, color=list(rows['Color']))
+
+        for i, (v, abbreviation) in enumerate(zip(margins, rows['Abbreviation'])):
+            ax.text(i, v + 0.3, abbreviation, color='white', fontsize=9, ha='center')
+
+        ax.axhline(average, color='white', linestyle='--', linewidth=1)
+
+        ax.set_title(
+            f"Formula 1 – {season} Season – Margin of Victory (Winner to P2, Average {average:.2f}s)",
+            color='white',
+            fontsize=16,
+            pad=12
+        )
+        ax.set_xlabel("Grand Prix", color='white')
+        ax.set_ylabel("Margin (s)", color='white')
+        ax.set_xticks(range(len(trackOrder)))
+        ax.set_xticklabels(trackOrder, rotation=55, ha='right', fontsize=10, color='white')
+        ax.tick_params(colors='white')
+        ax.grid(axis='y', alpha=0.25)
+        fig.subplots_adjust(bottom=0.25)
+        return fig
+
+
+# ----------------------------------
+# TEAM CHARTS
+# ----------------------------------
+def draw_team_chart(raceResults, countTables, pointsTables, formTables, dimensions, season, analysis_type, highlight_team, opacity, window=FORM_WINDOW):
+    data = team_chart_data(analysis_type, raceResults, countTables, pointsTables, formTables, window)
+    return plot_team_chart(data, dimensions, season, analysis_type, highlight_team, opacity)
+
+
+def plot_team_chart(data, dimensions, season, analysis_type, highlight_team, opacity):
+
+    # -----------------------------
+    # TEAM PODIUM COUNTS
+    # -----------------------------
+    if analysis_type == "Team Podium Counts":
+
+        counts = data
+
+        # nothing to count before the first round (or none of these yet)
+        if counts.empty:
+            return plot_no_data('Teams', "Podium Finish Counts (Teams)", "No podium finishes recorded yet this season")
+
+        colors = list(lookup(dimensions.teams, counts.index)['Color'])
+
+        fig, ax, _ = acquire_figure(('Teams', analysis_type), (12, 5))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(counts.index, counts.values, color=colors)
+
+        ax.set_title(
+            "Podium Finish Counts (Teams)",
+            color='white',
+            fontsize=16
+        )
+        ax.set_xlabel("Podium Finishes", color='white')
+        ax.set_ylabel("Teams", color='white')
+
+        ax.tick_params(colors='white')
+        ax.grid(axis='x', alpha=0.25)
+
+        return fig
+
+
+    # -----------------------------
+    # DNFs BY TEAM
+    # -----------------------------
+    elif analysis_type == "DNFs by Team":
+
+        counts = data
+
+        # nothing to count before the first round (or none of these yet)
+        if counts.empty:
+            return plot_no_data('Teams', "DNFs by Team", "No DNFs recorded yet this season")
+
+        colors = list(lookup(dimensions.teams, counts.index)['Color'])
+
+        fig, ax, _ = acquire_figure(('Teams', analysis_type), (12, 5))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(
+            counts.index,
+            counts.values,
+            color=colors
+        )
+
+        ax.set_title(
+            "DNFs by Team",
+            fontsize=16,
+            color='white'
+        )
+        ax.set_xlabel("Number of DNFs", color='white')
+        ax.set_ylabel("Teams", color='white')
+
+        ax.tick_params(colors='white')
+        ax.grid(axis='x', alpha=0.25)
+
+        return fig
+
+
+    # ----------------------------------
+    # DNFs per Track
+    # ----------------------------------
+
+    elif analysis_type == "DNFs per Track":
+
+        DNFtrack = data
+
+        # nothing to count before the first round (or none of these yet)
+        if DNFtrack.empty:
+            return plot_no_data('Teams', f"Formula 1 – {season} Season – DNFs by Track", "No DNFs recorded yet this season")
+
+        norm = Normalize(
+            vmin=DNFtrack.values.min(),
+            vmax=DNFtrack.values.max()
+        )
+        cmap = colormaps['Reds']
+        colors = cmap(norm(DNFtrack.values))
+
+        fig, ax, _ = acquire_figure(('Teams', analysis_type), (11, 6))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(DNFtrack.index, DNFtrack.values, color=colors, edgecolor='white')
+
+        for i, v in enumerate(DNFtrack.values):
+            ax.text(v - 0.2, i + 0.23, v, color='white', fontsize=14)
+
+        ax.set_xlim(0, DNFtrack.values.max() + 0.3)
+        ax.set_title(
+            f"Formula 1 – {season} Season – DNFs by Track",
+            color='white',
+            fontsize=16
+        )
+        ax.set_xlabel("DNFs", color='white')
+        ax.tick_params(colors='white')
+        ax.grid(axis='y', alpha=0.3)
+        return fig
+
+
+    # -----------------------------
+    # Points Progression
+    # -----------------------------
+    elif analysis_type == "Points Progression":
+
+        if data.empty:
+            return plot_no_data('Teams', "Team Points Progression (Race + Sprint)", "No rounds raced yet this season")
+
+        trackOrder = list(data.columns)
+        topTeams = data.index
+        lines = data.values
+        colors = list(lookup(dimensions.teams, topTeams)['Color'])
+
+        fig, ax, reused = acquire_figure(
+            ('Teams', analysis_type), (14, 6),
+            signature=(season, tuple(topTeams), tuple(trackOrder), lines.tobytes())
+        )
+
+        if not reused:
+
+            fig.patch.set_facecolor('#15151e')
+            ax.set_facecolor('#15151e')
+
+            for i, team in enumerate(topTeams):
+                ax.plot(trackOrder, lines[i], color=colors[i], label=team)
+
+            ax.set_title(
+                "Team Points Progression (Race + Sprint)",
+                fontsize=16,
+                color='white'
+            )
+            ax.set_xlabel("Tracks", color='white')
+            ax.set_ylabel("Points", color='white')
+
+            ax.set_xticks(range(len(trackOrder)))
+            ax.set_xticklabels(trackOrder, rotation=45, ha='right', color='white')
+
+            ax.tick_params(colors='white')
+
+            ax.grid(
+                axis='y',
+                linestyle='--',
+                linewidth=0.6,
+                color='#2a2a35',
+                alpha=0.6
+            )
+
+            legend = ax.legend(ncol=2, frameon=False)
+            for text in legend.get_texts():
+                text.set_color('white')
+
+            fig.subplots_adjust(bottom=0.25)
+
+        restyle_lines(ax, [
+            {
+                'linewidth': 3 if team == highlight_team else 1.5,
+                'alpha': 1.0 if team == highlight_team else opacity
+            }
+            for team in topTeams
+        ])
+
+        return fig
+
+
+    # -----------------------------
+    # Current Form
+    # -----------------------------
+    elif analysis_type == "Current Form":
+        return plot_form(data, lookup(dimensions.teams, data.index), 'Teams', season)
+
+    # -----------------------------
+    # Fastest Lap per Track
+    # -----------------------------
+    elif analysis_type == "Fastest Lap per Track":
+
+        # seasons recorded before lap times were tracked have none
+        if data.empty:
+            return plot_no_data('Teams', f"Formula 1 – {season} Season – Fastest Race Lap per Track", "No lap times recorded for this season")
+
+        # first round on top
+        laps = data.iloc[::-1]
+        seconds = laps['Fastest Lap (s)'].to_numpy()
+        colors = list(lookup(dimensions.teams, laps['Team'].astype(str))['Color'])
+        drivers = lookup(dimensions.drivers, laps['Driver'].astype(str))
+
+        fig, ax, _ = acquire_figure(('Teams', analysis_type), (12, 8))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh([str(track) for track in laps.index], seconds, color=colors)
+
+        for i, (v, clock, abbreviation) in enumerate(zip(seconds, lap_clock(laps['Fastest Lap (s)']), drivers['Abbreviation'])):
+            ax.text(v + 0.3, i, f"{clock}  {abbreviation}", color='white', fontsize=10, va='center')
+
+        ax.set_xlim(seconds.min() - 10, seconds.max() + 8)
+        ax.set_title(
+            f"Formula 1 – {season} Season – Fastest Race Lap per Track",
+            color='white',
+            fontsize=16
+        )
+        ax.set_xlabel("Lap Time (s)", color='white')
+        ax.tick_params(colors='white')
+        ax.grid(axis='x', alpha=0.25)
+        return fig
+
+
+    # -----------------------------
+    # Fastest Lap Pace
+    # -----------------------------
+    elif analysis_type == "Fastest Lap Pace":
+
+        pace = data
+        if pace.empty:
+            return plot_no_data('Teams', "Fastest Lap Pace (Teams) – Median Gap to the Quickest Lap of Each Round", "No lap times recorded for this season")
+
+        colors = list(lookup(dimensions.teams, pace.index)['Color'])
+
+        fig, ax, _ = acquire_figure(('Teams', analysis_type), (12, 5))
+        fig.patch.set_facecolor('#15151e')
+        ax.set_facecolor('#15151e')
+
+        ax.barh(pace.index, pace.values, color=colors)
+
+        for i, v in enumerate(pace.values):
+            ax.text(v + 0.02, i, f"+{v:.2f}%", color='white', fontsize=11, va='center')
+
+        ax.set_xlim(0, pace.values.max() * 1.15 + 0.05)
+        ax.set_title(
+            "Fastest Lap Pace (Teams) – Median Gap to the Quickest Lap of Each Round",
+            color='white',
+            fontsize=16
+        )
+        ax.set_xlabel("Slower than the Round's Fastest Lap (%)", color='white')
+        ax.set_ylabel("Teams", color='white')
+
+        ax.tick_params(colors='white')
+        ax.grid(axis='x', alpha=0.25)
+
+        return fig
+
+
+# ----------------------------------
+# CURRENT FORM (DRIVERS & TEAMS)
+# ----------------------------------
+def plot_form(form, rows, category, season):
+    # average points per round over the window, best on top, with average
+    # finish and DNF rate next to each bar
+    if form.empty:
+        return plot_no_data(category, f"Formula 1 – {season} Season – Current Form", "No rounds raced yet this season")
+
+    form, rows = form.iloc[::-1], rows.iloc[::-1]
+    points = form['Avg Points'].to_numpy()
+
+    fig, ax, _ = acquire_figure((category, "Current Form"), (12, 7))
+    fig.patch.set_facecolor('#15151e')
+    ax.set_facecolor('#15151e')
+
+    ax.barh(list(rows['Label']), points, color=list(rows['Color']))
+
+    for i, (v, avgFinish, dnfRate) in enumerate(zip(points, form['Avg Finish'], form['DNF Rate'])):
+        ax.text(v + 0.3, i, form_label(avgFinish, dnfRate), color='white', fontsize=10, va='center')
+
+    window, first, last = form.attrs['window'], form.attrs['first'], form.attrs['last']
+    ax.set_title(
+        f"Formula 1 – {season} Season – Current Form (Last {window} Rounds: {first} – {last})",
+        color='white',
+        fontsize=16,
+        pad=12
+    )
+    ax.set_xlabel("Average Points per Round", color='white')
+    ax.set_ylabel(category, color='white')
+    ax.set_xlim(0, (points.max() if len(points) else 0) * 1.25 + 1)
+    ax.tick_params(colors='white')
+    ax.grid(axis='x', alpha=0.25, linestyle='--')
+    return fig
+
+
+# ----------------------------------
+# EMPTY CHARTS
+# ----------------------------------
+def plot_no_data(category, title, message):
+    # a titled placeholder for charts whose data the season does not have;
+    # pooled apart from the charts, whose figures have other sizes
+    fig, ax, _ = acquire_figure((category, "No Data"), (12, 3))
+    fig.patch.set_facecolor('#15151e')
+    ax.set_facecolor('#15151e')
+    ax.set_title(title, color='white', fontsize=16, pad=12)
+    ax.text(0.5, 0.5, message, color='white', fontsize=14, ha='center', va='center', transform=ax.transAxes)
+    ax.set_axis_off()
+    return fig
@@ -0,0 +1,101 @@
+from typing import NamedTuple
+
+import pandas as pd
+
+
+# ----------------------------------
+# TEAM COLORS
+# ----------------------------------
+# Drivers take the color of the team they raced for most recently, so a
+# mid-season move recolors them with their new team.
+TEAM_COLORS = {
+    "Red Bull Racing": "#1E41FF",
+    "Racing Bulls F1 Team": "#2B4562",
+    "Ferrari": "#DC0000",
+    "Mercedes": "#00D2BE",
+    "McLaren": "#FF8700",
+    "Aston Martin": "#006F62",
+    "Alpine": "#0090FF",
+    "Williams Racing": "#005AFF",
+    "Haas F1 Team": "#B6BABD",
+    "Kick Sauber": "#00FF00",
+}
+
+# teams from other seasons fall back to neutral grey
+DEFAULT_COLOR = "#888888"
+
+
+# ----------------------------------
+# DIMENSION TABLES
+# ----------------------------------
+# One row per driver / team / track, indexed by the integer code of the
+# matching category in the result tables (race["Driver"].cat.codes etc.), so
+# charts look labels and colors up by code instead of parsing names.
+class Dimensions(NamedTuple):
+    drivers: pd.DataFrame
+    teams: pd.DataFrame
+    tracks: pd.DataFrame
+
+
+def _latest_entry(results):
+    # team and race number of each driver's most recent session (the
+    # results table is in round / session order)
+    return results.groupby(level="Driver", observed=True)[["Team", "No"]].last()
+
+
+def build_dimensions(season, results):
+    race = season.race
+
+    teamNames = race["Team"].cat.categories
+    teams = pd.DataFrame({
+        "Team": teamNames,
+        "Label": teamNames,
+        "Color": teamNames.map(lambda team: TEAM_COLORS.get(team, DEFAULT_COLOR)),
+    }).rename_axis("id")
+
+    # joined on race number: driver names in Formula1_Drivers.csv carry typos
+    driverNames = race["Driver"].cat.categories
+    latest = _latest_entry(results).reindex(driverNames)
+    numbers = latest["No"].astype("Int16")
+    abbreviations = season.drivers.drop_duplicates("Race Number").set_index("Race Number")["Abbreviation"]
+
+    # label = everything after the first name, so "Nyck de Vries" -> "de Vries"
+    surnames = driverNames.str.split(" ", n=1).str[-1]
+    derived = pd.Series(surnames.str[:3].str.upper(), index=numbers.index)
+
+    drivers = pd.DataFrame({
+        "Driver": driverNames,
+        "Abbreviation": numbers.map(abbreviations).fillna(derived).to_numpy(),
+        "Label": surnames,
+        "No": numbers.to_numpy(),
+        "Team": latest["Team"].astype("string").to_numpy(),
+        "Team ID": pd.Categorical(latest["Team"], categories=teamNames).codes,
+    }).rename_axis("id")
+    drivers["Color"] = drivers["Team ID"].map(teams["Color"]).fillna(DEFAULT_COLOR)
+
+    # joined on the track name store.build_season matched to each round
+    trackNames = race["Track"].cat.categories
+    calendar = season.calendar.dropna(subset=["Track"]).set_index("Track")
+    tracks = pd.DataFrame({
+        "Track": trackNames,
+        "Label": trackNames,
+        "Round": calendar["Round"].reindex(trackNames).to_numpy(),
+        "GP Name": calendar["GP Name"].reindex(trackNames).to_numpy(),
+    }).rename_axis("id")
+
+    return Dimensions(drivers, teams, tracks)
+
+
+def lookup(dim, index):
+    # dimension rows for a chart's index, in the same order: by integer code
+    # for the categorical indexes analytics produces, by name otherwise
+    if isinstance(index, pd.CategoricalIndex):
+        positions = index.codes
+    else:
+        positions = pd.Index(dim.iloc[:, 0].astype(str)).get_indexer(index)
+
+    # a missing entry is -1, which take() would read as the last row
+    if (positions < 0).any():
+        missing = list(pd.Index(index)[positions < 0])
+        raise KeyError(f"not in the {dim.columns[0]} dimension: {missing}")
+    return dim.take(positions)
@@ -0,0 +1,130 @@
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+matplotlib.use("Agg")
+
+from analytics import DRIVER_CHARTS, HIGHLIGHT_CHARTS, TEAM_CHARTS, driver_standings, team_standings
+from charts import draw_driver_chart, draw_team_chart
+from figures import release_figure
+from render_cache import SAVEFIG_KWARGS
+from seasons import SeasonRegistry
+
+
+# ----------------------------------
+# BATCH CHART EXPORTER
+# ----------------------------------
+# Renders every chart of every season (and every highlight option of the
+# highlight charts) to files, without a Streamlit server:
+#
+#   python export.py --out reports/ --format png --workers 8
+#
+# Highlight variants are split into jobs of HIGHLIGHTS_PER_JOB; variants in
+# one job reuse the pooled figure and only restyle its lines.
+OPACITY = 0.3
+HIGHLIGHTS_PER_JOB = 4
+
+_registry = None
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-")
+
+
+def _init_worker(root):
+    global _registry
+    _registry = SeasonRegistry(root)
+
+
+def _jobs(registry, seasons):
+    for season in seasons:
+        race = registry.get(season).race
+        for category, analyses, options in (
+            ("Drivers", DRIVER_CHARTS, sorted(race["Driver"].unique())),
+            ("Teams", TEAM_CHARTS, sorted(race["Team"].unique())),
+        ):
+            for analysis in analyses:
+                if analysis not in HIGHLIGHT_CHARTS:
+                    yield season, category, analysis, [None]
+                    continue
+                for i in range(0, len(options), HIGHLIGHTS_PER_JOB):
+                    yield season, category, analysis, options[i:i + HIGHLIGHTS_PER_JOB]
+
+
+def export_chart(season, category, analysis, highlights, out_dir, fmt):
+    snapshot = _registry.live(season).snapshot()
+    race = snapshot.season.race
+    folder = os.path.join(out_dir, str(season), category.lower())
+    os.makedirs(folder, exist_ok=True)
+
+    written = []
+    for highlight in highlights:
+        if category == "Drivers":
+            fig = draw_driver_chart(race, snapshot.counts, snapshot.points, snapshot.positions, snapshot.form, snapshot.dimensions, season, analysis, highlight, OPACITY)
+        else:
+            fig = draw_team_chart(race, snapshot.counts, snapshot.points, snapshot.form, snapshot.dimensions, season, analysis, highlight, OPACITY)
+
+        name = _slug(analysis) if highlight is None else f"{_slug(analysis)}--{_slug(highlight)}"
+        path = os.path.join(folder, f"{name}.{fmt}")
+        try:
+            fig.savefig(path, **{**SAVEFIG_KWARGS, "format": fmt})
+        finally:
+            release_figure(fig)
+        written.append(path)
+
+    return written
+
+
+def export_standings(registry, seasons, out_dir):
+    written = []
+    for season in seasons:
+        points = registry.live(season).snapshot().points
+        folder = os.path.join(out_dir, str(season))
+        os.makedirs(folder, exist_ok=True)
+        for name, table in (
+            ("driver-standings", driver_standings(points["Driver"])),
+            ("team-standings", team_standings(points["Team"])),
+        ):
+            path = os.path.join(folder, f"{name}.csv")
+            table.to_csv(path, index=False)
+            written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every dashboard chart to files.")
+    parser.add_argument("--root", default=".", help="repository root holding the season CSVs")
+    parser.add_argument("--out", default="reports")
+    parser.add_argument("--seasons", type=int, nargs="+", help="default: every season found")
+    parser.add_argument("--format", default="png", choices=["png", "svg", "pdf"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    registry = SeasonRegistry(args.root)
+    seasons = args.seasons or registry.years()
+
+    written = export_standings(registry, seasons, args.out)
+
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        initializer=_init_worker,
+        initargs=(args.root,),
+    ) as pool:
+        futures = [
+            pool.submit(export_chart, *job, args.out, args.format)
+            for job in _jobs(registry, seasons)
+        ]
+        for future in as_completed(futures):
+            written.extend(future.result())
+
+    print(f"wrote {len(written)} files to {args.out} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import threading
+import weakref
+
+import matplotlib
+# non-interactive and fixed: no GUI backend probing on the first chart
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+
+
+# ----------------------------------
+# FIGURE POOL
+# ----------------------------------
+# Figures are built with matplotlib.figure.Figure directly, so they never
+# enter the pyplot registry; every figure handed out by acquire_figure() is
+# given back with release_figure() once it has been rasterized.
+MAX_IDLE_PER_LAYOUT = 2
+
+_idle = {}
+_owned = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def acquire_figure(layout, figsize, signature=None):
+    # Returns (fig, ax, reused). reused=True means the pooled figure already
+    # holds the artists for `signature`, so the caller only needs to restyle.
+    with _lock:
+        idle = _idle.get(layout)
+        fig = idle.pop() if idle else None
+
+    if fig is not None and signature is not None and _owned[fig][1] == signature:
+        return fig, fig.axes[0], True
+
+    if fig is None:
+        fig = Figure(figsize=figsize)
+    else:
+        fig.clear()
+
+    _owned[fig] = (layout, signature)
+    return fig, fig.add_subplot(), False
+
+
+def release_figure(fig):
+    entry = _owned.get(fig)
+    if entry is None:
+        return
+
+    with _lock:
+        idle = _idle.setdefault(entry[0], [])
+        if len(idle) < MAX_IDLE_PER_LAYOUT:
+            idle.append(fig)
+            return
+
+    # pool is full: drop every artist now instead of waiting for the GC
+    fig.clear()
+    del _owned[fig]
+
+
+def pool_stats():
+    with _lock:
+        return {str(layout): len(figs) for layout, figs in _idle.items()}
+
+
+# ----------------------------------
+# RESTYLE HELPERS (STABLE LAYOUTS)
+# ----------------------------------
+def restyle_lines(ax, styles):
+    # styles: one dict of Line2D properties per plotted line, in plot order
+    legend = ax.get_legend()
+    handles = legend.legend_handles if legend is not None else [None] * len(styles)
+
+    for line, handle, style in zip(ax.lines, handles, styles):
+        line.set(**style)
+        if handle is not None:
+            handle.set(**style)
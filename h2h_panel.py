@@ -0,0 +1,50 @@
+import streamlit as st
+
+from analytics import head_to_head, head_to_head_table, teammate_battles
+from store import freeze
+from timing import span
+
+
+# ----------------------------------
+# HEAD TO HEAD
+# ----------------------------------
+# Every driver pair at once (analytics.head_to_head): teammate battles, then
+# one driver against the whole field. Matrices are cached per season data
+# version; the cross-season matrices come from SeasonRegistry.head_to_head.
+COLUMNS = {
+    "Avg Position Δ": st.column_config.NumberColumn(format="%+.2f"),
+    "Avg Grid Δ": st.column_config.NumberColumn(format="%+.2f"),
+}
+
+
+# underscore arguments are not hashed; `versions` stands in for them
+@st.cache_resource(max_entries=16, show_spinner=False)
+def cached_head_to_head(season, versions, _race):
+    return freeze(head_to_head(_race))
+
+
+def render_head_to_head(h2h):
+    with span("aggregate"):
+        battles = teammate_battles(h2h)
+
+    with span("display"):
+        st.markdown("#### Teammate Battles")
+        st.dataframe(battles, use_container_width=True, hide_index=True, column_config=COLUMNS)
+
+    drivers = list(h2h["Races"].index)
+    if not drivers:
+        # no race yet, so nobody to compare
+        return
+    driver = st.selectbox("Driver", drivers)
+
+    with span("aggregate"):
+        table = head_to_head_table(h2h, driver)
+
+    with span("display"):
+        st.markdown(f"#### {driver} vs the Field")
+        st.dataframe(table, use_container_width=True, hide_index=True, column_config=COLUMNS)
+        st.caption(
+            "Ahead / Behind count races where both started (unclassified drivers rank by laps "
+            "completed). Δ columns average the driver's position minus the opponent's over races "
+            "both were classified / had a grid slot: negative means ahead."
+        )
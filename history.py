@@ -0,0 +1,37 @@
+import streamlit as st
+
+from h2h_panel import render_head_to_head
+
+
+# ----------------------------------
+# CROSS-SEASON ANALYSIS RENDERER
+# ----------------------------------
+def render_history_analysis(careerWins, seasonPoints, headToHead, analysis_type):
+
+    # ----------------------------------
+    # Career Wins
+    # ----------------------------------
+    if analysis_type == "Career Wins":
+
+        wins = careerWins[careerWins > 0].reset_index()
+        wins.insert(0, 'Rank', range(1, len(wins) + 1))
+
+        st.dataframe(wins, use_container_width=True)
+
+    # ----------------------------------
+    # Points per Season
+    # ----------------------------------
+    elif analysis_type == "Points per Season":
+
+        # Top 20 drivers by points summed over every season
+        top20 = seasonPoints.sum().sort_values(ascending=False).head(20).index
+
+        st.line_chart(seasonPoints[top20])
+        st.dataframe(seasonPoints[top20], use_container_width=True)
+
+    # ----------------------------------
+    # Head-to-Head (All Seasons)
+    # ----------------------------------
+    elif analysis_type == "Head-to-Head (All Seasons)":
+
+        render_head_to_head(headToHead)
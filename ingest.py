@@ -0,0 +1,284 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+from typing import NamedTuple
+
+import pandas as pd
+
+from analytics import build_counts, build_form_tables, build_points_tables, build_position_tables, build_results
+from dimensions import build_dimensions
+from store import FILES, append_results, freeze, load_season
+
+
+# ----------------------------------
+# LIVE SNAPSHOT
+# ----------------------------------
+# Everything a rerun reads for one season, swapped as a whole so a session
+# never sees counts from one round and results from another. Snapshots are
+# frozen (store.freeze): every session reads the same frames, none may
+# write to them.
+RESULT_TABLES = ("race", "sprint")
+
+WATCH_INTERVAL = float(os.environ.get("F1_WATCH_INTERVAL", 0.5))
+
+# polls failing in a row before the watcher reloads the season from scratch
+MAX_POLL_FAILURES = 5
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot(NamedTuple):
+    season: object
+    results: object
+    counts: dict
+    points: dict
+    positions: dict
+    form: dict
+    dimensions: object
+    table_versions: dict
+
+
+def _chain_version(version, rows):
+    # next version of a table = hash(previous version + appended rows)
+    h = hashlib.sha256(version.encode())
+    h.update(pd.util.hash_pandas_object(rows, index=False).values.tobytes())
+    return h.hexdigest()[:16]
+
+
+def _season_version(table_versions):
+    h = hashlib.sha256()
+    for table in RESULT_TABLES:
+        h.update(table_versions[table].encode())
+    return h.hexdigest()[:16]
+
+
+# ----------------------------------
+# DELTA UPDATES
+# ----------------------------------
+def _add_counts(counts, delta):
+    # delta tables are indexed by the widened categories, so old tables are
+    # aligned onto the same index before adding
+    return {
+        key: counts[key].reindex(delta[key].index, fill_value=0) + delta[key]
+        for key in counts
+    }
+
+
+def _add_points(matrix, delta):
+    rows, rounds = delta["Total"].index, delta["Total"].columns
+    out = {
+        name: matrix[name].reindex(index=rows, columns=rounds, fill_value=0) + delta[name]
+        for name in ("Race", "Sprint", "Total")
+    }
+
+    # cumulative totals only move from the first round that received points
+    touched = (delta["Total"] != 0).any(axis=0).to_numpy() | ~rounds.isin(matrix["Total"].columns)
+    cumulative = (
+        matrix["Cumulative"].reindex(index=rows, columns=rounds)
+        .ffill(axis=1).fillna(0)
+    )
+    if touched.any():
+        first = int(touched.argmax())
+        cumulative.iloc[:, first:] += delta["Total"].iloc[:, first:].cumsum(axis=1)
+    out["Cumulative"] = cumulative
+
+    return out
+
+
+# ----------------------------------
+# LIVE SEASON (INGESTION API)
+# ----------------------------------
+class LiveSeason:
+
+    def __init__(self, season):
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._snapshot = self._full_snapshot(season)
+
+    @staticmethod
+    def _full_snapshot(season):
+        results = build_results(season.race, season.sprint)
+        points = build_points_tables(results)
+        return freeze(Snapshot(
+            season,
+            results,
+            build_counts(results),
+            points,
+            build_position_tables(results),
+            build_form_tables(results, points),
+            build_dimensions(season, results),
+            {table: season.version for table in RESULT_TABLES},
+        ))
+
+    def snapshot(self):
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot.season.version
+
+    def on_change(self, callback):
+        # callback(changed_tables) runs after every new snapshot is published
+        self._listeners.append(callback)
+
+    def _publish(self, changed):
+        for callback in self._listeners:
+            callback(changed)
+
+    def append_round(self, race_rows=None, sprint_rows=None):
+        # race_rows / sprint_rows are CSV-shaped frames holding only new rows
+        with self._lock:
+            old = self._snapshot
+            season, new_race, new_sprint = append_results(old.season, race_rows, sprint_rows)
+
+            versions = dict(old.table_versions)
+            for table, rows in (("race", new_race), ("sprint", new_sprint)):
+                if len(rows):
+                    versions[table] = _chain_version(versions[table], rows)
+            changed = {table for table in RESULT_TABLES if versions[table] != old.table_versions[table]}
+            if not changed:
+                return changed
+
+            delta = build_results(new_race, new_sprint)
+            counts = build_counts(delta)
+            points = build_points_tables(delta)
+
+            # the results table is re-sorted, position matrices are a single
+            # scatter, form tables a few bincounts and dimension tables a row
+            # per entity: all cheap enough to rebuild
+            season = season._replace(version=_season_version(versions))
+            results = build_results(season.race, season.sprint)
+            points = {key: _add_points(old.points[key], points[key]) for key in old.points}
+            self._snapshot = freeze(Snapshot(
+                season,
+                results,
+                _add_counts(old.counts, counts),
+                points,
+                build_position_tables(results),
+                build_form_tables(results, points),
+                build_dimensions(season, results),
+                versions,
+            ))
+
+        self._publish(changed)
+        return changed
+
+    def reload(self, season):
+        # full rebuild, used when a file was edited rather than appended to
+        with self._lock:
+            self._snapshot = self._full_snapshot(season)
+        self._publish(set(RESULT_TABLES))
+
+
+# ----------------------------------
+# FILE WATCHER
+# ----------------------------------
+# Polls the result CSVs and feeds only the bytes appended since the last
+# poll to append_round(). Anything that is not a pure append (truncation,
+# an edited earlier row) falls back to a full reload of the season.
+TAIL_BYTES = 256
+
+
+class RoundWatcher(threading.Thread):
+
+    def __init__(self, live, data_dir=".", interval=WATCH_INTERVAL):
+        super().__init__(daemon=True, name=f"round-watcher-{data_dir}")
+        self.live = live
+        self.data_dir = data_dir
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._failures = 0
+        self._mark_all()
+
+    def _path(self, table):
+        return os.path.join(self.data_dir, FILES[table])
+
+    def _mark_all(self):
+        # remember header, size and the bytes just before the end of each file
+        self._marks = {}
+        for table in RESULT_TABLES:
+            path = self._path(table)
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                header = f.readline()
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(size - TAIL_BYTES, 0))
+                self._marks[table] = (header, size, f.read())
+
+    def _read_appended(self, table):
+        # new complete lines as a DataFrame, None if nothing was appended,
+        # or False if the file changed in a way that is not an append
+        path = self._path(table)
+        if not os.path.exists(path):
+            return None if table not in self._marks else False
+
+        size = os.path.getsize(path)
+        mark = self._marks.get(table)
+        if mark is None:
+            return False
+        header, offset, tail = mark
+        if size == offset:
+            return None
+        if size < offset:
+            return False
+
+        with open(path, "rb") as f:
+            f.seek(offset - len(tail))
+            if f.read(len(tail)) != tail:
+                return False
+            chunk = f.read(size - offset)
+
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            # a row is still being written
+            return None
+
+        rows = pd.read_csv(io.BytesIO(header + chunk[:end]))
+        self._pending[table] = (header, offset + end, (tail + chunk[:end])[-TAIL_BYTES:])
+        return rows
+
+    def poll(self):
+        # marks only advance once the new rows were ingested, so a failed
+        # poll is retried in full on the next tick
+        self._pending = {}
+        appended = {table: self._read_appended(table) for table in RESULT_TABLES}
+
+        if any(rows is False for rows in appended.values()):
+            self.live.reload(load_season(self.data_dir))
+            self._mark_all()
+            return
+
+        if any(rows is not None for rows in appended.values()):
+            self.live.append_round(race_rows=appended["race"], sprint_rows=appended["sprint"])
+            self._marks.update(self._pending)
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll()
+                self._failures = 0
+            except Exception:
+                # malformed rows, a file mid-replace or anything else: the
+                # watcher must outlive it, so it is retried on the next poll
+                # and the season is reloaded if it keeps failing
+                self._failures += 1
+                logger.warning("%s: poll failed (%d in a row)", self.name, self._failures, exc_info=True)
+                if self._failures >= MAX_POLL_FAILURES:
+                    self._reload()
+
+    def _reload(self):
+        # the failure count only resets once a reload went through, so a
+        # season that cannot be loaded is retried on every failed poll
+        try:
+            self.live.reload(load_season(self.data_dir))
+            self._mark_all()
+        except Exception:
+            logger.exception("%s: reloading %s failed (%d failed polls in a row)", self.name, self.data_dir, self._failures)
+        else:
+            self._failures = 0
+
+    def stop(self):
+        self._stop_event.set()
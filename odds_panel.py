@@ -0,0 +1,64 @@
+import streamlit as st
+
+from simulate import rounds_completed, title_odds
+from store import freeze
+from timing import span
+
+
+# ----------------------------------
+# TITLE ODDS (MONTE CARLO)
+# ----------------------------------
+# Drivers / Teams "Title Odds": pick the round the standings are taken after
+# and the number of simulated seasons. Results are cached per season data
+# version, so every session asking for the same round shares one run.
+SIMULATIONS = [10_000, 100_000, 1_000_000]
+
+COLUMNS = {
+    "Points": st.column_config.NumberColumn(format="plain"),
+    "Title %": st.column_config.ProgressColumn("Title %", format="%.2f%%", min_value=0, max_value=100),
+    "CI Low %": st.column_config.NumberColumn("95% CI Low", format="%.2f%%"),
+    "CI High %": st.column_config.NumberColumn("95% CI High", format="%.2f%%"),
+    "Expected Points": st.column_config.NumberColumn(format="%.1f"),
+}
+
+
+# underscore arguments are not hashed; `versions` stands in for them.
+# cache_resource: sessions get the frozen tables themselves, not copies
+@st.cache_resource(max_entries=64, show_spinner=False)
+def cached_title_odds(season, versions, after_round, sims, _calendar, _race, _sprint, _pointsTables):
+    return freeze(title_odds(_calendar, _race, _sprint, _pointsTables, after_round, sims, seed=after_round))
+
+
+def render_title_odds(category, calendar, raceResults, sprintResults, pointsTables, season, tableVersions):
+    lastRound = min(rounds_completed(pointsTables), int(calendar["Round"].max()) - 1)
+    if lastRound < 1:
+        st.info("Title odds need at least one completed round and one still to run.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if lastRound > 1:
+            after_round = st.slider("Standings after Round", 1, lastRound, lastRound)
+        else:
+            after_round = 1
+    with col2:
+        sims = st.select_slider("Simulated Seasons", SIMULATIONS, value=100_000, format_func="{:,}".format)
+
+    with span("aggregate"), st.spinner(f"Simulating {sims:,} seasons…"):
+        drivers, teams, info = cached_title_odds(
+            season, tuple(sorted(tableVersions.items())), after_round, sims,
+            calendar, raceResults, sprintResults, pointsTables,
+        )
+
+    with span("display"):
+        st.dataframe(
+            drivers if category == "Drivers" else teams,
+            use_container_width=True,
+            hide_index=True,
+            column_config=COLUMNS,
+        )
+        st.caption(
+            f"{info['sims']:,} simulations of the last {info['rounds']} rounds ({info['sprints']} sprints) "
+            f"from the standings after round {after_round}, each driver's results sampled from their "
+            f"finishing positions so far · {info['seconds']:.1f}s on {info['workers']} worker(s)"
+        )
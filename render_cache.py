@@ -0,0 +1,127 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from timing import span
+
+
+# ----------------------------------
+# LIMITS
+# ----------------------------------
+MAX_ENTRIES = int(os.environ.get("F1_RENDER_CACHE_ENTRIES", 256))
+MAX_BYTES = int(os.environ.get("F1_RENDER_CACHE_MB", 64)) * 1024 * 1024
+
+# Same output settings st.pyplot uses, so cached charts look identical.
+SAVEFIG_KWARGS = {"format": "png", "dpi": 200, "bbox_inches": "tight"}
+
+
+def figure_to_png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, **SAVEFIG_KWARGS)
+    return buf.getvalue()
+
+
+# st.image scales anything wider than this down again on every display, so
+# the app renders charts straight at this width instead of at 200 dpi
+# (exports keep SAVEFIG_KWARGS)
+DISPLAY_WIDTH = 2 * 730
+
+
+def figure_to_display_png(fig):
+    # bbox_inches="tight" crops to the tight bbox plus 0.1in padding each side
+    width = fig.get_tightbbox().width + 0.2
+    dpi = min(SAVEFIG_KWARGS["dpi"], (DISPLAY_WIDTH - 2) / width)
+    buf = io.BytesIO()
+    fig.savefig(buf, **{**SAVEFIG_KWARGS, "dpi": dpi})
+    return buf.getvalue()
+
+
+# ----------------------------------
+# LRU CACHE OF RENDERED CHARTS
+# ----------------------------------
+class RenderCache:
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._items[key] = data
+            self._bytes += len(data)
+            while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def get_or_render(self, key, draw):
+        data = self.get(key)
+        if data is None:
+            # a miss is the first point that needs matplotlib (figures.py)
+            from figures import release_figure
+
+            # rendered outside the lock; concurrent misses on one key just race to put
+            fig = draw()
+            try:
+                with span("encode"):
+                    data = figure_to_display_png(fig)
+            finally:
+                release_figure(fig)
+            self.put(key, data)
+        return data
+
+    def invalidate(self, predicate):
+        # drops every entry whose key matches; returns how many were dropped
+        with self._lock:
+            stale = [key for key in self._items if predicate(key)]
+            for key in stale:
+                self._bytes -= len(self._items.pop(key))
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def invalidate_tables(self, season, changed):
+        # chart keys are (category, analysis, highlight, opacity, season,
+        # versions, params) with versions as (table, version) pairs: drops
+        # the season's charts that read one of the `changed` tables
+        return self.invalidate(lambda key: key[4] == season and any(table in changed for table, _ in key[5]))
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,157 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from analytics import head_to_head
+from ingest import WATCH_INTERVAL, LiveSeason, RoundWatcher
+from store import FILES, content_hash, load_season, read_partition, season_partitions
+
+
+# ----------------------------------
+# SEASON DISCOVERY
+# ----------------------------------
+# The repository root holds the current season; older seasons live in
+# seasons/<year>/ with the same four CSV files (sprint results optional).
+SEASONS_DIR = os.environ.get("F1_SEASONS_DIR", "seasons")
+
+
+# race columns the cross-season head-to-head reads
+H2H_COLUMNS = ["Track", "Driver", "Team", "Position", "Status", "Laps", "Starting Grid"]
+
+
+def _is_season_dir(path):
+    return os.path.isfile(os.path.join(path, FILES["race"]))
+
+
+def _season_year(path):
+    name = os.path.basename(os.path.normpath(path))
+    if name.isdigit():
+        return int(name)
+
+    # root-level season: take the year of the first round in the calendar
+    first_round = pd.read_csv(os.path.join(path, FILES["calendar"]), nrows=1)
+    return int(str(first_round["Race Date"].iloc[0])[-4:])
+
+
+def discover_seasons(root="."):
+    found = {}
+
+    if _is_season_dir(root):
+        found[_season_year(root)] = root
+
+    seasons_root = os.path.join(root, SEASONS_DIR)
+    if os.path.isdir(seasons_root):
+        for name in os.listdir(seasons_root):
+            path = os.path.join(seasons_root, name)
+            if name.isdigit() and _is_season_dir(path):
+                found.setdefault(int(name), path)
+
+    return dict(sorted(found.items()))
+
+
+# ----------------------------------
+# REGISTRY (LAZY PER-SEASON LOADING)
+# ----------------------------------
+class SeasonRegistry:
+
+    def __init__(self, root="."):
+        self.root = root
+        self._paths = discover_seasons(root)
+        self._loaded = {}
+        self._watchers = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def years(self):
+        return list(self._paths)
+
+    def latest(self):
+        return self.years()[-1]
+
+    def loaded_years(self):
+        return sorted(self._loaded)
+
+    def live(self, year):
+        live = self._loaded.get(year)
+        if live is None:
+            with self._lock:
+                live = self._loaded.get(year)
+                if live is None:
+                    live = LiveSeason(load_season(self._paths[year]))
+                    live.on_change(lambda changed, year=year: self._notify(year, changed))
+                    self._loaded[year] = live
+        return live
+
+    def get(self, year):
+        return self.live(year).snapshot().season
+
+    # ----------------------------------
+    # LIVE ROUNDS
+    # ----------------------------------
+    def on_change(self, callback):
+        # callback(year, changed_tables) after a season ingested new rows
+        self._listeners.append(callback)
+
+    def _notify(self, year, changed):
+        for callback in self._listeners:
+            callback(year, changed)
+
+    def watch(self, year, interval=WATCH_INTERVAL):
+        # F1_WATCH_INTERVAL=0 turns the watcher off
+        if interval <= 0 or year in self._watchers:
+            return
+        watcher = RoundWatcher(self.live(year), self._paths[year], interval)
+        self._watchers[year] = watcher
+        watcher.start()
+
+    def versions(self):
+        return {year: content_hash(path) for year, path in self._paths.items()}
+
+    # ----------------------------------
+    # CROSS-SEASON QUERIES
+    # ----------------------------------
+    # Each season's Arrow files are one partition: queries read only the
+    # columns they need, reduce each partition, then combine the small results.
+    def scan(self, table, columns):
+        for year, path in self._paths.items():
+            _, paths = season_partitions(path)
+            if paths is None:
+                yield year, getattr(self.get(year), table)[columns]
+            else:
+                yield year, read_partition(paths[table], columns)
+
+    def career_wins(self):
+        wins = [
+            part.loc[part["Position"] == 1, "Driver"].astype(str).value_counts()
+            for _, part in self.scan("race", ["Driver", "Position"])
+        ]
+        if not wins:
+            return pd.Series(dtype="int64", name="Wins")
+        return (
+            pd.concat(wins).groupby(level=0).sum()
+            .sort_values(ascending=False)
+            .rename("Wins")
+        )
+
+    def points_per_season(self, key="Driver"):
+        seasons = {}
+        for (year, race), (_, sprint) in zip(
+            self.scan("race", [key, "Points"]),
+            self.scan("sprint", [key, "Points"]),
+        ):
+            points = pd.concat([race, sprint])
+            seasons[year] = points.groupby(points[key].astype(str))["Points"].sum()
+
+        return pd.DataFrame(seasons).fillna(0).T.rename_axis("Season")
+
+    def head_to_head(self):
+        # one driver x round matrix over every season: rounds are keyed by
+        # season + track so the same circuit in two years stays two races
+        parts, rounds = [], []
+        for year, part in self.scan("race", H2H_COLUMNS):
+            parts.append(part)
+            rounds.append(year * 1000 + pd.factorize(part["Track"])[0])
+        race = pd.concat(parts, ignore_index=True)
+        return head_to_head(race, np.concatenate(rounds))
@@ -0,0 +1,19 @@
+import streamlit as st
+from starlette.middleware import Middleware
+
+from assets import ImmutableAssets
+from bundle import BUNDLE_URL
+
+
+# ----------------------------------
+# PRODUCTION ENTRY POINT
+# ----------------------------------
+# Same app as `streamlit run app.py`, plus long-lived cache headers on the
+# content-hashed images in static/assets/ and the pre-rendered charts in
+# static/bundle/:
+#
+#   streamlit run serve.py
+app = st.App("app.py", middleware=[
+    Middleware(ImmutableAssets),
+    Middleware(ImmutableAssets, prefix=BUNDLE_URL),
+])
@@ -0,0 +1,310 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+# ----------------------------------
+# CHAMPIONSHIP SIMULATOR (MONTE CARLO)
+# ----------------------------------
+# Title odds from the standings after round N: every remaining round of the
+# calendar (sprints included) is sampled from a per-driver model of finishing
+# outcomes, many times over. Batches are whole (simulations x rounds x
+# drivers) arrays, so NumPy does all the work; large runs are split across
+# workers with independent random streams.
+#
+#   python simulate.py --after 18 --sims 1000000 --workers 8
+#
+# The CLI uses a process pool. The app uses threads: NumPy releases the GIL
+# in the sampling, sorting and scatter steps, and spawned processes would
+# re-run app.py, which Streamlit installs as __main__.
+RACE_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+SPRINT_POINTS = [8, 7, 6, 5, 4, 3, 2, 1]
+
+# Dirichlet prior, in rounds' worth of outcomes spread evenly over every
+# position and DNF: keeps a driver's unseen results possible
+PRIOR_ROUNDS = 2.0
+
+# simulations per batch: 10k x 24 rounds x 20 drivers keeps each
+# intermediate array near 40 MB
+BATCH = 10_000
+
+# outcomes are drawn from an inverse-CDF lookup table of this many uniform
+# buckets per driver (probabilities rounded to 1 / 65536)
+QUANTILES = 1 << 16
+
+# below this many simulations a pool costs more than it saves
+POOL_MIN_SIMS = 100_000
+
+WORKERS = int(os.environ.get("F1_SIM_WORKERS", os.cpu_count() or 1))
+
+Z95 = 1.959964
+
+
+# ----------------------------------
+# STANDINGS & SCHEDULE AFTER ROUND N
+# ----------------------------------
+def rounds_completed(pointsTables):
+    return pointsTables["Driver"]["Race"].shape[1]
+
+
+def standings_after(matrix, after_round):
+    # points per entity over the first `after_round` rounds, from the same
+    # points matrix Driver / Team Standings read
+    race = matrix["Race"].iloc[:, :after_round].sum(axis=1)
+    sprint = matrix["Sprint"].iloc[:, :after_round].sum(axis=1)
+    return race + sprint
+
+
+def remaining_schedule(calendar, race, sprint, after_round):
+    # one flag per round after `after_round`: True on sprint weekends.
+    # Raced rounds are sprint weekends when they have sprint results; rounds
+    # still to come use the calendar's optional 'Sprint' column (Yes / No).
+    tracks = race["Track"].cat.categories
+    raced = np.isin(tracks.astype(str), sprint["Track"].astype(str).unique())
+
+    upcoming = calendar[calendar["Round"] > after_round]
+    rounds = upcoming["Round"].to_numpy(dtype="int64")
+    planned = upcoming["Sprint"].eq("Yes").to_numpy() if "Sprint" in upcoming else np.zeros(len(upcoming), dtype=bool)
+
+    known = rounds <= len(tracks)
+    return np.where(known, raced[np.minimum(rounds, len(tracks)) - 1], planned)
+
+
+# ----------------------------------
+# OUTCOME MODEL
+# ----------------------------------
+def fit_outcome_model(race, field, after_round, prior=PRIOR_ROUNDS):
+    # (drivers, positions + 1) probabilities: finishing 1st..Nth (positions
+    # past the field size count as last) or not being classified (last column)
+    tracks = race["Track"].cat.categories[:after_round]
+    rows = race[race["Track"].isin(tracks) & race["Driver"].isin(field)]
+
+    size = len(field)
+    outcome = np.where(
+        rows["Status"].isin(["FIN", "LAP"]).to_numpy(),
+        np.minimum(rows["Position"].fillna(size).to_numpy(dtype="int64"), size) - 1,
+        size,
+    )
+    driver = pd.Index(field).get_indexer(rows["Driver"].astype(str))
+
+    counts = np.bincount(driver * (size + 1) + outcome, minlength=size * (size + 1)).reshape(size, size + 1)
+    counts = counts + prior / (size + 1)
+    return counts / counts.sum(axis=1, keepdims=True)
+
+
+# ----------------------------------
+# ENGINE (BATCHED NUMPY)
+# ----------------------------------
+def _inverse_cdf(model):
+    # (drivers * QUANTILES,) outcome per uniform bucket, driver after driver:
+    # a draw is then one random integer and one gather instead of a search
+    cdf = np.cumsum(model, axis=1)
+    cdf[:, -1] = 1.0
+    buckets = (np.arange(QUANTILES) + 0.5) / QUANTILES
+    return np.concatenate([np.searchsorted(row, buckets, side="right") for row in cdf]).astype("uint8")
+
+
+def _score_rounds(rng, table, size, sims, rounds, points):
+    # points and wins per (simulation, driver) over `rounds` sampled rounds.
+    # Drivers are ordered by their drawn outcome, ties broken at random;
+    # unclassified drivers score nothing
+    if rounds == 0:
+        return np.zeros((sims, size)), np.zeros((sims, size))
+
+    # one 32-bit draw per result: the high half picks the outcome bucket,
+    # the low half breaks ties between drivers drawing the same outcome
+    bits = rng.integers(0, 1 << 32, (sims, rounds, size), dtype="uint32")
+    outcome = table[(bits >> 16) + np.arange(size, dtype="uint32") * QUANTILES]
+    order = np.argsort((outcome.astype("uint32") << 16) | (bits & 0xFFFF), axis=-1)
+
+    paid = min(size, len(points))
+    scored = np.zeros(outcome.shape, dtype="float32")
+    np.put_along_axis(scored, order[..., :paid], np.broadcast_to(np.asarray(points[:paid], dtype="float32"), (*outcome.shape[:2], paid)), axis=-1)
+    scored *= outcome < size
+
+    winner = order[:, :, 0] + np.arange(sims)[:, None] * size
+    wins = np.bincount(winner.ravel(), minlength=sims * size).reshape(sims, size)
+    return scored.sum(axis=1), wins
+
+
+def simulate_titles(model, sprints, driverBase, driverWins, fieldIndex, teamIndex, teamBase, sims, seed):
+    # Runs `sims` seasons in batches. Returns title counts per driver / team
+    # and the sum of final driver points (for expected points).
+    rng = np.random.default_rng(seed)
+    table = _inverse_cdf(model)
+
+    nDrivers, nTeams = len(driverBase), len(teamBase)
+    driverTitles = np.zeros(nDrivers, dtype="int64")
+    teamTitles = np.zeros(nTeams, dtype="int64")
+    pointSum = np.zeros(nDrivers)
+    teamOf = np.zeros((len(fieldIndex), nTeams))
+    teamOf[np.arange(len(fieldIndex)), teamIndex] = 1.0
+
+    done = 0
+    while done < sims:
+        batch = min(BATCH, sims - done)
+        racePts, raceWins = _score_rounds(rng, table, len(model), batch, len(sprints), RACE_POINTS)
+        sprintPts, _ = _score_rounds(rng, table, len(model), batch, int(sprints.sum()), SPRINT_POINTS)
+        gained = racePts + sprintPts
+
+        points = np.broadcast_to(driverBase, (batch, nDrivers)).copy()
+        points[:, fieldIndex] += gained
+        wins = np.broadcast_to(driverWins, (batch, nDrivers)).copy()
+        wins[:, fieldIndex] += raceWins
+
+        # level on points: most wins first (countback), then at random
+        tiebreak = points * 1e3 + wins + rng.random(points.shape, dtype=np.float32) * 0.5
+        driverTitles += np.bincount(tiebreak.argmax(axis=1), minlength=nDrivers)
+        pointSum += points.sum(axis=0)
+
+        teams = teamBase + gained @ teamOf
+        teams += rng.random(teams.shape, dtype=np.float32) * 0.5
+        teamTitles += np.bincount(teams.argmax(axis=1), minlength=nTeams)
+
+        done += batch
+
+    return driverTitles, teamTitles, pointSum
+
+
+def _chunks(sims, workers):
+    size, extra = divmod(sims, workers)
+    return [size + (i < extra) for i in range(workers) if size + (i < extra)]
+
+
+def _pool_size(sims, workers):
+    return 1 if workers <= 1 or sims < POOL_MIN_SIMS else len(_chunks(sims, workers))
+
+
+def run_simulations(args, sims, workers=WORKERS, seed=None, processes=False):
+    # splits `sims` over a thread or (spawned) process pool, one independent
+    # SeedSequence child per chunk
+    seeds = np.random.SeedSequence(seed)
+    if _pool_size(sims, workers) == 1:
+        return simulate_titles(*args, sims, seeds)
+
+    chunks = _chunks(sims, workers)
+    if processes:
+        pool = ProcessPoolExecutor(max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn"))
+    else:
+        pool = ThreadPoolExecutor(max_workers=len(chunks))
+    with pool:
+        parts = list(pool.map(
+            simulate_titles,
+            *zip(*[(*args, n, child) for n, child in zip(chunks, seeds.spawn(len(chunks)))]),
+        ))
+    return tuple(sum(part[i] for part in parts) for i in range(3))
+
+
+# ----------------------------------
+# TITLE ODDS
+# ----------------------------------
+def _wilson(hits, n):
+    # 95% Wilson score interval for hits / n
+    p = hits / n
+    centre = (p + Z95 ** 2 / (2 * n)) / (1 + Z95 ** 2 / n)
+    half = Z95 * np.sqrt(p * (1 - p) / n + Z95 ** 2 / (4 * n ** 2)) / (1 + Z95 ** 2 / n)
+    # exact at the ends, where centre -/+ half is only 0 or 1 up to rounding
+    low = np.where(hits == 0, 0.0, np.clip(centre - half, 0, 1))
+    high = np.where(hits == n, 1.0, np.clip(centre + half, 0, 1))
+    return low, high
+
+
+def _odds_table(names, base, titles, sims, extra):
+    low, high = _wilson(titles, sims)
+    table = pd.DataFrame({
+        **names,
+        # half points from shortened races are kept
+        "Points": base.astype("float64"),
+        "Title %": titles / sims * 100,
+        "CI Low %": low * 100,
+        "CI High %": high * 100,
+        **extra,
+    })
+    return table.sort_values(["Title %", "Points"], ascending=False, ignore_index=True)
+
+
+def title_odds(calendar, race, sprint, pointsTables, after_round, sims=1_000_000, workers=WORKERS, seed=None, processes=False):
+    # (driver odds, team odds, info) from the standings after `after_round`
+    driverBase = standings_after(pointsTables["Driver"], after_round)
+    teamBase = standings_after(pointsTables["Team"], after_round)
+    sprints = remaining_schedule(calendar, race, sprint, after_round)
+
+    # the field is the grid of the last counted round, in their current teams
+    lastRound = race[race["Track"] == race["Track"].cat.categories[after_round - 1]]
+    field = list(lastRound["Driver"].astype(str))
+    teamIndex = pd.Index(teamBase.index.astype(str)).get_indexer(lastRound["Team"].astype(str))
+    fieldIndex = pd.Index(driverBase.index.astype(str)).get_indexer(field)
+
+    tracks = race["Track"].cat.categories[:after_round]
+    winners = race[race["Track"].isin(tracks) & race["Position"].eq(1).fillna(False)]
+    driverWins = winners["Driver"].value_counts().reindex(driverBase.index, fill_value=0).to_numpy(dtype=float)
+
+    model = fit_outcome_model(race, field, after_round)
+    args = (model, sprints, driverBase.to_numpy(dtype=float), driverWins, fieldIndex, teamIndex, teamBase.to_numpy(dtype=float))
+
+    start = time.perf_counter()
+    driverTitles, teamTitles, pointSum = run_simulations(args, sims, workers, seed, processes)
+    elapsed = time.perf_counter() - start
+
+    driverTeam = race.groupby("Driver", observed=True)["Team"].last().reindex(driverBase.index).astype(str)
+    drivers = _odds_table(
+        {"Driver": driverBase.index.astype(str), "Team": driverTeam.to_numpy()},
+        driverBase.to_numpy(), driverTitles, sims, {"Expected Points": pointSum / sims},
+    )
+    teams = _odds_table({"Team": teamBase.index.astype(str)}, teamBase.to_numpy(), teamTitles, sims, {})
+
+    info = {
+        "after_round": after_round,
+        "rounds": len(sprints),
+        "sprints": int(sprints.sum()),
+        "sims": sims,
+        "workers": _pool_size(sims, workers),
+        "seconds": elapsed,
+    }
+    return drivers, teams, info
+
+
+# ----------------------------------
+# CLI
+# ----------------------------------
+def main(argv=None):
+    from analytics import build_points_tables, build_results
+    from seasons import SeasonRegistry
+
+    parser = argparse.ArgumentParser(description="Monte Carlo title odds from the standings after a round.")
+    parser.add_argument("--root", default=".", help="repository root holding the season CSVs")
+    parser.add_argument("--season", type=int, help="default: latest season")
+    parser.add_argument("--after", type=int, required=True, help="standings after this round")
+    parser.add_argument("--sims", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--threads", action="store_true", help="thread pool instead of processes")
+    args = parser.parse_args(argv)
+
+    registry = SeasonRegistry(args.root)
+    season = registry.get(args.season or registry.latest())
+    pointsTables = build_points_tables(build_results(season.race, season.sprint))
+
+    drivers, teams, info = title_odds(
+        season.calendar, season.race, season.sprint, pointsTables,
+        args.after, args.sims, args.workers, args.seed, processes=not args.threads,
+    )
+    with pd.option_context("display.float_format", "{:.2f}".format, "display.width", 140):
+        print(drivers.head(10).to_string(index=False))
+        print()
+        print(teams.to_string(index=False))
+    print(
+        f"\n{info['sims']:,} simulations of {info['rounds']} rounds ({info['sprints']} sprints) "
+        f"in {info['seconds']:.2f}s on {info['workers']} worker(s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
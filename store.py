@@ -0,0 +1,515 @@
+import hashlib
+import os
+from functools import lru_cache, wraps
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+
+# ----------------------------------
+# SOURCE FILES & CACHE LOCATION
+# ----------------------------------
+FILES = {
+    "calendar": "Formula1_Calendar.csv",
+    "drivers": "Formula1_Drivers.csv",
+    "race": "Formula1_RaceResults.csv",
+    "sprint": "Formula1_SprintResults.csv",
+}
+
+# Older seasons have no sprint weekends; a missing sprint file is read as empty.
+OPTIONAL_FILES = {"sprint"}
+
+SPRINT_COLUMNS = [
+    "Track", "Position", "No", "Driver", "Team",
+    "Starting Grid", "Laps", "Time/Retired", "Points",
+]
+
+CACHE_DIR = os.environ.get("F1_CACHE_DIR", ".f1_cache")
+
+# Bump when the typed schema below changes so stale cache files are ignored.
+SCHEMA_VERSION = 4
+
+
+# ----------------------------------
+# TYPED SCHEMA
+# ----------------------------------
+# Status codes replace the free-text 'Position' / 'Time/Retired' markers.
+STATUS_CODES = ["FIN", "LAP", "DNF", "DNS", "DSQ", "NC"]
+
+RESULT_DTYPES = {
+    "Position": "Int8",
+    "No": "int16",
+    "Starting Grid": "int8",
+    "Laps": "int16",
+    # half points are awarded for shortened races
+    "Points": "float32",
+    "Time (s)": "float64",
+    "Gap (s)": "float64",
+    "Laps Down": "Int8",
+}
+
+RACE_DTYPES = {
+    **RESULT_DTYPES,
+    "Set Fastest Lap": "bool",
+    "Fastest Lap (s)": "float64",
+}
+
+CALENDAR_DTYPES = {
+    "Round": "int8",
+    "First GP": "int16",
+    "Number of Laps": "int16",
+    "Circuit Length(km)": "float32",
+    "Race Distance(km)": "float32",
+    "Record Year": "int16",
+    "Turns": "int8",
+    "DRS Zones": "int8",
+}
+
+DRIVER_DTYPES = {
+    "Race Number": "int16",
+    "Grand Prix Entered": "int16",
+    "Career Points": "float32",
+    "Podiums": "int16",
+    "Pole Positions": "int16",
+    "World Championships": "int8",
+    "DNFs": "int16",
+}
+
+
+class Season(NamedTuple):
+    calendar: pd.DataFrame
+    drivers: pd.DataFrame
+    race: pd.DataFrame
+    sprint: pd.DataFrame
+    version: str
+
+
+# ----------------------------------
+# PARSERS (VECTORIZED)
+# ----------------------------------
+def _by_distinct(values, parse):
+    # Runs `parse` once per distinct string and broadcasts the result back:
+    # across many seasons the same few thousand gaps / lap times / markers
+    # repeat, and the regex work is what dominates parsing
+    codes, uniques = pd.factorize(values.astype("string"), use_na_sentinel=False)
+    parsed = parse(pd.Series(uniques, dtype="string"))
+    return pd.Series(parsed.to_numpy()[codes], index=values.index, dtype=parsed.dtype)
+
+
+def _seconds(values):
+    # the source also has "h:mm.ss.sss" (a '.' typed for the second ':')
+    values = values.str.replace(r"^(\d+):(\d+)\.(\d+\.\d+)$", r"\1:\2:\3", regex=True)
+    parts = values.str.extract(r"^(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)$")
+    hours = pd.to_numeric(parts[0], errors="coerce").fillna(0)
+    minutes = pd.to_numeric(parts[1], errors="coerce").fillna(0)
+    seconds = pd.to_numeric(parts[2], errors="coerce")
+    return (hours * 3600 + minutes * 60 + seconds).astype("float64")
+
+
+def parse_seconds(values):
+    # "h:mm:ss.s", "mm:ss.s" or "ss.sss" -> float seconds, anything else -> NaN
+    return _by_distinct(values, _seconds)
+
+
+def parse_gap(position, status, seconds):
+    # Gap to the winner: 0 for P1 (whose 'Time/Retired' is the race time),
+    # the parsed gap for other finishers on the lead lap, NaN otherwise
+    winner = (position == 1).fillna(False)
+    onLeadLap = (status == "FIN") & seconds.notna()
+    return seconds.where(onLeadLap & ~winner).mask(winner, 0.0)
+
+
+def parse_laps_down(retired, status):
+    # "+1 lap" / "+2 laps" -> 1 / 2, finishers on the lead lap -> 0, else NA
+    laps = _by_distinct(retired, lambda v: pd.to_numeric(v.str.extract(r"^\+(\d+) laps?$")[0], errors="coerce"))
+    return laps.mask(status == "FIN", 0).astype("Int8")
+
+
+def parse_status(position, retired):
+    position = position.astype("string")
+    retired = retired.astype("string")
+
+    status = np.select(
+        [
+            retired.isin(["DNF", "DNS", "DSQ"]).to_numpy(dtype=bool),
+            (position == "DQ").to_numpy(dtype=bool, na_value=False),
+            (position == "NC").to_numpy(dtype=bool, na_value=False),
+            retired.str.startswith("+").to_numpy(dtype=bool, na_value=False),
+        ],
+        [retired.to_numpy(dtype=object), "DSQ", "NC", "LAP"],
+        default="FIN",
+    )
+
+    return pd.Categorical(status, categories=STATUS_CODES)
+
+
+def _categories(*columns, order=None):
+    if order is not None:
+        return pd.CategoricalDtype(order)
+    values = pd.concat([c.astype("string") for c in columns]).dropna().unique()
+    return pd.CategoricalDtype(sorted(values))
+
+
+def _type_results(df, tracks, drivers, teams, dtypes, fastest_lap=False):
+    position = pd.to_numeric(df["Position"], errors="coerce")
+    status = pd.Series(parse_status(df["Position"], df["Time/Retired"]), index=df.index)
+    seconds = parse_seconds(df["Time/Retired"])
+
+    out = pd.DataFrame({
+        "Track": df["Track"].astype(tracks),
+        "Position": position,
+        "Status": status,
+        "No": df["No"],
+        "Driver": df["Driver"].astype(drivers),
+        "Team": df["Team"].astype(teams),
+        "Starting Grid": df["Starting Grid"],
+        "Laps": df["Laps"],
+        "Time (s)": seconds,
+        "Gap (s)": parse_gap(position, status, seconds),
+        "Laps Down": parse_laps_down(df["Time/Retired"], status),
+        "Points": df["Points"].fillna(0),
+    })
+
+    if fastest_lap:
+        # seasons recorded before fastest laps were tracked get False / NaN
+        missing = pd.Series(index=df.index, dtype=object)
+        out["Set Fastest Lap"] = df.get("Set Fastest Lap", missing).eq("Yes")
+        out["Fastest Lap (s)"] = parse_seconds(df.get("Fastest Lap Time", missing))
+
+    return out.astype(dtypes)
+
+
+# ----------------------------------
+# CALENDAR JOIN (TRACK NAME -> ROUND)
+# ----------------------------------
+# The calendar has no track column: results name a round after its city
+# ("Miami"), its country ("Japan") or its Grand Prix ("Abu Dhabi"). A name
+# can fit several rounds (Italy: Imola and Monza), so names that fit a
+# single round settle first and strike it off the others; names still
+# open after that take their best-scoring round (city over country over
+# Grand Prix name).
+def _match_rounds(calendar, names):
+    rounds = calendar["Round"].to_numpy()
+    city, country, grandPrix = (
+        calendar[column].astype(str).str.casefold().to_numpy()
+        for column in ("City", "Country", "GP Name")
+    )
+
+    scores = {}
+    for name in names:
+        key = name.casefold()
+        score = 4 * (city == key) + 2 * (country == key) + np.array([key in gp for gp in grandPrix])
+        scores[name] = pd.Series(score[score > 0], index=rounds[score > 0])
+
+    matched = {}
+    while scores:
+        settled = {name: score.index[0] for name, score in scores.items() if len(score) == 1}
+        if not settled:
+            settled = {
+                name: score.idxmax() for name, score in scores.items()
+                if len(score) and (score == score.max()).sum() == 1
+            }
+        if not settled or len(set(settled.values())) < len(settled):
+            raise ValueError(f"tracks without a calendar round of their own: {sorted(scores)}")
+        matched.update(settled)
+        scores = {
+            name: score.drop(list(settled.values()), errors="ignore")
+            for name, score in scores.items() if name not in settled
+        }
+    return matched
+
+
+def _join_calendar(calendar, names):
+    # Track categories in calendar order plus the calendar's Track column.
+    # Track codes double as the round order (Round = code + 1, see
+    # analytics.build_results), so the tracks must be rounds 1..N.
+    names = pd.concat([n.astype("string") for n in names]).dropna().unique()
+    rounds = _match_rounds(calendar, list(names))
+    order = sorted(rounds, key=rounds.get)
+    missing = sorted(set(range(1, max(rounds.values(), default=0) + 1)) - set(rounds.values()))
+    if missing:
+        raise ValueError(f"results skip calendar rounds {missing}")
+
+    tracks = _categories(order=order)
+    track = calendar["Round"].map({round_: track for track, round_ in rounds.items()})
+    return tracks, calendar.assign(Track=track.astype(tracks))
+
+
+def build_season(calendar, drivers, race, sprint, version=""):
+    calendar = calendar.astype(CALENDAR_DTYPES)
+    calendar["Race Date"] = pd.to_datetime(calendar["Race Date"], format="%d-%m-%Y")
+    calendar["Lap Record (s)"] = parse_seconds(calendar["Lap Record"])
+    calendar = calendar.drop(columns="Lap Record")
+
+    # Track categories follow the calendar, joined on the track name, so
+    # .cat.categories doubles as the round order
+    tracks, calendar = _join_calendar(calendar, [race["Track"], sprint["Track"]])
+    driver_names = _categories(race["Driver"], sprint["Driver"])
+    teams = _categories(race["Team"], sprint["Team"])
+
+    race = _type_results(race, tracks, driver_names, teams, RACE_DTYPES, fastest_lap=True)
+    sprint = _type_results(sprint, tracks, driver_names, teams, RESULT_DTYPES)
+
+    drivers = drivers.astype(DRIVER_DTYPES)
+    drivers["Team"] = drivers["Team"].astype("category")
+    drivers["Date of Birth"] = pd.to_datetime(drivers["Date of Birth"], format="%d-%m-%Y")
+
+    return Season(calendar, drivers, race, sprint, version)
+
+
+# ----------------------------------
+# APPENDING ROUNDS
+# ----------------------------------
+def append_results(season, race_rows=None, sprint_rows=None):
+    # Types raw CSV-shaped rows against the season's schema, widening the
+    # categories where a new track / driver / team appears. Returns the
+    # grown Season (version untouched) plus the typed new rows.
+    race_rows = pd.DataFrame(columns=SPRINT_COLUMNS) if race_rows is None else race_rows
+    sprint_rows = pd.DataFrame(columns=SPRINT_COLUMNS) if sprint_rows is None else sprint_rows
+
+    known = season.race["Track"].cat.categories.to_series()
+    tracks, calendar = _join_calendar(season.calendar, [known, race_rows["Track"], sprint_rows["Track"]])
+
+    frames = [season.race, season.sprint, race_rows, sprint_rows]
+    driver_names = _categories(*(f["Driver"] for f in frames))
+    teams = _categories(*(f["Team"] for f in frames))
+    widened = {"Track": tracks, "Driver": driver_names, "Team": teams}
+
+    new_race = _type_results(race_rows, tracks, driver_names, teams, RACE_DTYPES, fastest_lap=True)
+    new_sprint = _type_results(sprint_rows, tracks, driver_names, teams, RESULT_DTYPES)
+
+    race = pd.concat([season.race.astype(widened), new_race], ignore_index=True)
+    sprint = pd.concat([season.sprint.astype(widened), new_sprint], ignore_index=True)
+
+    return season._replace(calendar=calendar, race=race, sprint=sprint), new_race, new_sprint
+
+
+# ----------------------------------
+# READ-ONLY FRAMES (SHARED BY EVERY SESSION)
+# ----------------------------------
+# Snapshots and cached results are held once per process and handed to
+# every session as-is. freeze() makes their arrays read-only, so writing a
+# value raises instead of changing what other sessions see; FrozenFrame also
+# refuses adding / dropping columns and inplace=True. Anything derived from a
+# frozen frame (filters, groupbys, copies) is an ordinary DataFrame.
+class ReadOnlyError(TypeError):
+    pass
+
+
+def _refuse(self, *args, **kwargs):
+    raise ReadOnlyError("shared dataset is read-only: work on a derived frame or .copy()")
+
+
+class _ReadOnlyIndexer:
+    # .loc / .iloc / .at / .iat for reading only: under copy-on-write an
+    # indexed write would silently swap in a copy rather than hit the
+    # read-only arrays
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __getattr__(self, name):
+        # pandas reaches into its own indexers while reading
+        return getattr(self._indexer, name)
+
+    def __call__(self, axis=None):
+        return _ReadOnlyIndexer(self._indexer(axis))
+
+    __setitem__ = _refuse
+
+
+class FrozenFrame(pd.DataFrame):
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    __setitem__ = __delitem__ = insert = isetitem = pop = _update_inplace = _refuse
+
+    loc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.loc.fget(self)))
+    iloc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iloc.fget(self)))
+    at = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.at.fget(self)))
+    iat = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iat.fget(self)))
+
+    def __setattr__(self, name, value):
+        if name in ("index", "columns") or name in self.columns:
+            _refuse(self)
+        super().__setattr__(name, value)
+
+
+def _copy_only(method):
+    # some inplace=True paths (fillna, where, ...) write straight into the
+    # arrays instead of going through _update_inplace
+    @wraps(method)
+    def checked(self, *args, inplace=False, **kwargs):
+        if inplace:
+            _refuse(self)
+        return method(self, *args, **kwargs)
+    return checked
+
+
+for _name in (
+    "bfill", "clip", "drop", "drop_duplicates", "dropna", "eval", "ffill", "fillna", "interpolate", "mask",
+    "query", "rename", "rename_axis", "replace", "reset_index", "set_index", "sort_index", "sort_values", "where",
+):
+    setattr(FrozenFrame, _name, _copy_only(getattr(pd.DataFrame, _name)))
+
+
+def _lock_array(values):
+    # numpy buffers behind pandas' array types (categorical codes, masked
+    # integers, numpy-backed extension arrays); Arrow buffers are immutable
+    for attr in ("_ndarray", "_codes", "_data", "_mask"):
+        inner = getattr(values, attr, None)
+        if isinstance(inner, np.ndarray):
+            inner.flags.writeable = False
+    if isinstance(values, np.ndarray):
+        values.flags.writeable = False
+
+
+def freeze(obj):
+    # DataFrames / Series / numpy arrays, also inside dicts, lists and
+    # NamedTuples; other values are returned unchanged
+    if isinstance(obj, pd.DataFrame):
+        frozen = obj if isinstance(obj, FrozenFrame) else FrozenFrame(obj)
+        for values in frozen._mgr.arrays:
+            _lock_array(values)
+        return frozen
+    if isinstance(obj, pd.Series):
+        _lock_array(obj.array)
+        _lock_array(obj.to_numpy())
+        return obj
+    if isinstance(obj, np.ndarray):
+        _lock_array(obj)
+        return obj
+    if isinstance(obj, dict):
+        return {key: freeze(value) for key, value in obj.items()}
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return obj._replace(**{field: freeze(getattr(obj, field)) for field in obj._fields})
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(freeze(value) for value in obj)
+    return obj
+
+
+# ----------------------------------
+# CONTENT HASH
+# ----------------------------------
+def _file_stats(data_dir):
+    # (mtime, size) per source file, None for a missing optional file
+    stats = []
+    for key, name in FILES.items():
+        try:
+            stat = os.stat(os.path.join(data_dir, name))
+        except FileNotFoundError:
+            if key not in OPTIONAL_FILES:
+                raise
+            stats.append(None)
+            continue
+        stats.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stats)
+
+
+def content_hash(data_dir="."):
+    # Hashing reads every CSV, and the registry asks for each season's version
+    # on every History rerun and per scanned table, so a hash is reused for
+    # as long as the files keep their modification time and size.
+    return _hash_files(os.path.abspath(data_dir), _file_stats(data_dir))
+
+
+@lru_cache(maxsize=256)
+def _hash_files(data_dir, stats):
+    h = hashlib.sha256(f"schema-{SCHEMA_VERSION}".encode())
+    for (key, name), stat in zip(FILES.items(), stats):
+        if stat is None:
+            h.update(f"missing-{key}".encode())
+            continue
+        with open(os.path.join(data_dir, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def _read_csv(data_dir, key):
+    path = os.path.join(data_dir, FILES[key])
+    if key in OPTIONAL_FILES and not os.path.exists(path):
+        return pd.DataFrame(columns=SPRINT_COLUMNS)
+    return pd.read_csv(path)
+
+
+# ----------------------------------
+# BINARY CACHE (ARROW IPC, MEMORY-MAPPED)
+# ----------------------------------
+def _cache_path(cache_dir, version, name):
+    return os.path.join(cache_dir, f"{version}-{name}.arrow")
+
+
+def _read_cache(cache_dir, version):
+    frames = {}
+    for name in FILES:
+        path = _cache_path(cache_dir, version, name)
+        if not os.path.exists(path):
+            return None
+        frames[name] = read_partition(path)
+    return Season(**frames, version=version)
+
+
+def read_partition(path, columns=None):
+    return feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+
+
+def _write_cache(cache_dir, season):
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name in FILES:
+            path = _cache_path(cache_dir, season.version, name)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            table = pa.Table.from_pandas(getattr(season, name), preserve_index=False)
+            # uncompressed so readers can memory-map instead of decoding
+            feather.write_feather(table, tmp, compression="uncompressed")
+            os.replace(tmp, path)
+    except OSError:
+        # read-only deployments simply fall back to parsing on every cold start
+        pass
+
+
+# ----------------------------------
+# PUBLIC ENTRY POINT
+# ----------------------------------
+def _parse_season(data_dir, version):
+    return build_season(*(_read_csv(data_dir, key) for key in FILES), version=version)
+
+
+def load_season(data_dir=".", cache_dir=None):
+    if cache_dir is None:
+        cache_dir = os.path.join(data_dir, CACHE_DIR)
+
+    version = content_hash(data_dir)
+
+    season = _read_cache(cache_dir, version)
+    if season is not None:
+        return season
+
+    season = _parse_season(data_dir, version)
+    _write_cache(cache_dir, season)
+    return season
+
+
+def season_partitions(data_dir=".", cache_dir=None):
+    # (version, {table: arrow path}) without loading the season into memory;
+    # paths is None when the cache directory cannot be written.
+    if cache_dir is None:
+        cache_dir = os.path.join(data_dir, CACHE_DIR)
+
+    version = content_hash(data_dir)
+    paths = {name: _cache_path(cache_dir, version, name) for name in FILES}
+
+    if not all(os.path.exists(path) for path in paths.values()):
+        _write_cache(cache_dir, _parse_season(data_dir, version))
+        if not all(os.path.exists(path) for path in paths.values()):
+            return version, None
+
+    return version, paths
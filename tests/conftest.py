@@ -0,0 +1,47 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def season_dir(tmp_path):
+    # a copy of the current season's CSVs in a directory of its own
+    for name in os.listdir(ROOT):
+        if name.startswith("Formula1_") and name.endswith(".csv"):
+            shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+    return tmp_path
+
+
+@pytest.fixture
+def older_season(season_dir):
+    # a season recorded before fastest laps were tracked: the race file has
+    # neither 'Set Fastest Lap' nor 'Fastest Lap Time', and no sprints
+    import pandas as pd
+    from store import FILES, load_season
+
+    race = pd.read_csv(season_dir / FILES["race"])
+    race.drop(columns=["Set Fastest Lap", "Fastest Lap Time"]).to_csv(season_dir / FILES["race"], index=False)
+    os.remove(season_dir / FILES["sprint"])
+    return load_season(season_dir)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", help="also run the tests marked slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: long-running test, skipped unless --run-slow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip = pytest.mark.skip(reason="slow; run with --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,69 @@
+import http.client
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from api import serve_api
+from seasons import SeasonRegistry
+from store import FILES, load_season
+
+
+@pytest.fixture
+def api(season_dir):
+    # the API over a copy of the current season, on a free port
+    registry = SeasonRegistry(season_dir)
+    server = serve_api(registry, port=0, host="127.0.0.1")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield registry, server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _get(port, path, etag=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        conn.request("GET", path, headers={"If-None-Match": etag} if etag else {})
+        response = conn.getresponse()
+        return response.status, response.getheader("ETag"), response.read()
+    finally:
+        conn.close()
+
+
+def test_etags_revalidate_until_the_data_changes(api, season_dir):
+    registry, port = api
+    path = "/api/latest/drivers/driver-standings"
+
+    status, etag, body = _get(port, path)
+    assert status == 200
+    assert etag and etag.startswith('"') and etag.endswith('"')
+    assert json.loads(body)["data"]
+
+    # strong and weak forms of the tag, alone or in a list
+    for header in (etag, f"W/{etag}", f'"stale", {etag}'):
+        status, again, body = _get(port, path, header)
+        assert (status, again, body) == (304, etag, b"")
+    assert _get(port, path, '"stale"')[0] == 200
+
+    # edit a result: the season gets a new version and the old tag stops matching
+    race = pd.read_csv(season_dir / FILES["race"])
+    race.loc[0, "Points"] += 1
+    race.to_csv(season_dir / FILES["race"], index=False)
+    registry.live(registry.latest()).reload(load_season(season_dir))
+
+    status, changed, body = _get(port, path, etag)
+    assert status == 200
+    assert changed != etag
+    assert json.loads(body)["version"] == registry.live(registry.latest()).version
+    assert _get(port, path, changed)[0] == 304
+
+
+def test_unknown_paths_are_not_found(api):
+    _, port = api
+    status, etag, body = _get(port, "/api/latest/drivers/no-such-analysis")
+    assert status == 404 and etag is None
+    assert json.loads(body) == {"error": "not found"}
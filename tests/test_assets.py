@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+import assets
+from assets import SOURCES, asset_url, build, check
+
+
+@pytest.fixture
+def asset_dir(tmp_path, monkeypatch):
+    # an empty build directory in place of static/assets/
+    target = tmp_path / "assets"
+    monkeypatch.setattr(assets, "ASSET_DIR", str(target))
+    monkeypatch.setattr(assets, "MANIFEST", str(target / "manifest.json"))
+    return target
+
+
+@pytest.fixture
+def originals(tmp_path):
+    # stand-ins for the source images: photos as JPEG, logos with transparency
+    from PIL import Image
+
+    folder = tmp_path / "originals"
+    folder.mkdir()
+    for name, (url, width) in SOURCES.items():
+        if name.startswith("engine-"):
+            Image.new("RGBA", (width * 2, width), (200, 0, 0, 128)).save(folder / f"{name}.png")
+        else:
+            Image.new("RGB", (width * 2, width), (0, 0, 200)).save(folder / f"{name}.jpg")
+    return folder
+
+
+def test_check_fails_without_built_assets(asset_dir, capsys):
+    assert asset_url(next(iter(SOURCES))) is None
+    assert check() == 1
+    assert "not built" in capsys.readouterr().out
+
+
+def test_built_pages_reference_no_external_urls(asset_dir, originals, capsys):
+    # every page and analysis of the app, through Streamlit's AppTest
+    manifest = build(str(originals))
+    capsys.readouterr()
+
+    assert sorted(manifest) == sorted(SOURCES)
+    assert json.loads((asset_dir / "manifest.json").read_text()) == manifest
+    for name, entry in manifest.items():
+        assert (asset_dir / entry["file"]).is_file()
+        assert entry["width"] <= SOURCES[name][1]
+        assert asset_url(name) == assets.ASSET_URL + entry["file"]
+
+    assert check() == 0, capsys.readouterr().out
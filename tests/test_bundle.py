@@ -0,0 +1,48 @@
+import hashlib
+import json
+import os
+import shutil
+
+import bundle
+
+
+def _fake_render(season, category, analysis, highlights, opacities):
+    # one small file per view instead of a rendered chart
+    views = {}
+    for highlight in highlights:
+        for opacity in opacities:
+            view = bundle._view(category, analysis, highlight, opacity)
+            file = hashlib.sha256(f"{season}{view}".encode()).hexdigest()[:16] + ".png"
+            with open(os.path.join(bundle.BUNDLE_DIR, file), "wb") as f:
+                f.write(view.encode())
+            views[view] = file
+    return views
+
+
+def test_partial_rebuild_keeps_other_seasons(season_dir, tmp_path, monkeypatch):
+    older = season_dir / "seasons" / "2024"
+    older.mkdir(parents=True)
+    for name in os.listdir(season_dir):
+        if name.endswith(".csv"):
+            shutil.copy(season_dir / name, older / name)
+
+    out = tmp_path / "bundle"
+    monkeypatch.setattr(bundle, "BUNDLE_DIR", str(out))
+    monkeypatch.setattr(bundle, "INDEX", str(out / "index.json"))
+    monkeypatch.setattr(bundle, "render_views", _fake_render)
+
+    full = bundle.build(str(season_dir), workers=1, opacities=(1.0,))
+    assert sorted(full["seasons"]) == ["2024", "2025"]
+    files2025 = set(full["seasons"]["2025"]["views"].values())
+
+    bundle.build(str(season_dir), seasons=[2024], workers=1, opacities=(0.5, 1.0))
+    with open(out / "index.json") as f:
+        index = json.load(f)
+
+    assert sorted(index["seasons"]) == ["2024", "2025"]
+    assert index["seasons"]["2025"] == full["seasons"]["2025"]
+    assert index["seasons"]["2024"]["opacities"] == [0.5, 1.0]
+    assert files2025 <= set(os.listdir(out))
+    # nothing but the files the index refers to
+    referenced = {file for entry in index["seasons"].values() for file in entry["views"].values()}
+    assert set(os.listdir(out)) == referenced | {"index.json"}
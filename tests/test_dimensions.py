@@ -0,0 +1,14 @@
+import pandas as pd
+import pytest
+
+from dimensions import lookup
+from ingest import LiveSeason
+from store import load_season
+
+
+def test_lookup_rejects_unknown_names(season_dir):
+    teams = LiveSeason(load_season(season_dir)).snapshot().dimensions.teams
+
+    assert list(lookup(teams, pd.Index(["McLaren", "Ferrari"]))["Team"]) == ["McLaren", "Ferrari"]
+    with pytest.raises(KeyError, match="Brawn GP"):
+        lookup(teams, pd.Index(["McLaren", "Brawn GP"]))
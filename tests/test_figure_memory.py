@@ -0,0 +1,68 @@
+import gc
+import io
+import os
+
+import matplotlib.pyplot as plt
+import pytest
+
+from analytics import DRIVER_CHARTS, TEAM_CHARTS
+from charts import draw_driver_chart, draw_team_chart
+from figures import MAX_IDLE_PER_LAYOUT, pool_stats, release_figure
+from ingest import LiveSeason
+from store import load_season
+
+# every analysis is drawn and rasterized this many times after the warm-up;
+# at ~0.15 s a chart the default takes the better part of an hour, hence the
+# slow marker (pytest --run-slow)
+ROUNDS = int(os.environ.get("F1_MEMORY_ROUNDS", 1000))
+WARM_UP = 10
+MAX_RSS_GROWTH = 8 * 1024 * 1024
+
+
+def _rss():
+    # resident set size in bytes (psutil is not a dependency)
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _rasterize(fig):
+    # the same Agg draw and PNG encode the app runs, at a dpi the loop can afford
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=10)
+    return buf.getvalue()
+
+
+@pytest.mark.slow
+def test_repeated_renders_hold_memory_flat(season_dir):
+    snapshot = LiveSeason(load_season(season_dir)).snapshot()
+    race = snapshot.season.race
+    drivers = sorted(race["Driver"].unique())
+    teams = sorted(race["Team"].unique())
+
+    def render_all(step):
+        for analysis in DRIVER_CHARTS:
+            fig = draw_driver_chart(race, snapshot.counts, snapshot.points, snapshot.positions, snapshot.form, snapshot.dimensions, 2025, analysis, drivers[step % len(drivers)], 0.3 + 0.1 * (step % 5))
+            try:
+                assert _rasterize(fig)
+            finally:
+                release_figure(fig)
+        for analysis in TEAM_CHARTS:
+            fig = draw_team_chart(race, snapshot.counts, snapshot.points, snapshot.form, snapshot.dimensions, 2025, analysis, teams[step % len(teams)], 0.3)
+            try:
+                assert _rasterize(fig)
+            finally:
+                release_figure(fig)
+
+    # warm-up: fills the pool and matplotlib's font / text caches
+    for step in range(WARM_UP):
+        render_all(step)
+    gc.collect()
+    baseline = _rss()
+
+    for step in range(ROUNDS):
+        render_all(step)
+    gc.collect()
+
+    assert plt.get_fignums() == []
+    assert all(idle <= MAX_IDLE_PER_LAYOUT for idle in pool_stats().values())
+    assert _rss() - baseline < MAX_RSS_GROWTH
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics import rolling_form
+from ingest import LiveSeason
+from store import FILES, load_season
+
+
+def _brute_force(season, key, window, end):
+    # form straight from the result rows of the rounds in the window
+    tracks = list(season.race["Track"].cat.categories)
+    end = len(tracks) if end is None else min(max(end, 1), len(tracks))
+    inWindow = tracks[max(end - window, 0):end]
+    race = season.race[season.race["Track"].isin(inWindow)]
+    sprint = season.sprint[season.sprint["Track"].isin(inWindow)]
+
+    rows = {}
+    for name, entries in race.groupby(race[key].astype(str)):
+        classified = entries[entries["Status"].isin(["FIN", "LAP"])]
+        points = entries["Points"].sum() + sprint.loc[sprint[key].astype(str) == name, "Points"].sum()
+        rounds = entries["Track"].nunique()
+        rows[name] = {
+            "Rounds": rounds,
+            "Avg Points": points / rounds,
+            "Avg Finish": classified["Position"].astype(float).mean() if len(classified) else np.nan,
+            "DNF Rate": (entries["Status"] == "DNF").sum() / len(entries),
+        }
+    return pd.DataFrame.from_dict(rows, orient="index"), inWindow
+
+
+@pytest.fixture
+def snapshot(season_dir):
+    # the current season with one driver sitting out rounds 3 to 5 as well
+    race = pd.read_csv(season_dir / FILES["race"])
+    absent = race["Driver"].eq("Lando Norris") & race["Track"].isin(race["Track"].unique()[2:5])
+    race[~absent].to_csv(season_dir / FILES["race"], index=False)
+    return LiveSeason(load_season(season_dir)).snapshot()
+
+
+@pytest.mark.parametrize("key", ["Driver", "Team"])
+@pytest.mark.parametrize("window", [1, 3, 5, 10, 24, 100])
+@pytest.mark.parametrize("end", [None, 1, 4, 12])
+def test_rolling_form_matches_brute_force(snapshot, key, window, end):
+    form = rolling_form(snapshot.form[key], window, end)
+    expected, inWindow = _brute_force(snapshot.season, key, window, end)
+
+    assert sorted(form.index.astype(str)) == sorted(expected.index)
+    form = pd.DataFrame(form.to_numpy(dtype=float), index=form.index.astype(str), columns=form.columns)
+    pd.testing.assert_frame_equal(form, expected.loc[form.index].astype(float), check_exact=False, rtol=1e-6)
+
+    # best average points first; the window is clipped to the rounds raced
+    assert form["Avg Points"].is_monotonic_decreasing
+    assert (form["Rounds"] <= len(inWindow)).all()
+
+
+def test_form_window_attributes(snapshot):
+    tracks = snapshot.season.race["Track"].cat.categories
+    form = rolling_form(snapshot.form["Driver"], 100)
+    assert form.attrs == {"window": len(tracks), "first": str(tracks[0]), "last": str(tracks[-1])}
+
+    form = rolling_form(snapshot.form["Driver"], 3, 4)
+    assert form.attrs == {"window": 3, "first": str(tracks[1]), "last": str(tracks[3])}
+    # a driver absent from part of the window averages over the rounds raced
+    assert form.loc["Lando Norris", "Rounds"] == 1
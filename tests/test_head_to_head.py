@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+
+from analytics import head_to_head
+
+
+def test_grid_slots_past_the_field_are_ignored():
+    # three starters per round; 99 is a typo for a slot that does not exist
+    race = pd.DataFrame({
+        "Track": ["Bahrain"] * 3 + ["Jeddah"] * 3,
+        "Driver": ["A", "B", "C"] * 2,
+        "Team": ["X", "X", "Y"] * 2,
+        "Position": pd.array([1, 2, 3, 1, 2, 3], dtype="Int8"),
+        "Status": ["FIN"] * 6,
+        "Laps": [57] * 6,
+        "Starting Grid": [1, 2, 3, 99, 1, 2],
+    })
+
+    h2h = head_to_head(race)
+
+    # A's typo'd Jeddah slot drops out; only Bahrain (1 vs 2) is compared
+    assert h2h["Grid Delta"].loc["A", "B"] == -1
+    assert h2h["Grid Delta"].loc["B", "C"] == -1
+    assert np.isclose(h2h["Grid Delta"].loc["A", "C"], -2)
@@ -0,0 +1,61 @@
+import logging
+import threading
+import time
+
+from ingest import MAX_POLL_FAILURES, LiveSeason, RoundWatcher
+from store import load_season
+
+
+def test_watcher_logs_failures_and_reloads(season_dir, caplog, monkeypatch):
+    watcher = RoundWatcher(LiveSeason(load_season(season_dir)), season_dir, interval=0.001)
+    polls, reloaded = [], threading.Event()
+
+    def broken_poll():
+        polls.append(1)
+        raise ValueError("malformed row")
+
+    monkeypatch.setattr(watcher, "poll", broken_poll)
+    monkeypatch.setattr(watcher.live, "reload", lambda season: reloaded.set())
+
+    with caplog.at_level(logging.WARNING, logger="ingest"):
+        watcher.start()
+        try:
+            assert reloaded.wait(5)
+        finally:
+            watcher.stop()
+            watcher.join(5)
+
+    assert len(polls) >= MAX_POLL_FAILURES
+    assert "poll failed" in caplog.text
+    assert caplog.records[0].exc_info is not None
+
+
+def test_watcher_survives_unexpected_errors(season_dir, caplog, monkeypatch):
+    watcher = RoundWatcher(LiveSeason(load_season(season_dir)), season_dir, interval=0.001)
+    reloads = []
+
+    def broken_poll():
+        raise RuntimeError("unexpected")
+
+    def broken_reload(season):
+        reloads.append(watcher._failures)
+        raise RuntimeError("still broken")
+
+    monkeypatch.setattr(watcher, "poll", broken_poll)
+    monkeypatch.setattr(watcher.live, "reload", broken_reload)
+
+    with caplog.at_level(logging.WARNING, logger="ingest"):
+        watcher.start()
+        try:
+            for _ in range(500):
+                if len(reloads) >= 3:
+                    break
+                time.sleep(0.01)
+            assert watcher.is_alive()
+        finally:
+            watcher.stop()
+            watcher.join(5)
+
+    # failed reloads keep the count going instead of resetting it
+    assert reloads[:3] == [MAX_POLL_FAILURES, MAX_POLL_FAILURES + 1, MAX_POLL_FAILURES + 2]
+    assert "reloading" in caplog.text
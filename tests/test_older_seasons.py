@@ -0,0 +1,40 @@
+import json
+
+from analytics import DRIVER_CHARTS, TEAM_CHARTS, team_chart_data
+from charts import draw_driver_chart, draw_team_chart
+from figures import release_figure
+from ingest import LiveSeason
+from vega_charts import team_chart_spec
+
+
+def test_driver_charts_without_fastest_laps(older_season):
+    assert not older_season.race["Set Fastest Lap"].any()
+    snapshot = LiveSeason(older_season).snapshot()
+
+    for analysis in DRIVER_CHARTS:
+        fig = draw_driver_chart(snapshot.season.race, snapshot.counts, snapshot.points, snapshot.positions, snapshot.form, snapshot.dimensions, 1990, analysis, None, 0.3)
+        try:
+            assert fig.axes, analysis
+            if analysis == "Fastest Lap Counts":
+                assert "No fastest laps" in fig.axes[0].texts[0].get_text()
+        finally:
+            release_figure(fig)
+
+
+def test_team_charts_without_lap_times(older_season):
+    assert older_season.race["Fastest Lap (s)"].isna().all()
+    snapshot = LiveSeason(older_season).snapshot()
+
+    for analysis in TEAM_CHARTS:
+        fig = draw_team_chart(snapshot.season.race, snapshot.counts, snapshot.points, snapshot.form, snapshot.dimensions, 1990, analysis, None, 0.3)
+        try:
+            assert fig.axes, analysis
+            if analysis in ("Fastest Lap per Track", "Fastest Lap Pace"):
+                assert "No lap times" in fig.axes[0].texts[0].get_text()
+        finally:
+            release_figure(fig)
+
+        data = team_chart_data(analysis, snapshot.season.race, snapshot.counts, snapshot.points, snapshot.form)
+        frame, spec = team_chart_spec(data, snapshot.dimensions, 1990, analysis, None, 0.3)
+        # NaN is not valid JSON; the browser would reject the spec
+        json.dumps(spec, allow_nan=False)
@@ -0,0 +1,99 @@
+import pandas as pd
+
+from render_cache import RenderCache
+from seasons import SeasonRegistry
+from store import FILES
+
+
+def test_least_recently_used_entries_go_first():
+    cache = RenderCache(max_entries=3, max_bytes=1 << 20)
+    for key in "abc":
+        cache.put(key, key.encode())
+
+    assert cache.get("a") == b"a"
+    assert cache.get("x") is None
+    cache.put("d", b"d")
+
+    # "a" was read after "b" and "c" were written, so "b" is the oldest
+    assert [key for key in "abcd" if cache.get(key) is not None] == ["a", "c", "d"]
+    cache.put("e", b"e")
+    cache.put("f", b"f")
+    assert [key for key in "acdef" if cache.get(key) is not None] == ["d", "e", "f"]
+    assert cache.stats() == {
+        "entries": 3, "bytes": 3, "max_entries": 3, "max_bytes": 1 << 20,
+        "hits": 1 + 3 + 3, "misses": 1 + 1 + 2, "evictions": 3, "invalidations": 0,
+    }
+
+
+def test_byte_limit_evicts_oldest_and_skips_oversized():
+    cache = RenderCache(max_entries=100, max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    cache.put("a", b"12")
+    assert cache.stats()["bytes"] == 6
+
+    # 6 + 5 bytes is over the limit: "b" is now the least recently used
+    cache.put("c", b"12345")
+    assert cache.get("b") is None and cache.get("a") == b"12" and cache.get("c") == b"12345"
+    assert cache.stats()["bytes"] == 7
+
+    cache.put("big", b"x" * 11)
+    assert cache.get("big") is None
+    assert cache.stats()["entries"] == 2 and cache.stats()["evictions"] == 1
+
+
+def test_get_or_render_draws_once_per_key():
+    import matplotlib.figure
+
+    cache, draws = RenderCache(), []
+
+    def draw():
+        draws.append(1)
+        return matplotlib.figure.Figure(figsize=(2, 1))
+
+    first = cache.get_or_render("chart", draw)
+    assert first.startswith(b"\x89PNG")
+    assert cache.get_or_render("chart", draw) is first
+    assert len(draws) == 1
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+
+def test_new_rounds_drop_only_the_charts_that_read_them(season_dir):
+    # the season up to the round before the last sprint weekend
+    race, sprint = pd.read_csv(season_dir / FILES["race"]), pd.read_csv(season_dir / FILES["sprint"])
+    tracks = list(race["Track"].unique())
+    last = sprint["Track"].iloc[-1]
+    raced = tracks[:tracks.index(last)]
+    race[race["Track"].isin(raced)].to_csv(season_dir / FILES["race"], index=False)
+    sprint[sprint["Track"].isin(raced)].to_csv(season_dir / FILES["sprint"], index=False)
+
+    registry = SeasonRegistry(season_dir)
+    year = registry.latest()
+    live = registry.live(year)
+    cache = RenderCache()
+    # wired like app.get_chart_cache()
+    registry.on_change(cache.invalidate_tables)
+
+    def fill():
+        versions = live.snapshot().table_versions
+        keys = {
+            "race only": ("Drivers", "Race Winner Counts", "", 0.3, year, (("race", versions["race"]),), ()),
+            "race and sprint": ("Drivers", "Points Progression", "", 0.3, year, (("race", versions["race"]), ("sprint", versions["sprint"])), ()),
+            "other season": ("Drivers", "Points Progression", "", 0.3, year - 1, (("race", "v"), ("sprint", "v")), ()),
+        }
+        for key in keys.values():
+            cache.put(key, b"png")
+        return keys
+
+    keys = fill()
+    live.append_round(sprint_rows=sprint[sprint["Track"] == last])
+    assert {name for name, key in keys.items() if cache.get(key)} == {"race only", "other season"}
+    assert cache.stats()["invalidations"] == 1
+
+    keys = fill()
+    live.append_round(race_rows=race[race["Track"] == last])
+    assert {name for name, key in keys.items() if cache.get(key)} == {"other season"}
+    assert cache.stats()["invalidations"] == 1 + 2
+
+    # charts keyed by the new versions render again
+    assert cache.get(fill()["race only"]) == b"png"
@@ -0,0 +1,43 @@
+import os
+
+import pandas as pd
+
+from analytics import build_results
+from ingest import LiveSeason
+from store import FILES, load_season
+
+
+def test_empty_sprint_survives_warm_start(season_dir):
+    # seasons without sprints read their empty sprint frame back from the
+    # Arrow cache with no categories; the results table must still build
+    os.remove(season_dir / FILES["sprint"])
+    load_season(season_dir)
+    season = load_season(season_dir)
+
+    results = build_results(season.race, season.sprint)
+
+    assert results["Track"].dtype == season.race["Track"].dtype
+    assert results["Team"].dtype == season.race["Team"].dtype
+    assert results.index.get_level_values("Driver").dtype == season.race["Driver"].dtype
+    assert set(results.index.get_level_values("Session")) == {"Race"}
+    assert results.index.get_level_values("Round").max() == len(season.race["Track"].cat.categories)
+    assert LiveSeason(season).snapshot().counts["Driver"]["Wins"].sum() == (season.race["Position"] == 1).sum()
+
+
+def test_half_points_are_kept(season_dir):
+    # shortened races award half points; they must survive the typed cache
+    # and every points table built from it
+    race = pd.read_csv(season_dir / FILES["race"])
+    winner = race.index[0]
+    race["Points"] = race["Points"].astype(float)
+    race.loc[winner, "Points"] = 12.5
+    race.to_csv(season_dir / FILES["race"], index=False)
+    load_season(season_dir)
+    season = load_season(season_dir)
+
+    snapshot = LiveSeason(season).snapshot()
+    driver, track = race.loc[winner, "Driver"], race.loc[winner, "Track"]
+
+    assert snapshot.points["Driver"]["Race"].loc[driver, track] == 12.5
+    assert snapshot.counts["Driver"].loc[driver, "Race Points"] % 1 == 0.5
+    assert snapshot.points["Driver"]["Cumulative"].loc[driver].iloc[-1] == snapshot.counts["Driver"].loc[driver, "Total Points"]
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from ingest import LiveSeason
+from simulate import rounds_completed, title_odds
+from store import load_season
+
+AFTER = 20
+SIMS = 20_000
+
+
+def _odds(snapshot, pointsTables, seed=7):
+    season = snapshot.season
+    return title_odds(season.calendar, season.race, season.sprint, pointsTables, AFTER, SIMS, workers=1, seed=seed)
+
+
+def _with_bonus(pointsTables, bonus):
+    # a copy of the points tables with extra race points in round 1
+    tables = {key: dict(value) for key, value in pointsTables.items()}
+    race = tables["Driver"]["Race"].copy()
+    for driver, points in bonus.items():
+        race.iloc[race.index.get_loc(driver), 0] += points
+    tables["Driver"]["Race"] = race
+    return tables
+
+
+def _assert_bracketed(table):
+    assert (table["CI Low %"] <= table["Title %"]).all()
+    assert (table["Title %"] <= table["CI High %"]).all()
+    assert table["CI Low %"].between(0, 100).all() and table["CI High %"].between(0, 100).all()
+
+
+def test_title_odds_are_deterministic_and_bracketed(season_dir):
+    snapshot = LiveSeason(load_season(season_dir)).snapshot()
+    assert rounds_completed(snapshot.points) > AFTER
+
+    drivers, teams, info = _odds(snapshot, snapshot.points)
+    again, _, _ = _odds(snapshot, snapshot.points)
+    pd.testing.assert_frame_equal(drivers, again)
+
+    assert info["rounds"] > 0
+    assert drivers["Title %"].sum() == 100 and teams["Title %"].sum() == 100
+    # the title is still open after round 20
+    assert (drivers["Title %"] > 0).sum() > 1
+    _assert_bracketed(drivers)
+    _assert_bracketed(teams)
+
+
+def test_clinched_leader_and_eliminated_drivers(season_dir):
+    snapshot = LiveSeason(load_season(season_dir)).snapshot()
+    base = snapshot.points["Driver"]["Race"].sum(axis=1)
+    leader, last = base.idxmax(), base.idxmin()
+
+    # far more than the remaining rounds can pay, and a half point
+    drivers, _, _ = _odds(snapshot, _with_bonus(snapshot.points, {leader: 1000, last: 0.5}))
+    drivers = drivers.set_index("Driver")
+
+    assert drivers.loc[leader, "Title %"] == 100
+    assert drivers.loc[leader, "CI High %"] == 100
+    assert drivers.drop(leader)["Title %"].eq(0).all()
+    assert drivers.drop(leader)["CI Low %"].eq(0).all()
+    assert (drivers.drop(leader)["CI High %"] > 0).all()
+    _assert_bracketed(drivers)
+
+    standings = snapshot.points["Driver"]["Race"].iloc[:, :AFTER].sum(axis=1) + snapshot.points["Driver"]["Sprint"].iloc[:, :AFTER].sum(axis=1)
+    assert drivers.loc[last, "Points"] == standings[last] + 0.5
+    assert np.isclose(drivers.loc[leader, "Points"], standings[leader] + 1000)
@@ -0,0 +1,138 @@
+import pandas as pd
+import pytest
+
+from ingest import LiveSeason
+from store import FILES, FrozenFrame, ReadOnlyError, _hash_files, content_hash, freeze, load_season
+
+
+def test_content_hash_follows_file_changes(season_dir):
+    version = content_hash(season_dir)
+    hits = _hash_files.cache_info().hits
+
+    # unchanged files: the version comes from the cache, not a re-read
+    assert content_hash(season_dir) == version
+    assert _hash_files.cache_info().hits == hits + 1
+
+    with open(season_dir / FILES["race"], "a") as f:
+        f.write("\n")
+    appended = content_hash(season_dir)
+    assert appended != version
+
+    (season_dir / FILES["sprint"]).unlink()
+    assert content_hash(season_dir) not in (version, appended)
+
+
+def test_tracks_join_the_calendar_by_name(season_dir):
+    # rows out of round order still land on their calendar round
+    race = pd.read_csv(season_dir / FILES["race"])
+    race.iloc[::-1].to_csv(season_dir / FILES["race"], index=False)
+    season = load_season(season_dir)
+    snapshot = LiveSeason(season).snapshot()
+
+    calendar = pd.read_csv(season_dir / FILES["calendar"])
+    assert list(season.race["Track"].cat.categories) == list(race["Track"].drop_duplicates())
+    assert list(snapshot.dimensions.tracks["GP Name"]) == list(calendar["GP Name"])
+    assert snapshot.results.loc[snapshot.results["Track"] == "Abu Dhabi"].index.get_level_values("Round").unique().tolist() == [24]
+
+
+def test_sprint_ahead_of_its_race(season_dir):
+    # Saturday's sprint is in, Sunday's race is not yet
+    race = pd.read_csv(season_dir / FILES["race"])
+    sprint = pd.read_csv(season_dir / FILES["sprint"])
+    last = sprint["Track"].iloc[-1]
+    race[race["Track"] != last].to_csv(season_dir / FILES["race"], index=False)
+
+    snapshot = LiveSeason(load_season(season_dir)).snapshot()
+
+    assert snapshot.season.sprint["Track"].notna().all()
+    assert snapshot.results["Track ID"].min() == 0
+    assert snapshot.points["Driver"]["Sprint"][last].sum() == sprint.loc[sprint["Track"] == last, "Points"].sum()
+
+
+def test_results_that_skip_a_round_are_rejected(season_dir):
+    race = pd.read_csv(season_dir / FILES["race"])
+    sprint = pd.read_csv(season_dir / FILES["sprint"])
+    race[race["Track"] != "Japan"].to_csv(season_dir / FILES["race"], index=False)
+    sprint[sprint["Track"] != "Japan"].to_csv(season_dir / FILES["sprint"], index=False)
+
+    with pytest.raises(ValueError, match=r"rounds \[3\]"):
+        load_season(season_dir)
+
+
+WRITES = {
+    "setitem": lambda f: f.__setitem__("Points", 0),
+    "new column": lambda f: f.__setitem__("Extra", 0),
+    "delitem": lambda f: f.__delitem__("Points"),
+    "pop": lambda f: f.pop("Points"),
+    "insert": lambda f: f.insert(0, "Extra", 0),
+    "columns": lambda f: setattr(f, "columns", list(f.columns)),
+    "index": lambda f: setattr(f, "index", list(f.index)),
+    "column attribute": lambda f: setattr(f, "Points", 0),
+    "loc": lambda f: f.loc.__setitem__((f.index[0], "Points"), 0),
+    "loc column": lambda f: f.loc.__setitem__((slice(None), "Points"), 0),
+    "iloc": lambda f: f.iloc.__setitem__((0, 0), 0),
+    "iloc row": lambda f: f.iloc.__setitem__(0, f.iloc[1]),
+    "at": lambda f: f.at.__setitem__((f.index[0], "Points"), 0),
+    "iat": lambda f: f.iat.__setitem__((0, 0), 0),
+    "fillna": lambda f: f.fillna(0, inplace=True),
+    "drop": lambda f: f.drop(columns=["Points"], inplace=True),
+    "rename": lambda f: f.rename(columns={"Points": "Pts"}, inplace=True),
+    "sort_values": lambda f: f.sort_values("Points", inplace=True),
+    "reset_index": lambda f: f.reset_index(drop=True, inplace=True),
+    "where": lambda f: f.where(f.notna(), inplace=True),
+    "clip": lambda f: f.clip(lower=0, inplace=True),
+    "update": lambda f: f.update(f.head(1)),
+}
+
+
+@pytest.fixture
+def frozen_race(season_dir):
+    # a frame of a shared snapshot, as every session gets it
+    return LiveSeason(load_season(season_dir)).snapshot().season.race
+
+
+@pytest.mark.parametrize("write", WRITES)
+def test_frozen_frames_refuse_writes(frozen_race, write):
+    assert isinstance(frozen_race, FrozenFrame)
+    before = frozen_race.copy()
+
+    with pytest.raises(ReadOnlyError):
+        WRITES[write](frozen_race)
+    pd.testing.assert_frame_equal(pd.DataFrame(frozen_race), before)
+
+
+def test_frozen_arrays_are_read_only(frozen_race):
+    points = frozen_race["Points"].to_numpy()
+    with pytest.raises(ValueError):
+        points[0] = 0
+    with pytest.raises(ValueError):
+        frozen_race["Track"].array.codes[0] = 0
+
+    # a write through a column pulled out of the frame lands on a copy
+    column = frozen_race["Points"]
+    column.iloc[0] = -1
+    assert frozen_race["Points"].iloc[0] != -1
+
+
+def test_copies_of_frozen_frames_are_writable(frozen_race):
+    for frame in (frozen_race.copy(), frozen_race[frozen_race["Points"] > 0], frozen_race.head()):
+        assert type(frame) is pd.DataFrame
+        frame["Extra"] = 1
+        frame.loc[frame.index[0], "Points"] = -1
+        frame.iloc[0, 0] = frame.iloc[1, 0]
+        frame.fillna(0, inplace=True)
+        frame.drop(columns=["Extra"], inplace=True)
+        assert frame["Points"].iloc[0] == -1
+    assert (frozen_race["Points"] >= 0).all()
+
+
+def test_freeze_reaches_nested_containers():
+    frame = pd.DataFrame({"Points": [1.0, 2.0]})
+    frozen = freeze({"tables": [frame], "pair": (frame["Points"], frame.to_numpy())})
+
+    assert isinstance(frozen["tables"][0], FrozenFrame)
+    with pytest.raises(ReadOnlyError):
+        frozen["tables"][0]["Points"] = 0
+    with pytest.raises(ValueError):
+        frozen["pair"][1][0, 0] = 0
+    assert freeze(frozen["tables"][0]) is frozen["tables"][0]
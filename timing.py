@@ -0,0 +1,222 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+
+# ----------------------------------
+# SETTINGS
+# ----------------------------------
+# F1_TIMING=1 times every rerun; otherwise only ?debug=1 sessions are timed.
+# Spans outside a timed rerun cost one thread-local lookup.
+ENABLED = os.environ.get("F1_TIMING") == "1"
+METRICS_DIR = os.environ.get("F1_METRICS_DIR", ".f1_metrics")
+FLUSH_SECONDS = float(os.environ.get("F1_METRICS_FLUSH", 60))
+METRICS_PORT = int(os.environ.get("F1_METRICS_PORT", 0))
+
+# Prometheus histogram buckets (seconds)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (50, 95, 99)
+# recent samples kept per series for the percentiles
+WINDOW = 1024
+
+_local = threading.local()
+
+
+# ----------------------------------
+# PER-RERUN SPANS
+# ----------------------------------
+class Rerun:
+
+    def __init__(self):
+        self.view = "Overview"
+        self.started = time.perf_counter()
+        self.spans = []
+
+
+def start_rerun(enabled=ENABLED):
+    _local.rerun = Rerun() if enabled else None
+
+
+def rerun_active():
+    return getattr(_local, "rerun", None) is not None
+
+
+def set_view(view):
+    # the analysis being shown, e.g. "Drivers/Points Progression"
+    rerun = getattr(_local, "rerun", None)
+    if rerun is not None:
+        rerun.view = view
+
+
+class span:
+
+    __slots__ = ("name", "rerun", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.rerun = getattr(_local, "rerun", None)
+        if self.rerun is not None:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.rerun is not None:
+            self.rerun.spans.append((self.name, time.perf_counter() - self.start))
+        return False
+
+
+def finish_rerun():
+    # records the rerun into the process-wide metrics and returns
+    # (view, [(phase, seconds)]), or None when the rerun was not timed
+    rerun = getattr(_local, "rerun", None)
+    _local.rerun = None
+    if rerun is None:
+        return None
+
+    breakdown = rerun.spans + [("total", time.perf_counter() - rerun.started)]
+    for phase, seconds in breakdown:
+        METRICS.observe(rerun.view, phase, seconds)
+    METRICS.maybe_flush()
+    return rerun.view, breakdown
+
+
+# ----------------------------------
+# AGGREGATED HISTOGRAMS
+# ----------------------------------
+class Metrics:
+
+    def __init__(self, metrics_dir=METRICS_DIR, flush_seconds=FLUSH_SECONDS):
+        self.metrics_dir = metrics_dir
+        self.flush_seconds = flush_seconds
+        self._series = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def observe(self, view, phase, seconds):
+        with self._lock:
+            series = self._series.get((view, phase))
+            if series is None:
+                series = self._series[(view, phase)] = {
+                    "buckets": [0] * len(BUCKETS),
+                    "count": 0,
+                    "sum": 0.0,
+                    "recent": deque(maxlen=WINDOW),
+                }
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    series["buckets"][i] += 1
+            series["count"] += 1
+            series["sum"] += seconds
+            series["recent"].append(seconds)
+
+    def summary(self, view=None):
+        # {(view, phase): {count, sum, p50, p95, p99}} in seconds
+        with self._lock:
+            items = [(key, s["count"], s["sum"], list(s["recent"])) for key, s in self._series.items()]
+
+        out = {}
+        for key, count, total, recent in items:
+            if view is not None and key[0] != view:
+                continue
+            percentiles = np.percentile(recent, QUANTILES)
+            out[key] = {
+                "count": count,
+                "sum": total,
+                **{f"p{q}": float(v) for q, v in zip(QUANTILES, percentiles)},
+            }
+        return out
+
+    # ----------------------------------
+    # EXPORT (JSON LINES / PROMETHEUS TEXT)
+    # ----------------------------------
+    def prometheus_text(self):
+        with self._lock:
+            items = [(key, list(s["buckets"]), s["count"], s["sum"]) for key, s in sorted(self._series.items())]
+
+        lines = [
+            "# HELP f1_dashboard_phase_seconds Time spent per rerun phase.",
+            "# TYPE f1_dashboard_phase_seconds histogram",
+        ]
+        for (view, phase), buckets, count, total in items:
+            labels = f'view="{_escape(view)}",phase="{_escape(phase)}"'
+            for bound, n in zip(BUCKETS, buckets):
+                lines.append(f'f1_dashboard_phase_seconds_bucket{{{labels},le="{bound}"}} {n}')
+            lines.append(f'f1_dashboard_phase_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"f1_dashboard_phase_seconds_sum{{{labels}}} {total}")
+            lines.append(f"f1_dashboard_phase_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        summary = self.summary()
+        if not summary:
+            return
+        try:
+            os.makedirs(self.metrics_dir, exist_ok=True)
+
+            record = {
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "pid": os.getpid(),
+                "series": [{"view": view, "phase": phase, **stats} for (view, phase), stats in summary.items()],
+            }
+            with open(os.path.join(self.metrics_dir, "timings.jsonl"), "a") as f:
+                f.write(json.dumps(record) + "\n")
+
+            # textfile-collector style: replaced atomically on every flush
+            path = os.path.join(self.metrics_dir, "timings.prom")
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                f.write(self.prometheus_text())
+            os.replace(tmp, path)
+        except OSError:
+            # read-only deployments still get the in-app panel
+            pass
+
+    def maybe_flush(self):
+        if time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+METRICS = Metrics()
+atexit.register(METRICS.flush)
+
+
+# ----------------------------------
+# PROMETHEUS ENDPOINT (OPTIONAL)
+# ----------------------------------
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = METRICS.prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_metrics(port=METRICS_PORT):
+    # F1_METRICS_PORT=9108 serves http://host:9108/metrics; 0 leaves it off
+    if not port:
+        return None
+    server = ThreadingHTTPServer(("", port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics-http").start()
+    return server
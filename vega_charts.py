@@ -0,0 +1,442 @@
+import pandas as pd
+
+from analytics import form_label, lap_clock
+from dimensions import lookup
+
+
+# ----------------------------------
+# CLIENT-SIDE CHARTS (VEGA-LITE)
+# ----------------------------------
+# Same charts as charts.py, sent as compact data + a Vega-Lite spec for the
+# browser to draw (st.vega_lite_chart). Highlight and fade are chart params:
+# the sidebar only sets their initial values, and clicking the legend or
+# dragging the in-chart slider restyles without a server round trip.
+BACKGROUND = "#15151e"
+
+CONFIG = {
+    "background": BACKGROUND,
+    "view": {"stroke": None},
+    "title": {"color": "white", "fontSize": 16},
+    "axis": {
+        "labelColor": "white",
+        "titleColor": "white",
+        "domainColor": "white",
+        "tickColor": "white",
+        "gridColor": "#2a2a35",
+    },
+    "legend": {"labelColor": "white", "titleColor": "white"},
+}
+
+# analysis -> (title, x axis title, y axis title); {season} is filled in
+BAR_CHARTS = {
+    "Race Winner Counts": ("Formula 1 – {season} Season – Race Winner Counts", "Number of Race Wins", "Drivers"),
+    "Driver Podium Counts": ("Formula 1 – {season} Season – Podium Finish Counts", "Number of Podium Finishes", "Drivers"),
+    "Top 10 Finish Counts": ("Formula 1 – {season} Season – Top 10 Finish Counts", "Top 10 Finishes", "Drivers"),
+    "Fastest Lap Counts": ("Formula 1 – {season} Season – Fastest Lap Counts", "Fastest Laps", "Drivers"),
+    "DNFs by Drivers": ("Formula 1 – {season} Season – DNFs by Drivers", "DNFs", None),
+    "Team Podium Counts": ("Podium Finish Counts (Teams)", "Podium Finishes", "Teams"),
+    "DNFs by Team": ("DNFs by Team", "Number of DNFs", "Teams"),
+    "DNFs per Track": ("Formula 1 – {season} Season – DNFs by Track", "DNFs", None),
+}
+
+
+def _spec(title, height, **body):
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": title,
+        "height": height,
+        "config": CONFIG,
+        **body,
+    }
+
+
+# ----------------------------------
+# BAR CHARTS
+# ----------------------------------
+def _bar_chart(counts, rows, season, analysis_type, color=None):
+    title, x_title, y_title = BAR_CHARTS[analysis_type]
+
+    frame = pd.DataFrame({
+        "Label": rows["Label"].to_numpy(),
+        "Value": counts.to_numpy(),
+        "Color": rows["Color"].to_numpy(),
+    })
+
+    # barh draws the first value at the bottom; Vega-Lite lists top-down
+    order = list(frame["Label"][::-1])
+
+    encoding = {
+        "y": {"field": "Label", "type": "nominal", "sort": order, "title": y_title},
+        "x": {"field": "Value", "type": "quantitative", "title": x_title, "axis": {"tickMinStep": 1}},
+    }
+
+    spec = _spec(
+        title.format(season=season),
+        max(180, 24 * len(frame)),
+        encoding=encoding,
+        layer=[
+            {
+                "mark": {"type": "bar"},
+                "encoding": {
+                    "color": color or {"field": "Color", "type": "nominal", "scale": None, "legend": None},
+                },
+            },
+            {
+                "mark": {"type": "text", "align": "right", "dx": -4, "color": "white", "fontSize": 13},
+                "encoding": {"text": {"field": "Value", "type": "quantitative"}},
+            },
+        ],
+    )
+    return frame, spec
+
+
+# ----------------------------------
+# LINE CHARTS (HIGHLIGHT / FADE AS PARAMS)
+# ----------------------------------
+def _long_frame(data, rows, value):
+    frame = data.set_axis(rows["Label"].to_numpy()).rename_axis("Label").reset_index()
+    frame = frame.melt(id_vars="Label", var_name="Track", value_name=value)
+    frame["Track"] = frame["Track"].astype(str)
+    return frame
+
+
+def _highlight_params(rows, highlight, opacity, fade_label):
+    labels = rows.loc[rows.iloc[:, 0].astype(str) == highlight, "Label"]
+    return [
+        {
+            "name": "highlight",
+            "select": {"type": "point", "fields": ["Label"]},
+            "bind": "legend",
+            **({"value": [{"Label": labels.iloc[0]}]} if len(labels) else {}),
+        },
+        {
+            "name": "fade",
+            "value": opacity,
+            "bind": {"input": "range", "min": 0.1, "max": 1.0, "step": 0.1, "name": fade_label},
+        },
+    ]
+
+
+def _line_encoding(rows, tracks, value, y_title, y_scale=None):
+    return {
+        "x": {"field": "Track", "type": "ordinal", "sort": tracks, "title": None, "axis": {"labelAngle": -55}},
+        "y": {"field": value, "type": "quantitative", "title": y_title, **({"scale": y_scale} if y_scale else {})},
+        "color": {
+            "field": "Label",
+            "type": "nominal",
+            "sort": list(rows["Label"]),
+            "scale": {"domain": list(rows["Label"]), "range": list(rows["Color"])},
+            "legend": {"title": None, "orient": "bottom", "columns": 5},
+        },
+        "opacity": {"condition": {"param": "highlight", "value": 1.0}, "value": {"expr": "fade"}},
+        "strokeWidth": {"condition": {"param": "highlight", "value": 3, "empty": False}, "value": 1.5},
+    }
+
+
+def _progression_chart(data, rows, title, highlight, opacity, fade_label):
+    tracks = [str(track) for track in data.columns]
+    frame = _long_frame(data, rows, "Points")
+
+    spec = _spec(
+        title,
+        420,
+        params=_highlight_params(rows, highlight, opacity, fade_label),
+        mark={"type": "line"},
+        encoding=_line_encoding(rows, tracks, "Points", "Championship Points"),
+    )
+    return frame, spec
+
+
+def _finish_positions_chart(data, rows, season, highlight, opacity):
+    tracks = [str(track) for track in data.columns]
+    frame = _long_frame(data, rows, "Position")
+
+    # title contenders are drawn dashed, like the matplotlib chart
+    frame["Dashed"] = frame["Label"].isin(rows.loc[rows["Abbreviation"].isin(["PIA", "VER", "NOR"]), "Label"])
+
+    encoding = _line_encoding(rows, tracks, "Position", "Finish Position", y_scale={"domain": [20, 1]})
+    encoding["strokeDash"] = {
+        "field": "Dashed",
+        "type": "nominal",
+        "scale": {"domain": [False, True], "range": [[1, 0], [6, 4]]},
+        "legend": None,
+    }
+
+    spec = _spec(
+        f"Formula 1 – {season} Season – Race Finish Positions (Top 10 Drivers)",
+        460,
+        params=_highlight_params(rows, highlight, opacity, "Fade other drivers "),
+        mark={"type": "line", "point": True},
+        encoding=encoding,
+    )
+    return frame, spec
+
+
+def _finish_heatmap_chart(data, rows, season):
+    tracks = [str(track) for track in data.columns]
+    frame = _long_frame(data, rows, "Position")
+    axes = {
+        "x": {"field": "Track", "type": "ordinal", "sort": tracks, "title": "Tracks (grey: DNF / DSQ / NC / DNS or did not race)", "axis": {"labelAngle": -55}},
+        "y": {"field": "Label", "type": "ordinal", "sort": list(rows["Label"]), "title": None},
+    }
+
+    spec = _spec(
+        f"Formula 1 – {season} Season – Race Finish Positions (All Drivers)",
+        max(240, 18 * len(rows)),
+        encoding=axes,
+        layer=[
+            # every cell grey underneath; cells without a position are
+            # dropped from the coloured layer and stay grey
+            {"mark": {"type": "rect", "color": "#3a3a48"}},
+            {
+                "mark": {"type": "rect"},
+                "encoding": {
+                    "color": {
+                        "field": "Position", "type": "quantitative",
+                        "scale": {"scheme": "viridis", "reverse": True, "domainMin": 1},
+                        "legend": {"title": "Finish Position", "direction": "vertical"},
+                    },
+                    "tooltip": [{"field": "Label", "title": "Driver"}, {"field": "Track"}, {"field": "Position"}],
+                },
+            },
+        ],
+    )
+    return frame, spec
+
+
+def _positions_gained_chart(data, dimensions, season, selection):
+    selection = list(selection or [])
+    counts = (data[data.index.isin(selection)] if selection else data).sum()
+    frame = pd.DataFrame({"Gained": counts.index.to_numpy(), "Races": counts.to_numpy()})
+    races = int(frame["Races"].sum())
+    average = (frame["Gained"] * frame["Races"]).sum() / races if races else 0.0
+
+    if len(selection) == 1:
+        color = {"value": lookup(dimensions.drivers, selection)["Color"].iloc[0]}
+        who = selection[0]
+    else:
+        frame["Sign"] = pd.cut(frame["Gained"], [-float("inf"), -0.5, 0.5, float("inf")], labels=["Lost", "Held", "Gained"]).astype(str)
+        color = {
+            "field": "Sign", "type": "nominal",
+            "scale": {"domain": ["Lost", "Held", "Gained"], "range": ["#e74c3c", "#95a5a6", "#2ecc71"]},
+            "legend": None,
+        }
+        who = f"{len(selection)} Drivers" if selection else "All Drivers"
+
+    spec = _spec(
+        f"Formula 1 – {season} Season – Positions Gained, Grid to Flag ({who}, {races} Classified Starts, Average {average:+.2f})",
+        380,
+        layer=[
+            {
+                "mark": {"type": "bar"},
+                "encoding": {
+                    "x": {"field": "Gained", "type": "ordinal", "sort": "ascending", "title": "Positions Gained (negative = lost)", "axis": {"labelAngle": 0}},
+                    "y": {"field": "Races", "type": "quantitative", "title": "Races"},
+                    "color": color,
+                    "tooltip": [{"field": "Gained"}, {"field": "Races"}],
+                },
+            },
+        ],
+    )
+    return frame, spec
+
+
+# ----------------------------------
+# CURRENT FORM
+# ----------------------------------
+def _form_chart(form, rows, season, y_title):
+    frame = pd.DataFrame({
+        "Label": rows["Label"].to_numpy(),
+        "Avg Points": form["Avg Points"].round(2).to_numpy(),
+        "Note": [form_label(f, d) for f, d in zip(form["Avg Finish"], form["DNF Rate"])],
+        "Color": rows["Color"].to_numpy(),
+    })
+
+    window, first, last = form.attrs["window"], form.attrs["first"], form.attrs["last"]
+    spec = _spec(
+        f"Formula 1 – {season} Season – Current Form (Last {window} Rounds: {first} – {last})",
+        max(180, 24 * len(frame)),
+        encoding={
+            "y": {"field": "Label", "type": "nominal", "sort": None, "title": y_title},
+            "x": {"field": "Avg Points", "type": "quantitative", "title": "Average Points per Round"},
+        },
+        layer=[
+            {
+                "mark": {"type": "bar"},
+                "encoding": {
+                    "color": {"field": "Color", "type": "nominal", "scale": None, "legend": None},
+                    "tooltip": [{"field": "Label"}, {"field": "Avg Points"}, {"field": "Note"}],
+                },
+            },
+            {
+                "mark": {"type": "text", "align": "left", "dx": 4, "color": "white", "fontSize": 11},
+                "encoding": {"text": {"field": "Note"}},
+            },
+        ],
+    )
+    return frame, spec
+
+
+# ----------------------------------
+# TIME-BASED CHARTS
+# ----------------------------------
+def _gap_to_winner_chart(data, rows, season):
+    frame = data.assign(Label=rows["Label"].to_numpy(), Color=rows["Color"].to_numpy()).reset_index(drop=True)
+    y = {"field": "Label", "type": "nominal", "sort": list(frame["Label"]), "title": "Drivers"}
+    color = {"field": "Color", "type": "nominal", "scale": None, "legend": None}
+
+    spec = _spec(
+        f"Formula 1 – {season} Season – Gap to Winner (Top 10 Drivers, Lead-Lap Finishes)",
+        max(180, 32 * len(frame)),
+        encoding={"y": y},
+        layer=[
+            {
+                "mark": {"type": "rule", "color": "white"},
+                "encoding": {"x": {"field": "Min", "type": "quantitative", "title": "Gap to Winner (s)"}, "x2": {"field": "Max"}},
+            },
+            {
+                "mark": {"type": "bar", "size": 18, "stroke": "white", "opacity": 0.85},
+                "encoding": {"x": {"field": "Q1", "type": "quantitative"}, "x2": {"field": "Q3"}, "color": color},
+            },
+            {
+                "mark": {"type": "tick", "color": "white", "size": 18, "thickness": 2},
+                "encoding": {
+                    "x": {"field": "Median", "type": "quantitative"},
+                    "tooltip": [{"field": c, "type": "quantitative", "format": ".3f"} for c in ("Min", "Q1", "Median", "Q3", "Max")]
+                    + [{"field": "Finishes", "type": "quantitative"}],
+                },
+            },
+        ],
+    )
+    return frame, spec
+
+
+def _margin_of_victory_chart(data, dimensions, season):
+    rows = lookup(dimensions.drivers, data["Winner"].astype(str))
+    frame = pd.DataFrame({
+        "Track": [str(track) for track in data.index],
+        "Margin": data["Margin (s)"].to_numpy(),
+        "Winner": rows["Label"].to_numpy(),
+        "Color": rows["Color"].to_numpy(),
+    })
+
+    spec = _spec(
+        f"Formula 1 – {season} Season – Margin of Victory (Winner to P2, Average {frame['Margin'].mean():.2f}s)",
+        380,
+        layer=[
+            {
+                "mark": {"type": "bar"},
+                "encoding": {
+                    "x": {"field": "Track", "type": "ordinal", "sort": list(frame["Track"]), "title": "Grand Prix", "axis": {"labelAngle": -55}},
+                    "y": {"field": "Margin", "type": "quantitative", "title": "Margin (s)"},
+                    "color": {"field": "Color", "type": "nominal", "scale": None, "legend": None},
+                    "tooltip": [{"field": "Track"}, {"field": "Winner"}, {"field": "Margin", "format": ".3f"}],
+                },
+            },
+            {
+                "mark": {"type": "rule", "color": "white", "strokeDash": [6, 4]},
+                "encoding": {"y": {"aggregate": "mean", "field": "Margin", "type": "quantitative"}},
+            },
+        ],
+    )
+    return frame, spec
+
+
+def _fastest_lap_chart(data, dimensions, season):
+    frame = pd.DataFrame({
+        "Track": [str(track) for track in data.index],
+        "Seconds": data["Fastest Lap (s)"].to_numpy(),
+        "Lap": (lap_clock(data["Fastest Lap (s)"]) + "  " + lookup(dimensions.drivers, data["Driver"].astype(str))["Abbreviation"].to_numpy(dtype=str)).to_numpy(),
+        "Color": lookup(dimensions.teams, data["Team"].astype(str))["Color"].to_numpy(),
+    })
+    # no lap times (older seasons): an empty chart rather than a NaN domain
+    low = float(frame["Seconds"].min()) - 10 if len(frame) else 0
+
+    spec = _spec(
+        f"Formula 1 – {season} Season – Fastest Race Lap per Track",
+        max(180, 24 * len(frame)),
+        encoding={
+            "y": {"field": "Track", "type": "nominal", "sort": list(frame["Track"]), "title": None},
+            "x": {"field": "Seconds", "type": "quantitative", "title": "Lap Time (s)", "scale": {"domainMin": low, "zero": False}},
+        },
+        layer=[
+            {"mark": {"type": "bar", "clip": True}, "encoding": {"color": {"field": "Color", "type": "nominal", "scale": None, "legend": None}}},
+            {"mark": {"type": "text", "align": "left", "dx": 4, "color": "white", "fontSize": 11}, "encoding": {"text": {"field": "Lap"}}},
+        ],
+    )
+    return frame, spec
+
+
+def _lap_pace_chart(data, dimensions):
+    rows = lookup(dimensions.teams, data.index)
+    frame = pd.DataFrame({
+        "Label": rows["Label"].to_numpy(),
+        "Value": data.to_numpy(),
+        "Color": rows["Color"].to_numpy(),
+    })
+
+    spec = _spec(
+        "Fastest Lap Pace (Teams) – Median Gap to the Quickest Lap of Each Round",
+        max(180, 24 * len(frame)),
+        encoding={
+            "y": {"field": "Label", "type": "nominal", "sort": list(frame["Label"][::-1]), "title": "Teams"},
+            "x": {"field": "Value", "type": "quantitative", "title": "Slower than the Round's Fastest Lap (%)"},
+        },
+        layer=[
+            {"mark": {"type": "bar"}, "encoding": {"color": {"field": "Color", "type": "nominal", "scale": None, "legend": None}}},
+            {
+                "mark": {"type": "text", "align": "left", "dx": 4, "color": "white", "fontSize": 12},
+                "encoding": {"text": {"field": "Value", "type": "quantitative", "format": "+.2f"}},
+            },
+        ],
+    )
+    return frame, spec
+
+
+# ----------------------------------
+# ENTRY POINTS (SAME ARGUMENTS AS charts.plot_*_chart)
+# ----------------------------------
+def driver_chart_spec(data, dimensions, season, analysis_type, highlight_driver, opacity):
+    if analysis_type == "Margin of Victory":
+        return _margin_of_victory_chart(data, dimensions, season)
+    if analysis_type == "Positions Gained":
+        return _positions_gained_chart(data, dimensions, season, highlight_driver)
+
+    rows = lookup(dimensions.drivers, data.index)
+
+    if analysis_type == "Current Form":
+        return _form_chart(data, rows, season, "Drivers")
+    if analysis_type == "Points Progression":
+        return _progression_chart(
+            data, rows,
+            f"Formula 1 – {season} Season – Points Progression (Top 10 Drivers)",
+            highlight_driver, opacity, "Fade other drivers ",
+        )
+    if analysis_type == "Finish Positions (Top 10)":
+        return _finish_positions_chart(data, rows, season, highlight_driver, opacity)
+    if analysis_type == "Finish Position Heatmap":
+        return _finish_heatmap_chart(data, rows, season)
+    if analysis_type == "Gap to Winner":
+        return _gap_to_winner_chart(data, rows, season)
+    return _bar_chart(data, rows, season, analysis_type)
+
+
+def team_chart_spec(data, dimensions, season, analysis_type, highlight_team, opacity):
+    if analysis_type == "Fastest Lap per Track":
+        return _fastest_lap_chart(data, dimensions, season)
+    if analysis_type == "Fastest Lap Pace":
+        return _lap_pace_chart(data, dimensions)
+    if analysis_type == "Current Form":
+        return _form_chart(data, lookup(dimensions.teams, data.index), season, "Teams")
+    if analysis_type == "Points Progression":
+        rows = lookup(dimensions.teams, data.index)
+        return _progression_chart(
+            data, rows, "Team Points Progression (Race + Sprint)",
+            highlight_team, opacity, "Fade other teams ",
+        )
+    if analysis_type == "DNFs per Track":
+        rows = lookup(dimensions.tracks, data.index)
+        reds = {"field": "Value", "type": "quantitative", "scale": {"scheme": "reds"}, "legend": None}
+        return _bar_chart(data, rows.assign(Color=""), season, analysis_type, color=reds)
+    rows = lookup(dimensions.teams, data.index)
+    return _bar_chart(data, rows, season, analysis_type)